@@ -1,15 +1,33 @@
+# first import, so the startup report covers every import below
+from data.startup_timer import startup_timer
+
+import importlib
+import threading
 import tkinter as tk
-import queue
 from pathlib import Path
 
-from pages.welcome_page import WelcomePage
-from pages.main_page import MainPage
-from pages.graph_page import GraphPage
-
 from data.price_service import PriceService
-from queues.price_queue import price_queue
+from data.orderbook_service import OrderBookService
+from data.data_store import market_data
+from data.endpoints import endpoints
+from data.rest_client import rest_client
+from data.taker_volume import taker_volume
+from data.ticker_service import TickerService
+from data.traffic_log import ReplayDriver, traffic_recorder
+from queues.market_bus import market_bus, LATEST
 
 from data.settings_store import SettingsStore
+from ui.frame_scheduler import FrameScheduler
+
+# pages are built on first show; GraphPage pulls in matplotlib, so
+# its module is only imported then (or pre-warmed off-thread after first paint)
+PAGE_MODULES = {
+    "WelcomePage": "pages.welcome_page",
+    "MainPage": "pages.main_page",
+    "GraphPage": "pages.graph_page",
+}
+
+startup_timer.mark("imports")
 
 
 class App(tk.Tk):
@@ -24,77 +42,151 @@ class App(tk.Tk):
         self.root_dir = Path(__file__).resolve().parent
         self.settings_store = SettingsStore(self.root_dir)
         self.app_config = self.settings_store.load()  # <-- ใช้ชื่อนี้แทน config()
+        endpoints.configure(**self.app_config.get("endpoints", {}))
 
         # graceful shutdown
         self._closing = False
-        self._poll_price_id = None
         self.protocol("WM_DELETE_WINDOW", self.on_close)
 
-        self.container = tk.Frame(self, bg="#0d0f1a")
-        self.container.pack(fill="both", expand=True)
-
-        self.pages = {}
-        for Page in (WelcomePage, MainPage, GraphPage):
-            page = Page(self.container, self)
-            self.pages[Page.__name__] = page
-            page.place(relwidth=1, relheight=1)
-
-        self.show_page("WelcomePage")
-
         watchlist = self.app_config.get(
             "watchlist",
             ["BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT", "XRPUSDT"],
         )
         symbols_lower = [s.lower() for s in watchlist]
 
-        self.price_service = PriceService(symbols_lower)
+        # one 24h ticker request for the whole watchlist, shared by all pages
+        self.ticker_service = TickerService(watchlist)
+
+        # depth streams are acquired only while a panel shows them
+        self.orderbook_service = OrderBookService()
+
+        # single render loop: pages register periodic jobs and dirty redraws here
+        self.scheduler = FrameScheduler(self, frame_ms=50)
+        self.scheduler.every(0, self._pump_bus)
+        self.scheduler.every(1000, self.orderbook_service.sweep)
+
+        startup_timer.mark("settings + services")
+
+        self.container = tk.Frame(self, bg="#0d0f1a")
+        self.container.pack(fill="both", expand=True)
+
+        self.pages = {}
+        self.show_page("WelcomePage")
+
+        # only the newest price / ticker per symbol matters to the UI
+        self._price_sub = market_bus.subscribe("price", callback=self._on_price, policy=LATEST)
+        self._ticker_sub = market_bus.subscribe("ticker", callback=self._on_ticker, policy=LATEST)
+        # trades lost in a stream gap are refilled from klines
+        self._gap_sub = market_bus.subscribe("trade_gap", callback=taker_volume.on_gap)
+
+        # "record": append raw frames / kline replies to a traffic log;
+        # "replay": run on such a log instead of the live trade streams
+        if self.app_config.get("record"):
+            traffic_recorder.start(self.root_dir / self.app_config["record"])
+        if self.app_config.get("replay"):
+            self.price_service = ReplayDriver(
+                self.root_dir / self.app_config["replay"], speed=self.app_config.get("replay_speed", 1.0)
+            )
+        else:
+            self.price_service = PriceService(symbols_lower, engine=self.app_config.get("ingest", "threads"))
         self.price_service.start()
+        self.ticker_service.start()
+
+        self.scheduler.start()
+        startup_timer.mark("streams started")
 
-        self._poll_price_id = self.after(100, self._poll_price_queue)
+        self.after_idle(self._on_first_paint)
+
+    def _on_first_paint(self):
+        startup_timer.mark("first paint")
+        if self.app_config.get("startup_report"):
+            print(startup_timer.report())
+
+        # warm up what the next screens need without blocking the welcome screen
+        threading.Thread(target=self._prewarm_imports, daemon=True).start()
+        self.after(100, lambda: self.get_page("MainPage"))
+
+    def _prewarm_imports(self):
+        try:
+            importlib.import_module(PAGE_MODULES["GraphPage"])
+        except Exception as e:
+            print("Prewarm import error:", e)
+
+    def get_page(self, name, **kwargs):
+        page = self.pages.get(name)
+        if page is None:
+            with startup_timer.timed(f"build {name}"):
+                module = importlib.import_module(PAGE_MODULES[name])
+                page = getattr(module, name)(self.container, self, **kwargs)
+                page.place(relwidth=1, relheight=1)
+                self.pages[name] = page
+            if self.app_config.get("startup_report"):
+                print(f"{name} built in {startup_timer.marks[-1][1] * 1000:.0f} ms")
+        return page
 
     def show_page(self, name):
-        self.pages[name].tkraise()
+        prev = self.scheduler.active_page
+        if prev and prev != name and hasattr(self.pages.get(prev), "on_hide"):
+            self.pages[prev].on_hide()
+
+        page = self.get_page(name)
+        self.scheduler.set_active_page(name)
+        page.tkraise()
+
+        if prev != name and hasattr(page, "on_show"):
+            page.on_show()
 
-    def _poll_price_queue(self):
-        if self._closing or not self.winfo_exists():
+    def _pump_bus(self):
+        if self._closing:
             return
 
+        self.price_service.poll()
+        market_bus.dispatch()
+        rest_client.run_callbacks()
+
+    def _on_price(self, sym, price):
+        # keep the shared last price even while MainPage is not built yet
+        market_data.prices[sym] = price
+
         main_page = self.pages.get("MainPage")
         graph_page = self.pages.get("GraphPage")
 
-        try:
-            while True:
-                sym, price = price_queue.get_nowait()
-                sym = sym.upper()
+        if main_page and hasattr(main_page, "update_price"):
+            main_page.update_price(sym, price)
 
-                if main_page and hasattr(main_page, "update_price"):
-                    main_page.update_price(sym, price)
+        # อัปเดตราคาที่ header ใน GraphPage (ถ้าอยู่หน้า Graph)
+        if graph_page and hasattr(graph_page, "on_price"):
+            graph_page.on_price(sym, price)
 
-                # อัปเดตราคาที่ header ใน GraphPage (ถ้าอยู่หน้า Graph)
-                if graph_page and hasattr(graph_page, "on_price"):
-                    graph_page.on_price(sym, price)
-
-        except queue.Empty:
-            pass
-
-        self._poll_price_id = self.after(100, self._poll_price_queue)
+    def _on_ticker(self, sym, ticker):
+        for page in self.pages.values():
+            if hasattr(page, "on_ticker"):
+                page.on_ticker(sym, ticker)
 
     def on_close(self):
         self._closing = True
 
-        if self._poll_price_id:
-            try:
-                self.after_cancel(self._poll_price_id)
-            except Exception:
-                pass
-            self._poll_price_id = None
+        self.scheduler.stop()
+
+        self._price_sub.close()
+        self._ticker_sub.close()
+        self._gap_sub.close()
 
         # stop sockets/services
-        if getattr(self, "price_service", None) and hasattr(self.price_service, "stop"):
-            try:
-                self.price_service.stop()
-            except Exception:
-                pass
+        services = ("price_service", "ticker_service", "orderbook_service")
+        for service in (getattr(self, name, None) for name in services):
+            if service is not None and hasattr(service, "stop"):
+                try:
+                    service.stop()
+                except Exception:
+                    pass
+
+        traffic_recorder.stop()
+
+        try:
+            rest_client.close()
+        except Exception:
+            pass
 
         # allow pages to cleanup
         for p in self.pages.values():
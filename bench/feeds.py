@@ -0,0 +1,65 @@
+import json
+import random
+
+import numpy as np
+
+from data.kline_cache import COL, COLUMNS
+
+SYMBOLS = ("BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT", "XRPUSDT")
+BASE_PRICES = (65_000.0, 3_200.0, 150.0, 580.0, 0.55)
+
+
+def trade_events(n, symbols=SYMBOLS, t0_ms=1_700_000_000_000, seed=1):
+    """n Binance trade payloads (dicts), round-robin over symbols, random-walk prices."""
+    rng = random.Random(seed)
+    prices = {s: BASE_PRICES[i % len(BASE_PRICES)] for i, s in enumerate(symbols)}
+    out = []
+    for i in range(n):
+        sym = symbols[i % len(symbols)]
+        prices[sym] *= 1 + rng.gauss(0, 1e-4)
+        out.append({
+            "e": "trade", "E": t0_ms + i, "s": sym, "t": i,
+            "p": f"{prices[sym]:.4f}", "q": f"{rng.expovariate(1.0):.6f}",
+            "T": t0_ms + i, "m": rng.random() < 0.5, "M": True,
+        })
+    return out
+
+
+def combined_frames(n, symbols=SYMBOLS, seed=1):
+    """Raw combined-stream frames, as BinanceCombinedSocket receives them."""
+    return [
+        json.dumps({"stream": f"{e['s'].lower()}@trade", "data": e}, separators=(",", ":"))
+        for e in trade_events(n, symbols, seed=seed)
+    ]
+
+
+def books(n, rows=10, mid=65_000.0, seed=1):
+    """n top-of-book snapshots [(price, qty)] x 2, bids descending / asks ascending."""
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        mid *= 1 + rng.gauss(0, 1e-4)
+        bids = [(round(mid - 0.5 * (i + 1), 2), rng.expovariate(1.0)) for i in range(rows)]
+        asks = [(round(mid + 0.5 * (i + 1), 2), rng.expovariate(1.0)) for i in range(rows)]
+        out.append((bids, asks))
+    return out
+
+
+def klines_1m(n, t_end_ms=1_700_000_000_000, price=65_000.0, seed=1):
+    """(len(COLUMNS), n) float64 1m klines ending at t_end_ms, random-walk closes."""
+    rng = np.random.default_rng(seed)
+    t = t_end_ms - t_end_ms % 60_000 - np.arange(n)[::-1] * 60_000
+    c = price * np.exp(np.cumsum(rng.normal(0, 5e-4, n)))
+    o = np.r_[c[0], c[:-1]]
+    spread = np.abs(rng.normal(0, 3e-4, n)) * c
+
+    k = np.empty((len(COLUMNS), n))
+    k[COL["open_time"]] = t
+    k[COL["open"]] = o
+    k[COL["high"]] = np.maximum(o, c) + spread
+    k[COL["low"]] = np.minimum(o, c) - spread
+    k[COL["close"]] = c
+    k[COL["volume"]] = rng.gamma(2.0, 5.0, n)
+    k[COL["quote_volume"]] = k[COL["volume"]] * c
+    k[COL["taker_buy_quote"]] = k[COL["quote_volume"]] * rng.uniform(0.3, 0.7, n)
+    return k
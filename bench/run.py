@@ -0,0 +1,140 @@
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from bench.suite import BENCHES, LATENCY_METRICS, Skip
+
+ROOT = Path(__file__).resolve().parents[1]
+RESULTS_DIR = ROOT / "bench" / "results"
+
+FULL_N = 20_000
+QUICK_N = 2_000
+
+
+def summarize(samples, latency=False):
+    """Per-op seconds -> stats in microseconds."""
+    a = np.asarray(samples, dtype=np.float64) * 1e6
+    mean = float(a.mean())
+    return {
+        "n": int(a.size),
+        "mean_us": round(mean, 3),
+        "p50_us": round(float(np.percentile(a, 50)), 3),
+        "p90_us": round(float(np.percentile(a, 90)), 3),
+        "p99_us": round(float(np.percentile(a, 99)), 3),
+        "max_us": round(float(a.max()), 3),
+        "ops_s": round(1e6 / mean, 1) if mean > 0 and not latency else None,
+    }
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT, capture_output=True, text=True, timeout=5,
+        )
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def _meta(n):
+    import matplotlib
+
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "numpy": np.__version__,
+        "matplotlib": matplotlib.__version__,
+        "n": n,
+    }
+
+
+def run(names, n):
+    results, skipped = {}, {}
+    for name in names:
+        fn, _needs_tk = BENCHES[name]
+        print(f"{name} ...", flush=True)
+        try:
+            out = fn(n)
+        except Skip as e:
+            skipped[name] = str(e)
+            print(f"  skipped: {e}")
+            continue
+        for metric, samples in out.items():
+            if samples:
+                results[metric] = summarize(samples, latency=metric in LATENCY_METRICS)
+    return results, skipped
+
+
+def print_table(results):
+    print(f"\n{'metric':<26}{'n':>8}{'p50 us':>12}{'p90 us':>12}{'p99 us':>12}{'max us':>12}{'ops/s':>14}")
+    for metric, s in results.items():
+        ops = f"{s['ops_s']:,.0f}" if s["ops_s"] else "-"
+        print(f"{metric:<26}{s['n']:>8}{s['p50_us']:>12,.2f}{s['p90_us']:>12,.2f}"
+              f"{s['p99_us']:>12,.2f}{s['max_us']:>12,.2f}{ops:>14}")
+
+
+def compare(baseline, results, threshold):
+    """Print p50 deltas against a baseline report; returns the metrics slower by more than threshold."""
+    base = baseline.get("results", {})
+    regressions = []
+    print(f"\nvs {baseline.get('meta', {}).get('commit') or 'baseline'} (p50, +{threshold:.0%} flags a regression)")
+    for metric, s in results.items():
+        old = base.get(metric)
+        if not old or not old.get("p50_us"):
+            print(f"  {metric:<26}{'new':>12}")
+            continue
+        delta = s["p50_us"] / old["p50_us"] - 1.0
+        flag = ""
+        if delta > threshold:
+            flag = "  REGRESSION"
+            regressions.append(metric)
+        print(f"  {metric:<26}{old['p50_us']:>12,.2f} -> {s['p50_us']:>10,.2f} us {delta:>+8.1%}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Latency / throughput benchmarks on synthetic feeds.")
+    parser.add_argument("--only", default="", help=f"comma-separated subset of: {','.join(BENCHES)}")
+    parser.add_argument("--quick", action="store_true", help=f"{QUICK_N} messages per bench instead of {FULL_N}")
+    parser.add_argument("--headless", action="store_true", help="skip the benches that need a display")
+    parser.add_argument("--out", help="report path (default bench/results/bench-<time>.json)")
+    parser.add_argument("--compare", metavar="BASELINE", help="earlier report to diff against")
+    parser.add_argument("--threshold", type=float, default=0.15, help="p50 slowdown that fails --compare")
+    args = parser.parse_args(argv)
+
+    names = [s.strip() for s in args.only.split(",") if s.strip()] or list(BENCHES)
+    unknown = [s for s in names if s not in BENCHES]
+    if unknown:
+        parser.error(f"unknown bench: {', '.join(unknown)}")
+    if args.headless:
+        names = [s for s in names if not BENCHES[s][1]]
+
+    n = QUICK_N if args.quick else FULL_N
+    results, skipped = run(names, n)
+    print_table(results)
+
+    report = {"meta": _meta(n), "results": results, "skipped": skipped}
+    out = Path(args.out) if args.out else RESULTS_DIR / f"bench-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nreport: {out}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        if compare(baseline, results, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,303 @@
+import threading
+import time
+
+from bench import feeds
+
+perf = time.perf_counter
+
+
+class Skip(Exception):
+    """Raised by a bench that cannot run here (no display, missing package)."""
+
+
+# end-to-end latencies rather than per-op costs: no ops/s in the report
+LATENCY_METRICS = {"bus_transit"}
+
+
+def _per_op(dt, n):
+    return [dt / n] * n if n else []
+
+
+# ---- ingestion: socket frame -> market_bus ----
+
+def _market_subs():
+    # the subscribers App and GraphPage keep, so publish() does the real work
+    from queues.market_bus import market_bus, BATCH, LATEST
+
+    return [
+        market_bus.subscribe("price", callback=lambda s, p: None, policy=LATEST),
+        market_bus.subscribe("trade", callback=lambda items: None, policy=BATCH, maxlen=50_000),
+    ]
+
+
+def bench_ws_decode(n):
+    """BinanceCombinedSocket._on_message: json.loads + route_frame + handle_trade, per frame."""
+    from data.socket_client import BinanceCombinedSocket, handle_trade
+    from queues.market_bus import market_bus
+
+    sock = BinanceCombinedSocket([], handlers={"trade": handle_trade})
+    frames = feeds.combined_frames(n)
+    subs = _market_subs()
+    samples = []
+    try:
+        for i, raw in enumerate(frames):
+            t0 = perf()
+            sock._on_message(None, raw)
+            samples.append(perf() - t0)
+            if i % 256 == 255:
+                market_bus.dispatch()
+        market_bus.dispatch()
+    finally:
+        for sub in subs:
+            sub.close()
+    return {"ws_decode": samples}
+
+
+def bench_ws_decode_batch(n, batch=256):
+    """AsyncIngestEngine._drain: one json.loads per batch of frames, cost per frame."""
+    from data.async_ingest import AsyncIngestEngine
+    from data.socket_client import handle_trade
+    from queues.market_bus import market_bus
+
+    engine = AsyncIngestEngine({"trade": handle_trade}, batch_ms=0)
+    frames = feeds.combined_frames(n)
+    subs = _market_subs()
+    samples = []
+    try:
+        for i in range(0, len(frames), batch):
+            chunk = frames[i:i + batch]
+            engine._frames.extend(chunk)
+            t0 = perf()
+            engine._drain()
+            samples.extend(_per_op(perf() - t0, len(chunk)))
+            market_bus.dispatch()
+    finally:
+        for sub in subs:
+            sub.close()
+    return {"ws_decode_batch": samples}
+
+
+# ---- market_bus: publish, dispatch, thread -> Tk transit ----
+
+def bench_bus(n, batch=256):
+    """publish() and dispatch() cost per message, EVERY policy."""
+    from queues.market_bus import market_bus, EVERY
+
+    sub = market_bus.subscribe("bench", callback=lambda s, p: None, policy=EVERY, maxlen=batch)
+    publish, dispatch = [], []
+    try:
+        for i in range(0, n, batch):
+            m = min(batch, n - i)
+            t0 = perf()
+            for j in range(m):
+                market_bus.publish("bench", "BTCUSDT", j)
+            t1 = perf()
+            market_bus.dispatch()
+            t2 = perf()
+            publish.extend(_per_op(t1 - t0, m))
+            dispatch.extend(_per_op(t2 - t1, m))
+    finally:
+        sub.close()
+    return {"bus_publish": publish, "bus_dispatch": dispatch}
+
+
+def bench_bus_transit(n, rate=5_000, frame_ms=50):
+    """Socket-thread publish() to Tk-thread callback, with dispatch() once per frame like App."""
+    from queues.market_bus import market_bus, EVERY
+
+    latencies = []
+    sub = market_bus.subscribe(
+        "bench", callback=lambda s, sent: latencies.append(perf() - sent), policy=EVERY, maxlen=n,
+    )
+
+    def produce():
+        start = perf()
+        for i in range(n):
+            # paced in 1 ms slices so the stream looks like a socket, not a burst
+            due = start + i / rate
+            delay = due - perf()
+            if delay > 0.001:
+                time.sleep(delay)
+            market_bus.publish("bench", "BTCUSDT", perf())
+
+    producer = threading.Thread(target=produce, daemon=True, name="bench-producer")
+    try:
+        producer.start()
+        while producer.is_alive():
+            time.sleep(frame_ms / 1000.0)
+            market_bus.dispatch()
+        market_bus.dispatch()
+    finally:
+        sub.close()
+    return {"bus_transit": latencies}
+
+
+# ---- chart data path (no display needed) ----
+
+def bench_chart_data(n, bars=100_000):
+    """resample_klines, IndicatorSet.reset and candle_geometry on `bars` 1m bars."""
+    from data.indicators import SMA, EMA, Bollinger, RSI, MACD, IndicatorSet
+    from data.resample import resample_klines
+    from ui.candlestick_chart import candle_geometry
+    from data.kline_cache import COL
+
+    base = feeds.klines_1m(bars)
+    reps = max(3, n // 2_000)
+    out = {"chart_resample_1h": [], "chart_indicators_reset": [], "chart_geometry_120": []}
+
+    for _ in range(reps):
+        t0 = perf()
+        resample_klines(base, "1h")
+        out["chart_resample_1h"].append(perf() - t0)
+
+    inds = IndicatorSet()
+    for ind in (SMA(20), EMA(50), Bollinger(20, 2.0), RSI(14), MACD()):
+        inds.add(ind)
+    for _ in range(reps):
+        t0 = perf()
+        inds.reset(base, bars)
+        out["chart_indicators_reset"].append(perf() - t0)
+
+    view = slice(-120, None)
+    o, h, l, c = (base[COL[name], view] for name in ("open", "high", "low", "close"))
+    for _ in range(reps * 20):
+        t0 = perf()
+        candle_geometry(o, h, l, c, x0=bars - 120)
+        out["chart_geometry_120"].append(perf() - t0)
+    return out
+
+
+# ---- Tk: label updates and paints ----
+
+def _tk_root():
+    import tkinter as tk
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        raise Skip(f"no display ({e})")
+    root.geometry("1280x800")
+    root.update()
+    return root
+
+
+class _Controller:
+    """The parts of App that MainPage reads, without sockets or REST."""
+
+    def __init__(self, root, symbols):
+        from data.ticker_service import TickerService
+        from ui.frame_scheduler import FrameScheduler
+
+        self.scheduler = FrameScheduler(root)
+        self.app_config = {"watchlist": list(symbols)}
+        self.ticker_service = TickerService(symbols)   # never started: no tickers
+        self.pages = {}
+
+
+def bench_main_page(n):
+    """MainPage.update_price alone, and through the table repaint to Tk's idle draw."""
+    from pages.main_page import MainPage
+
+    root = _tk_root()
+    try:
+        controller = _Controller(root, feeds.SYMBOLS)
+        controller.scheduler.set_active_page("MainPage")
+        page = MainPage(root, controller)
+        page.pack(fill="both", expand=True)
+        root.update()
+
+        events = feeds.trade_events(n)
+        update, paint = [], []
+        for e in events:
+            price = float(e["p"])
+            t0 = perf()
+            page.update_price(e["s"], price)
+            t1 = perf()
+            controller.scheduler.run_dirty()
+            root.update_idletasks()
+            t2 = perf()
+            update.append(t1 - t0)
+            paint.append(t2 - t0)
+        return {"main_update_price": update, "main_price_to_paint": paint}
+    finally:
+        root.destroy()
+
+
+def bench_orderbook(n):
+    """OrderBookPanel.render of a 10-level book plus the idle redraw."""
+    from ui.orderbook_panel import OrderBookPanel
+
+    root = _tk_root()
+    try:
+        panel = OrderBookPanel(root)
+        panel.pack(fill="both", expand=True)
+        root.update()
+
+        samples = []
+        for bids, asks in feeds.books(n):
+            t0 = perf()
+            panel.render(bids, asks)
+            root.update_idletasks()
+            samples.append(perf() - t0)
+        return {"orderbook_render": samples}
+    finally:
+        root.destroy()
+
+
+def bench_chart_draw(n, bars=100_000):
+    """CandlestickChart._draw plus the Agg render, default view and zoomed out to all bars."""
+    from data.kline_cache import COL
+    from ui.candlestick_chart import CandlestickChart
+
+    root = _tk_root()
+    try:
+        chart = CandlestickChart(root)
+        chart.pack(fill="both", expand=True)
+        root.update()
+
+        # data straight in: no cache read, no REST call
+        chart._history_done = True
+        chart._prefetched = True
+        chart._on_klines(chart._symbol, feeds.klines_1m(bars))
+        chart.canvas.draw()
+
+        reps = max(5, n // 1_000)
+        out = {"chart_draw_120": [], "chart_update_live": [], "chart_draw_all": []}
+        for _ in range(reps):
+            t0 = perf()
+            chart._draw()
+            chart.canvas.draw()
+            out["chart_draw_120"].append(perf() - t0)
+
+        k = chart._k
+        close = k[COL["close"], -1]
+        for i in range(reps * 20):
+            # live-bar tick inside the current y range: blit path
+            k[COL["close"], -1] = close * (1 + 1e-6 * (i % 7))
+            t0 = perf()
+            chart._update_live()
+            root.update_idletasks()
+            out["chart_update_live"].append(perf() - t0)
+
+        chart._view_bars = k.shape[1]
+        for _ in range(reps):
+            t0 = perf()
+            chart._draw()
+            chart.canvas.draw()
+            out["chart_draw_all"].append(perf() - t0)
+        return out
+    finally:
+        root.destroy()
+
+
+# name -> (fn, needs Tk); run order
+BENCHES = {
+    "ws_decode": (bench_ws_decode, False),
+    "ws_decode_batch": (bench_ws_decode_batch, False),
+    "bus": (bench_bus, False),
+    "bus_transit": (bench_bus_transit, False),
+    "chart_data": (bench_chart_data, False),
+    "main_page": (bench_main_page, True),
+    "orderbook": (bench_orderbook, True),
+    "chart_draw": (bench_chart_draw, True),
+}
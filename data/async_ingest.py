@@ -0,0 +1,191 @@
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+
+from data.endpoints import endpoints
+from data.socket_client import (
+    MAX_STREAMS_PER_CONNECTION,
+    ReconnectPolicy,
+    gap_topics,
+    route_frame,
+    shard_streams,
+)
+from data.traffic_log import traffic_recorder
+from queues.market_bus import market_bus
+
+
+class AsyncIngestEngine:
+    """All combined-stream connections on one asyncio loop in one thread.
+
+    Reader tasks only append raw frames to a deque; a decoder task wakes every
+    `batch_ms`, parses the whole batch with a single json.loads call and routes
+    the frames to `handlers` (same mapping as BinanceCombinedSocket). Handlers
+    publish on market_bus, which is the one thread-safe hand-off to Tk.
+    Needs the `websockets` package.
+    """
+
+    def __init__(self, handlers, policy=None, batch_ms: int = 20,
+                 streams_per_connection: int = MAX_STREAMS_PER_CONNECTION):
+        self.handlers = dict(handlers)
+        self.policy = policy or ReconnectPolicy()
+        self.batch_ms = batch_ms
+        self.streams_per_connection = streams_per_connection
+
+        self.streams = []
+        self.gaps = deque(maxlen=100)
+        self.stats = {"frames": 0, "batches": 0, "reconnects": 0, "connections": 0}
+        self.last_error = None
+
+        self._frames = deque()
+        self._loop = None
+        self._thread = None
+        self._tasks = []
+        self._stopping = None
+        self._ready = threading.Event()
+
+    def start(self, streams=()):
+        if self._thread and self._thread.is_alive():
+            self.add_streams(streams)
+            return
+        self.streams = list(streams)
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._thread_main, daemon=True, name="async-ingest")
+        self._thread.start()
+        self._ready.wait(timeout=2.0)
+
+    def add_streams(self, streams):
+        new = [s for s in streams if s not in self.streams]
+        if not new:
+            return
+        self.streams.extend(new)
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._spawn_connections, new)
+
+    def stop(self):
+        loop = self._loop
+        if loop is not None and self._stopping is not None:
+            try:
+                loop.call_soon_threadsafe(self._stopping.set)
+            except RuntimeError:
+                pass
+
+    def health(self):
+        return {
+            "connections": self.stats["connections"],
+            "frames": self.stats["frames"],
+            "batches": self.stats["batches"],
+            "reconnects": self.stats["reconnects"],
+            "gaps": len(self.gaps),
+            "last_error": self.last_error,
+        }
+
+    # ---- loop thread ----
+
+    def _thread_main(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        try:
+            loop.run_until_complete(self._main())
+        finally:
+            loop.close()
+            self._loop = None
+
+    async def _main(self):
+        self._stopping = asyncio.Event()
+        self._tasks = [asyncio.ensure_future(self._decode_loop())]
+        self._spawn_connections(self.streams)
+        self._ready.set()
+
+        await self._stopping.wait()
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._drain()
+
+    def _spawn_connections(self, streams):
+        for chunk in shard_streams(streams, self.streams_per_connection):
+            self._tasks.append(asyncio.ensure_future(self._connection(chunk)))
+
+    async def _connection(self, streams):
+        import websockets
+
+        url = f"{endpoints.stream}/stream?streams=" + "/".join(streams)
+        topics = gap_topics(streams)
+
+        attempt = 0
+        last_message_at = None
+        gap_from = None
+
+        while True:
+            connected_at = None
+            try:
+                async with websockets.connect(url, ping_interval=20, ping_timeout=10, max_size=None) as ws:
+                    connected_at = time.time()
+                    self.stats["connections"] += 1
+                    try:
+                        async for msg in ws:
+                            now = time.time()
+                            if gap_from is not None:
+                                gap = (int(gap_from * 1000), int(now * 1000))
+                                gap_from = None
+                                self.gaps.append(gap)
+                                for topic, sym in topics:
+                                    market_bus.publish(topic, sym, gap)
+                            last_message_at = now
+                            traffic_recorder.record_ws("", msg)
+                            self._frames.append(msg)
+                    finally:
+                        self.stats["connections"] -= 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = repr(e)
+                print("Async WS error:", len(streams), "streams", e)
+
+            if gap_from is None and last_message_at is not None:
+                gap_from = last_message_at
+            if connected_at and time.time() - connected_at >= self.policy.stable_s:
+                attempt = 0
+
+            await asyncio.sleep(self.policy.delay(attempt))
+            attempt += 1
+            self.stats["reconnects"] += 1
+
+    async def _decode_loop(self):
+        interval = self.batch_ms / 1000.0
+        while True:
+            await asyncio.sleep(interval)
+            self._drain()
+
+    def _drain(self):
+        frames = self._frames
+        if not frames:
+            return
+
+        batch = []
+        while frames:
+            batch.append(frames.popleft())
+
+        try:
+            # one parser call for the whole batch
+            payloads = json.loads("[" + ",".join(batch) + "]")
+        except ValueError:
+            payloads = []
+            for raw in batch:
+                try:
+                    payloads.append(json.loads(raw))
+                except ValueError:
+                    pass
+
+        for payload in payloads:
+            try:
+                route_frame(self.handlers, payload)
+            except Exception as e:
+                print("Async handler error:", e)
+
+        self.stats["frames"] += len(batch)
+        self.stats["batches"] += 1
@@ -1,7 +1,146 @@
+import threading
+from collections import namedtuple
+
+import numpy as np
+
+# side: +1 = taker buy, -1 = taker sell (buyer is maker)
+TickWindow = namedtuple("TickWindow", ["ts", "price", "qty", "side"])
+
+
+class TickRing:
+    """Fixed-capacity trade history in parallel NumPy arrays.
+
+    Each row is written twice (slot i and i + capacity), so the last n rows
+    are always one contiguous slice and windows are zero-copy views. Views
+    alias the buffer: copy them if you keep them past the current frame.
+    """
+
+    def __init__(self, capacity: int = 50_000):
+        self.capacity = capacity
+        self.ts = np.zeros(capacity * 2, dtype=np.int64)       # ms
+        self.price = np.zeros(capacity * 2, dtype=np.float64)
+        self.qty = np.zeros(capacity * 2, dtype=np.float64)
+        self.side = np.zeros(capacity * 2, dtype=np.int8)
+
+        self.count = 0     # total rows ever appended
+        self._size = 0     # rows held, <= capacity
+        self._head = 0     # next slot in [0, capacity)
+
+    def __len__(self):
+        return self._size
+
+    def append(self, ts: int, price: float, qty: float, side: int):
+        i = self._head
+        j = i + self.capacity
+        self.ts[i] = self.ts[j] = ts
+        self.price[i] = self.price[j] = price
+        self.qty[i] = self.qty[j] = qty
+        self.side[i] = self.side[j] = side
+
+        self._head = (i + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        self.count += 1
+
+    def extend(self, ts, price, qty, side):
+        """Append many rows at once (arrays of equal length)."""
+        n = len(ts)
+        if n == 0:
+            return
+        cap = self.capacity
+        if n > cap:
+            ts, price, qty, side = ts[-cap:], price[-cap:], qty[-cap:], side[-cap:]
+            self.count += n - cap
+            n = cap
+
+        idx = (self._head + np.arange(n)) % cap
+        for arr, vals in ((self.ts, ts), (self.price, price), (self.qty, qty), (self.side, side)):
+            arr[idx] = vals
+            arr[idx + cap] = vals
+
+        self._head = (self._head + n) % cap
+        self._size = min(self._size + n, cap)
+        self.count += n
+
+    def last(self, n: int) -> TickWindow:
+        n = max(0, min(n, len(self)))
+        end = self._head + self.capacity
+        start = end - n
+        return TickWindow(
+            self.ts[start:end],
+            self.price[start:end],
+            self.qty[start:end],
+            self.side[start:end],
+        )
+
+    def resized(self, capacity: int):
+        """New ring holding the newest rows that fit, with the same count."""
+        ring = TickRing(capacity)
+        ring.extend(*self.last(capacity))
+        ring.count = self.count
+        return ring
+
+    def since(self, ts_ms: int) -> TickWindow:
+        w = self.last(len(self))
+        i = int(np.searchsorted(w.ts, ts_ms, side="left"))
+        return TickWindow(w.ts[i:], w.price[i:], w.qty[i:], w.side[i:])
+
+
 class MarketData:
-    def __init__(self):
+    """Last prices and per-symbol trade rings.
+
+    Every watchlist symbol gets a small ring (about 50 KB at the default
+    capacity); only the focused symbol, the one open on GraphPage, keeps the
+    deep history its chart and trades panel read.
+    """
+
+    def __init__(self, tick_capacity: int = 1_000, focus_capacity: int = 50_000):
         self.prices = {}
         self.orderbooks = {}
+        self.trades = {}
 
-market_data = MarketData()
+        self.tick_capacity = tick_capacity
+        self.focus_capacity = focus_capacity
+        self.focus = None
+        self._lock = threading.Lock()
+
+    def _capacity(self, symbol):
+        return self.focus_capacity if symbol == self.focus else self.tick_capacity
 
+    def _ring(self, symbol):
+        # caller holds _lock
+        ring = self.trades.get(symbol)
+        if ring is None:
+            ring = self.trades[symbol] = TickRing(self._capacity(symbol))
+        return ring
+
+    def trade_ring(self, symbol: str, create: bool = False):
+        symbol = symbol.upper()
+        ring = self.trades.get(symbol)
+        if ring is None and create:
+            with self._lock:
+                ring = self._ring(symbol)
+        return ring
+
+    def set_focus(self, symbol):
+        """Give `symbol` (or nobody, for None) the deep ring; the previous one shrinks back."""
+        symbol = symbol.upper() if symbol else None
+        with self._lock:
+            old, self.focus = self.focus, symbol
+            if old == symbol:
+                return
+            for sym in (old, symbol):
+                ring = self.trades.get(sym)
+                if ring is not None and ring.capacity != self._capacity(sym):
+                    self.trades[sym] = ring.resized(self._capacity(sym))
+
+    def record_trade(self, symbol: str, ts: int, price: float, qty: float, buyer_is_maker: bool):
+        # under the lock so set_focus() never copies a ring mid-append
+        with self._lock:
+            self._ring(symbol.upper()).append(ts, price, qty, -1 if buyer_is_maker else 1)
+
+    def record_trades(self, symbol: str, ts, price, qty, side):
+        with self._lock:
+            self._ring(symbol.upper()).extend(ts, price, qty, side)
+
+
+market_data = MarketData()
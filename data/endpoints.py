@@ -0,0 +1,31 @@
+import os
+
+REST_BASE_URL = "https://api.binance.com"
+STREAM_BASE_URL = "wss://stream.binance.com:9443"
+
+# environment wins over settings.json, e.g. for a run against tools/mock_binance.py
+ENV_REST = "BINANCE_REST_URL"
+ENV_STREAM = "BINANCE_STREAM_URL"
+
+
+class Endpoints:
+    """Base URLs for the REST API and the WebSocket streams.
+
+    Read at connect / request time, so configure() before the services
+    start applies everywhere (socket threads, asyncio engine, REST pool).
+    """
+
+    def __init__(self):
+        self.rest = REST_BASE_URL
+        self.stream = STREAM_BASE_URL
+        self.configure()
+
+    def configure(self, rest=None, stream=None):
+        self.rest = (os.environ.get(ENV_REST) or rest or self.rest).rstrip("/")
+        self.stream = (os.environ.get(ENV_STREAM) or stream or self.stream).rstrip("/")
+
+    def as_dict(self):
+        return {"rest": self.rest, "stream": self.stream}
+
+
+endpoints = Endpoints()
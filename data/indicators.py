@@ -0,0 +1,404 @@
+import math
+from collections import deque
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from data.kline_cache import COL
+
+_EMA_BLOCK = 64
+_DAY_MS = 86_400_000
+NAN = float("nan")
+
+
+# ---- vectorized helpers ----
+
+def ema_filter(x, alpha, seed=None):
+    """y[i] = alpha * x[i] + (1 - alpha) * y[i-1], with y[-1] = seed (default x[0]).
+
+    Evaluated in blocks with one cumsum each (the decay factors stay within
+    float range), so there is no per-element Python loop.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    out = np.empty_like(x)
+    if not len(x):
+        return out
+
+    prev = x[0] if seed is None else seed
+    d = 1.0 - alpha
+    for s in range(0, len(x), _EMA_BLOCK):
+        xb = x[s:s + _EMA_BLOCK]
+        pw = d ** np.arange(1, len(xb) + 1)
+        out[s:s + len(xb)] = pw * (prev + alpha * np.cumsum(xb / pw))
+        prev = out[s + len(xb) - 1]
+    return out
+
+
+def rolling_mean(x, n):
+    out = np.full(len(x), np.nan)
+    if len(x) >= n:
+        c = np.cumsum(np.r_[0.0, x])
+        out[n - 1:] = (c[n:] - c[:-n]) / n
+    return out
+
+
+def rolling_std(x, n):
+    out = np.full(len(x), np.nan)
+    if len(x) >= n:
+        out[n - 1:] = sliding_window_view(x, n).std(axis=1)
+    return out
+
+
+def _mask_head(a, n):
+    a[:max(0, min(n, len(a)))] = np.nan
+    return a
+
+
+# ---- indicators ----
+#
+# init(k)      vectorized values for every bar of k (len(COLUMNS), n); leaves the
+#              running state at bar n-2, since the last bar is still open
+# commit(bar)  folds a closed bar (one column of k) into the running state
+# peek(bar)    values for the open bar from the running state, without committing
+
+class SMA:
+    overlay = True
+    lines = ("sma",)
+
+    def __init__(self, period: int = 20):
+        self.period = period
+        self.name = f"SMA {period}"
+        self._win = deque(maxlen=period - 1)
+        self._sum = 0.0
+
+    def init(self, k):
+        c = k[COL["close"]]
+        self._win.clear()
+        self._win.extend(c[:-1][-(self.period - 1):].tolist() if len(c) > 1 else ())
+        self._sum = float(sum(self._win))
+        return {"sma": rolling_mean(c, self.period)}
+
+    def commit(self, bar):
+        c = float(bar[COL["close"]])
+        if len(self._win) == self._win.maxlen:
+            self._sum -= self._win[0]
+        self._win.append(c)
+        self._sum += c
+
+    def peek(self, bar):
+        if len(self._win) < self.period - 1:
+            return {"sma": NAN}
+        return {"sma": (self._sum + float(bar[COL["close"]])) / self.period}
+
+
+class EMA:
+    overlay = True
+    lines = ("ema",)
+
+    def __init__(self, period: int = 50):
+        self.period = period
+        self.name = f"EMA {period}"
+        self.alpha = 2.0 / (period + 1)
+        self._prev = None
+        self._count = 0
+
+    def init(self, k):
+        c = k[COL["close"]]
+        y = ema_filter(c, self.alpha)
+        self._prev = float(y[-2]) if len(y) > 1 else None
+        self._count = max(0, len(y) - 1)
+        return {"ema": _mask_head(y, self.period - 1)}
+
+    def _next(self, c):
+        return c if self._prev is None else self.alpha * c + (1.0 - self.alpha) * self._prev
+
+    def commit(self, bar):
+        self._prev = self._next(float(bar[COL["close"]]))
+        self._count += 1
+
+    def peek(self, bar):
+        if self._count < self.period - 1:
+            return {"ema": NAN}
+        return {"ema": self._next(float(bar[COL["close"]]))}
+
+
+class Bollinger:
+    overlay = True
+    lines = ("mid", "upper", "lower")
+
+    def __init__(self, period: int = 20, width: float = 2.0):
+        self.period = period
+        self.width = width
+        self.name = f"BB {period}"
+        self._win = deque(maxlen=period - 1)
+        # sums of (x - ref) keep the running variance away from cancellation
+        self._ref = 0.0
+        self._s = 0.0
+        self._ss = 0.0
+
+    def init(self, k):
+        c = k[COL["close"]]
+        mid = rolling_mean(c, self.period)
+        sd = rolling_std(c, self.period)
+
+        self._win.clear()
+        self._win.extend(c[:-1][-(self.period - 1):].tolist() if len(c) > 1 else ())
+        self._ref = self._win[0] if self._win else 0.0
+        self._s = sum(x - self._ref for x in self._win)
+        self._ss = sum((x - self._ref) ** 2 for x in self._win)
+        return {"mid": mid, "upper": mid + self.width * sd, "lower": mid - self.width * sd}
+
+    def commit(self, bar):
+        c = float(bar[COL["close"]])
+        if len(self._win) == self._win.maxlen:
+            old = self._win[0] - self._ref
+            self._s -= old
+            self._ss -= old * old
+        self._win.append(c)
+        d = c - self._ref
+        self._s += d
+        self._ss += d * d
+
+    def peek(self, bar):
+        if len(self._win) < self.period - 1:
+            return {"mid": NAN, "upper": NAN, "lower": NAN}
+        n = self.period
+        d = float(bar[COL["close"]]) - self._ref
+        mean = (self._s + d) / n
+        var = max((self._ss + d * d) / n - mean * mean, 0.0)
+        mid = self._ref + mean
+        band = self.width * math.sqrt(var)
+        return {"mid": mid, "upper": mid + band, "lower": mid - band}
+
+
+class VWAP:
+    """Session VWAP on typical price, reset at 00:00 UTC."""
+
+    overlay = True
+    lines = ("vwap",)
+
+    def __init__(self):
+        self.name = "VWAP"
+        self._day = None
+        self._pv = 0.0
+        self._v = 0.0
+
+    @staticmethod
+    def _typical(k):
+        return (k[COL["high"]] + k[COL["low"]] + k[COL["close"]]) / 3.0
+
+    def init(self, k):
+        n = k.shape[1]
+        if not n:
+            self._day, self._pv, self._v = None, 0.0, 0.0
+            return {"vwap": np.empty(0)}
+
+        tp = self._typical(k)
+        v = k[COL["volume"]]
+        day = k[COL["open_time"]].astype(np.int64) // _DAY_MS
+
+        starts = np.flatnonzero(np.r_[True, day[1:] != day[:-1]])
+        lengths = np.diff(np.r_[starts, n])
+        cpv = np.cumsum(tp * v)
+        cv = np.cumsum(v)
+        base_pv = np.repeat(np.r_[0.0, cpv][starts], lengths)
+        base_v = np.repeat(np.r_[0.0, cv][starts], lengths)
+        spv = cpv - base_pv
+        sv = cv - base_v
+
+        out = np.divide(spv, sv, out=tp.copy(), where=sv > 0)
+
+        if n > 1:
+            self._day, self._pv, self._v = int(day[-2]), float(spv[-2]), float(sv[-2])
+        else:
+            self._day, self._pv, self._v = None, 0.0, 0.0
+        return {"vwap": out}
+
+    def _session(self, bar):
+        day = int(bar[COL["open_time"]]) // _DAY_MS
+        tp = float(bar[COL["high"]] + bar[COL["low"]] + bar[COL["close"]]) / 3.0
+        v = float(bar[COL["volume"]])
+        if day != self._day:
+            return day, tp * v, v, tp
+        return day, self._pv + tp * v, self._v + v, tp
+
+    def commit(self, bar):
+        self._day, self._pv, self._v, _ = self._session(bar)
+
+    def peek(self, bar):
+        _, pv, v, tp = self._session(bar)
+        return {"vwap": pv / v if v > 0 else tp}
+
+
+class RSI:
+    """Wilder's RSI (smoothing alpha = 1 / period)."""
+
+    overlay = False
+    lines = ("rsi",)
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.name = f"RSI {period}"
+        self.alpha = 1.0 / period
+        self._prev_close = None
+        self._ag = 0.0
+        self._al = 0.0
+        self._count = 0
+
+    @staticmethod
+    def _rsi(ag, al):
+        if al == 0:
+            return 100.0 if ag > 0 else 50.0
+        return 100.0 - 100.0 / (1.0 + ag / al)
+
+    def init(self, k):
+        c = k[COL["close"]]
+        n = len(c)
+        if not n:
+            self._prev_close, self._ag, self._al, self._count = None, 0.0, 0.0, 0
+            return {"rsi": np.empty(0)}
+
+        ch = np.r_[0.0, np.diff(c)]
+        ag = ema_filter(np.maximum(ch, 0.0), self.alpha)
+        al = ema_filter(np.maximum(-ch, 0.0), self.alpha)
+        rsi = np.full(n, 50.0)
+        np.divide(100.0 * ag, ag + al, out=rsi, where=(ag + al) > 0)
+
+        if n > 1:
+            self._prev_close, self._ag, self._al = float(c[-2]), float(ag[-2]), float(al[-2])
+        else:
+            self._prev_close, self._ag, self._al = None, 0.0, 0.0
+        self._count = max(0, n - 1)
+        return {"rsi": _mask_head(rsi, self.period)}
+
+    def _next(self, c):
+        if self._prev_close is None:
+            return 0.0, 0.0
+        ch = c - self._prev_close
+        a = self.alpha
+        ag = a * max(ch, 0.0) + (1.0 - a) * self._ag
+        al = a * max(-ch, 0.0) + (1.0 - a) * self._al
+        return ag, al
+
+    def commit(self, bar):
+        c = float(bar[COL["close"]])
+        self._ag, self._al = self._next(c)
+        self._prev_close = c
+        self._count += 1
+
+    def peek(self, bar):
+        if self._count < self.period:
+            return {"rsi": NAN}
+        ag, al = self._next(float(bar[COL["close"]]))
+        return {"rsi": self._rsi(ag, al)}
+
+
+class MACD:
+    overlay = False
+    lines = ("macd", "signal", "hist")
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast, self.slow, self.signal = fast, slow, signal
+        self.name = "MACD"
+        self._af = 2.0 / (fast + 1)
+        self._as = 2.0 / (slow + 1)
+        self._ag = 2.0 / (signal + 1)
+        self._state = None     # (ema_fast, ema_slow, signal) at the last committed bar
+        self._count = 0
+
+    def init(self, k):
+        c = k[COL["close"]]
+        f = ema_filter(c, self._af)
+        s = ema_filter(c, self._as)
+        macd = f - s
+        sig = ema_filter(macd, self._ag)
+
+        n = len(c)
+        self._state = (float(f[-2]), float(s[-2]), float(sig[-2])) if n > 1 else None
+        self._count = max(0, n - 1)
+
+        warm = self.slow + self.signal - 2
+        return {
+            "macd": _mask_head(macd, self.slow - 1),
+            "signal": _mask_head(sig, warm),
+            "hist": _mask_head(macd - sig, warm),
+        }
+
+    def _next(self, c):
+        if self._state is None:
+            return c, c, 0.0
+        f0, s0, g0 = self._state
+        f = self._af * c + (1.0 - self._af) * f0
+        s = self._as * c + (1.0 - self._as) * s0
+        g = self._ag * (f - s) + (1.0 - self._ag) * g0
+        return f, s, g
+
+    def commit(self, bar):
+        self._state = self._next(float(bar[COL["close"]]))
+        self._count += 1
+
+    def peek(self, bar):
+        f, s, g = self._next(float(bar[COL["close"]]))
+        warm = self.slow + self.signal - 2
+        return {
+            "macd": f - s if self._count >= self.slow - 1 else NAN,
+            "signal": g if self._count >= warm else NAN,
+            "hist": f - s - g if self._count >= warm else NAN,
+        }
+
+
+def _fit(a, window):
+    a = np.array(a[-window:], dtype=np.float64)
+    if len(a) < window:
+        a = np.concatenate([np.full(window - len(a), np.nan), a])
+    return a
+
+
+class IndicatorSet:
+    """Active indicators with value arrays aligned to the displayed klines.
+
+    reset() runs init() over the given history (warm-up included) and keeps
+    the last `window` values; on a live tick only the last value is
+    re-peeked, and a new bar commits the closed one and shifts the arrays.
+    """
+
+    def __init__(self):
+        self.items = []
+        self.values = {}   # name -> {line: array}
+
+    def add(self, indicator):
+        self.items.append(indicator)
+
+    def remove(self, name):
+        self.items = [ind for ind in self.items if ind.name != name]
+        self.values.pop(name, None)
+
+    def names(self):
+        return [ind.name for ind in self.items]
+
+    def reset(self, k, window: int, items=None):
+        # items=None re-inits everything; values shorter than window are NaN-padded in front
+        if items is None:
+            self.values = {}
+            items = self.items
+        for ind in items:
+            vals = ind.init(k)
+            self.values[ind.name] = {ln: _fit(a, window) for ln, a in vals.items()}
+
+    def commit(self, bar):
+        for ind in self.items:
+            ind.commit(bar)
+
+    def append(self, window: int):
+        for vals in self.values.values():
+            for ln, a in vals.items():
+                vals[ln] = np.append(a, np.nan)[-window:]
+
+    def update_last(self, bar):
+        for ind in self.items:
+            vals = self.values.get(ind.name)
+            if not vals:
+                continue
+            for ln, v in ind.peek(bar).items():
+                if len(vals[ln]):
+                    vals[ln][-1] = v
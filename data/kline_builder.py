@@ -0,0 +1,61 @@
+INTERVAL_MS = {
+    "1m": 60_000,
+    "3m": 3 * 60_000,
+    "5m": 5 * 60_000,
+    "15m": 15 * 60_000,
+    "30m": 30 * 60_000,
+    "1h": 60 * 60_000,
+    "2h": 2 * 60 * 60_000,
+    "4h": 4 * 60 * 60_000,
+    "1d": 24 * 60 * 60_000,
+}
+
+# add_trade() results
+BAR_UPDATED = "updated"
+BAR_OPENED = "opened"
+
+
+def interval_to_ms(interval: str) -> int:
+    try:
+        return INTERVAL_MS[interval]
+    except KeyError:
+        raise ValueError(f"unsupported interval: {interval}")
+
+
+class KlineAggregator:
+    """Builds the live candle from trades.
+
+    bar is [open_time_ms, open, high, low, close, volume] for the current
+    interval; add_trade() either updates it in place or rolls to a new bar.
+    """
+
+    def __init__(self, interval: str = "1m"):
+        self.interval = interval
+        self.interval_ms = interval_to_ms(interval)
+        self.bar = None
+
+    def seed(self, open_time_ms, o, h, l, c, v):
+        self.bar = [int(open_time_ms), float(o), float(h), float(l), float(c), float(v)]
+
+    def bar_start(self, ts_ms: int) -> int:
+        return ts_ms - ts_ms % self.interval_ms
+
+    def add_trade(self, ts_ms: int, price: float, qty: float):
+        start = self.bar_start(ts_ms)
+        bar = self.bar
+
+        if bar is None or start > bar[0]:
+            self.bar = [start, price, price, price, price, qty]
+            return BAR_OPENED
+
+        if start < bar[0]:
+            # late trade for a bar that is already closed
+            return None
+
+        if price > bar[2]:
+            bar[2] = price
+        if price < bar[3]:
+            bar[3] = price
+        bar[4] = price
+        bar[5] += qty
+        return BAR_UPDATED
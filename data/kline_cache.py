@@ -0,0 +1,159 @@
+import io
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+
+# column order of the cached arrays (stored column-major, float64)
+COLUMNS = (
+    "open_time", "open", "high", "low", "close", "volume",
+    "quote_volume", "taker_buy_quote",
+)
+COL = {name: i for i, name in enumerate(COLUMNS)}
+
+CACHE_DIR = Path(__file__).resolve().parents[1] / "cache" / "klines"
+
+
+def empty_klines():
+    return np.empty((len(COLUMNS), 0), dtype=np.float64)
+
+
+def merge_klines(old, new):
+    """Union of two kline arrays sorted by open_time; rows of `new` win on duplicates."""
+    if old is None or not old.shape[1]:
+        return np.asarray(new, dtype=np.float64)
+    if not new.shape[1]:
+        return np.asarray(old, dtype=np.float64)
+
+    merged = np.concatenate([old, new], axis=1)
+    # stable sort then keep the last occurrence of each open_time
+    order = np.argsort(merged[COL["open_time"]], kind="stable")
+    merged = merged[:, order]
+    t = merged[COL["open_time"]]
+    keep = np.ones(t.shape[0], dtype=bool)
+    keep[:-1] = t[1:] != t[:-1]
+    return merged[:, keep]
+
+
+class KlineCache:
+    """On-disk kline store, one .npy file per (symbol, interval).
+
+    Arrays have shape (len(COLUMNS), n), sorted by open_time. Files are
+    Fortran-ordered, so each bar is one contiguous record and new bars are
+    written in place at the end of the file; only out-of-order rows (history
+    backfill) or trimming to max_rows rewrite it. load() memory-maps the
+    file; tail() returns a C-ordered copy.
+    """
+
+    def __init__(self, root: Path = CACHE_DIR, max_rows: int = 200_000):
+        self.root = Path(root)
+        self.max_rows = max_rows
+        # files may grow this far past max_rows before a trimming rewrite
+        self.trim_slack = max(1, max_rows // 20)
+        self._lock = threading.Lock()
+
+    def path(self, symbol: str, interval: str) -> Path:
+        return self.root / f"{symbol.upper()}_{interval}.npy"
+
+    def load(self, symbol: str, interval: str):
+        return self._load(self.path(symbol, interval))
+
+    def _load(self, p: Path):
+        if not p.exists():
+            return None
+        try:
+            arr = np.load(p, mmap_mode="r")
+        except Exception:
+            return None
+        if arr.ndim != 2 or arr.shape[0] != len(COLUMNS):
+            return None
+        return arr
+
+    def tail(self, symbol: str, interval: str, n: int):
+        arr = self.load(symbol, interval)
+        if arr is None:
+            return empty_klines()
+        out = np.ascontiguousarray(arr[:, -n:])
+        del arr
+        return out
+
+    def merge(self, symbol: str, interval: str, rows):
+        """Merge new rows (same layout) into the file; newer rows win."""
+        if not rows.shape[1]:
+            return
+        with self._lock:
+            p = self.path(symbol, interval)
+            if not self._append(p, rows):
+                self._rewrite(p, rows)
+
+    def replace(self, symbol: str, interval: str, rows):
+        """Drop whatever is cached and keep only `rows`."""
+        with self._lock:
+            self._save(self.path(symbol, interval), rows)
+
+    def _append(self, p: Path, rows):
+        # in place when rows only replace / extend the end of the file
+        old = self._load(p)
+        if old is None or not old.flags.f_contiguous:
+            return False
+
+        n_old = old.shape[1]
+        offset = old.offset
+        t_new = rows[COL["open_time"]]
+        k = min(n_old, rows.shape[1] + 1)
+        t_tail = np.array(old[COL["open_time"], n_old - k:])
+        del old
+
+        if k < n_old and t_new[0] < t_tail[0]:
+            return False
+        if len(t_new) > 1 and np.any(np.diff(t_new) <= 0):
+            return False
+        pos = n_old - k + int(np.searchsorted(t_tail, t_new[0]))
+        # every old bar from pos on must be replaced, or the merge is not a plain overwrite
+        if not np.isin(t_tail[pos - (n_old - k):], t_new).all():
+            return False
+
+        n = pos + rows.shape[1]
+        if n > self.max_rows + self.trim_slack:
+            return False
+
+        header = io.BytesIO()
+        np.lib.format.write_array_header_1_0(
+            header, {"descr": "<f8", "fortran_order": True, "shape": (len(COLUMNS), n)}
+        )
+        if len(header.getvalue()) != offset:
+            return False
+
+        record = len(COLUMNS) * 8
+        with open(p, "r+b") as f:
+            # data before header: a crash in between leaves the old, still valid, length
+            f.seek(offset + pos * record)
+            f.write(np.ascontiguousarray(rows.T, dtype="<f8").tobytes())
+            f.seek(0)
+            f.write(header.getvalue())
+        return True
+
+    def _rewrite(self, p: Path, rows):
+        old = None
+        if p.exists():
+            try:
+                old = np.load(p)
+            except Exception:
+                old = None
+
+        if old is None or old.ndim != 2 or old.shape[0] != len(COLUMNS):
+            old = None
+        self._save(p, merge_klines(old, rows))
+
+    def _save(self, p: Path, arr):
+        if arr.shape[1] > self.max_rows:
+            arr = arr[:, -self.max_rows:]
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = p.with_suffix(".tmp.npy")
+        np.save(tmp, np.asfortranarray(arr, dtype=np.float64))
+        os.replace(tmp, p)
+
+
+kline_cache = KlineCache()
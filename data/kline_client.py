@@ -1,24 +1,122 @@
-import requests
-import pandas as pd
+import time
 
+import numpy as np
 
-def fetch_klines(symbol: str, interval: str = "1m", limit: int = 200) -> pd.DataFrame:
-    url = "https://api.binance.com/api/v3/klines"
+from data.kline_builder import interval_to_ms
+from data.kline_cache import kline_cache, COL, empty_klines
+from data.rest_client import rest_client
+from data.traffic_log import kline_replay, traffic_recorder
+
+KLINES_PATH = "/api/v3/klines"
+MAX_KLINES_PER_REQUEST = 1000
+# a longer absence restarts the cache instead of paging through the whole gap
+MAX_GAP_FILL_BARS = 10_000
+
+# raw kline fields kept in the cache, in kline_cache.COLUMNS order
+_RAW_FIELDS = (0, 1, 2, 3, 4, 5, 7, 10)
+
+
+def _request_klines(symbol, interval, limit, start_ms=None, end_ms=None):
     params = {"symbol": symbol.upper(), "interval": interval, "limit": limit}
-    r = requests.get(url, params=params, timeout=2.0)
-    r.raise_for_status()
+    if start_ms is not None:
+        params["startTime"] = int(start_ms)
+    if end_ms is not None:
+        params["endTime"] = int(end_ms)
+
+    if kline_replay.active:
+        rows = kline_replay.klines(params)
+    else:
+        rows = rest_client.get_json(KLINES_PATH, params=params, timeout=2.0)
+        traffic_recorder.record_rest(KLINES_PATH, params, rows)
+    if not rows:
+        return empty_klines()
+    return np.array([[row[i] for i in _RAW_FIELDS] for row in rows], dtype=np.float64).T
+
+
+def download_klines(symbol, interval, limit, start_ms=None, end_ms=None):
+    """Latest `limit` bars (or the ones up to end_ms), or up to `limit` bars from start_ms, paginated."""
+    if start_ms is None:
+        # walk backwards from end_ms (default: now) with endTime
+        chunks = []
+        remaining = limit
+        while remaining > 0:
+            n = min(remaining, MAX_KLINES_PER_REQUEST)
+            chunk = _request_klines(symbol, interval, n, end_ms=end_ms)
+            if not chunk.shape[1]:
+                break
+            chunks.insert(0, chunk)
+            remaining -= chunk.shape[1]
+            if chunk.shape[1] < n:
+                break
+            end_ms = chunk[COL["open_time"], 0] - 1
+        return np.concatenate(chunks, axis=1) if chunks else empty_klines()
+
+    chunks = []
+    remaining = limit
+    while remaining > 0:
+        n = min(remaining, MAX_KLINES_PER_REQUEST)
+        chunk = _request_klines(symbol, interval, n, start_ms=start_ms)
+        if not chunk.shape[1]:
+            break
+        chunks.append(chunk)
+        remaining -= chunk.shape[1]
+        if chunk.shape[1] < n:
+            break
+        start_ms = chunk[COL["open_time"], -1] + 1
+    return np.concatenate(chunks, axis=1) if chunks else empty_klines()
+
+
+def fetch_kline_arrays(symbol: str, interval: str = "1m", limit: int = 200, use_cache: bool = True):
+    """Latest `limit` bars as a (len(COLUMNS), n) array.
+
+    With the cache, only what it lacks is downloaded: everything from the
+    newest cached bar on (refetched, it was probably still open), then older
+    bars if the cache holds fewer than `limit`. The cached series never has
+    holes; a gap longer than MAX_GAP_FILL_BARS replaces it with fresh bars.
+    """
+    if not use_cache or kline_replay.active:
+        # a replay serves recorded bars only and must not touch the live cache
+        return download_klines(symbol, interval, limit)
+
+    cached = kline_cache.tail(symbol, interval, limit)
+
+    try:
+        if not cached.shape[1]:
+            kline_cache.merge(symbol, interval, download_klines(symbol, interval, limit))
+        else:
+            last_open = cached[COL["open_time"], -1]
+            missing = int((time.time() * 1000 - last_open) // interval_to_ms(interval)) + 1
+            if missing > MAX_GAP_FILL_BARS:
+                kline_cache.replace(symbol, interval, download_klines(symbol, interval, limit))
+            else:
+                fresh = download_klines(symbol, interval, missing + 1, start_ms=last_open)
+                kline_cache.merge(symbol, interval, fresh)
+
+        out = kline_cache.tail(symbol, interval, limit)
+        short = limit - out.shape[1]
+        if out.shape[1] and short > 0:
+            older = download_klines(symbol, interval, short, end_ms=out[COL["open_time"], 0] - 1)
+            if older.shape[1]:
+                kline_cache.merge(symbol, interval, older)
+                out = kline_cache.tail(symbol, interval, limit)
+    except Exception:
+        if cached.shape[1]:
+            # offline: serve what we have
+            return kline_cache.tail(symbol, interval, limit)
+        raise
+
+    return out
 
-    rows = r.json()
-    df = pd.DataFrame(rows, columns=[
-        "open_time", "open", "high", "low", "close", "volume",
-        "close_time", "quote_volume", "num_trades",
-        "taker_buy_base", "taker_buy_quote", "ignore"
-    ])
 
-    df["open_time"] = pd.to_datetime(df["open_time"], unit="ms")
-    df.set_index("open_time", inplace=True)
+def backfill_kline_arrays(symbol: str, interval: str, end_ms: int, limit: int = 5000):
+    """Up to `limit` bars older than end_ms, merged into the cache (for deep history)."""
+    older = download_klines(symbol, interval, limit, end_ms=end_ms)
+    if older.shape[1] and not kline_replay.active:
+        kline_cache.merge(symbol, interval, older)
+    return older
 
-    for c in ["open", "high", "low", "close", "volume"]:
-        df[c] = df[c].astype(float)
 
-    return df[["open", "high", "low", "close", "volume"]]
+def load_cached_kline_arrays(symbol: str, interval: str = "1m", limit: int = 200):
+    if kline_replay.active:
+        return empty_klines()
+    return kline_cache.tail(symbol, interval, limit)
@@ -0,0 +1,153 @@
+import threading
+from bisect import bisect_left, insort
+
+# Binance sends prices/quantities as strings with 8 decimals
+PRICE_DECIMALS = 8
+_SCALE = 10 ** PRICE_DECIMALS
+
+
+def to_ticks(price: str) -> int:
+    # exact string -> integer ticks, no float rounding
+    whole, _, frac = str(price).partition(".")
+    frac = (frac + "0" * PRICE_DECIMALS)[:PRICE_DECIMALS]
+    sign = -1 if whole.startswith("-") else 1
+    return sign * (abs(int(whole or "0")) * _SCALE + int(frac))
+
+
+def from_ticks(ticks: int) -> float:
+    return ticks / _SCALE
+
+
+class Ladder:
+    """One side of the book, best level first.
+
+    Quantities live in a dict keyed by price; a sorted list of the same keys
+    orders them (bids use negated ticks, so index 0 is always the best level).
+    A quantity change is a dict write; the list only changes, through bisect,
+    when a level appears or disappears. top(n) is a slice.
+    """
+
+    def __init__(self, descending: bool):
+        self._sign = -1 if descending else 1
+        self._qty = {}
+        self._keys = []
+
+    def __len__(self):
+        return len(self._qty)
+
+    def clear(self):
+        self._qty.clear()
+        self._keys.clear()
+
+    def set(self, ticks: int, qty: float):
+        key = ticks * self._sign
+        if qty == 0:
+            if self._qty.pop(key, None) is not None:
+                del self._keys[bisect_left(self._keys, key)]
+            return
+
+        if key not in self._qty:
+            insort(self._keys, key)
+        self._qty[key] = qty
+
+    def best(self):
+        if not self._keys:
+            return None
+        return self._keys[0] * self._sign
+
+    def top(self, n: int):
+        qty, sign = self._qty, self._sign
+        return tuple((from_ticks(k * sign), qty[k]) for k in self._keys[:n])
+
+
+class LocalOrderBook:
+    """Full-depth book synced from a REST snapshot plus the diff-depth stream.
+
+    Follows the Binance procedure: buffer diffs until the snapshot arrives,
+    drop events with u <= lastUpdateId, then require every event to start at
+    the previous u + 1. Any gap marks the book unsynced so the owner resyncs.
+    """
+
+    def __init__(self, symbol: str, max_buffer: int = 1000):
+        self.symbol = symbol.upper()
+        self.bids = Ladder(descending=True)
+        self.asks = Ladder(descending=False)
+
+        self.last_update_id = None
+        self.synced = False
+        self.max_buffer = max_buffer
+
+        self._buffer = []
+        self._lock = threading.Lock()
+
+    def reset(self):
+        with self._lock:
+            self._reset()
+
+    def _reset(self):
+        self.bids.clear()
+        self.asks.clear()
+        self.last_update_id = None
+        self.synced = False
+
+    def load_snapshot(self, snapshot) -> bool:
+        with self._lock:
+            self._reset()
+            for p, q in snapshot.get("bids", []):
+                self.bids.set(to_ticks(p), float(q))
+            for p, q in snapshot.get("asks", []):
+                self.asks.set(to_ticks(p), float(q))
+            self.last_update_id = int(snapshot["lastUpdateId"])
+
+            buffered = self._buffer
+            self._buffer = []
+            first = True
+            for event in buffered:
+                if event["u"] <= self.last_update_id:
+                    continue
+                if first and event["U"] > self.last_update_id + 1:
+                    # snapshot is older than the oldest buffered diff
+                    self._reset()
+                    return False
+                self._apply(event)
+                first = False
+
+            self.synced = True
+            return True
+
+    def apply_diff(self, event) -> bool:
+        """Returns False when the book needs a new snapshot."""
+        with self._lock:
+            if not self.synced:
+                self._buffer.append(event)
+                if len(self._buffer) > self.max_buffer:
+                    del self._buffer[0]
+                return True
+
+            if event["u"] <= self.last_update_id:
+                return True
+
+            if event["U"] != self.last_update_id + 1:
+                # gap in update ids: keep buffering from here and resync
+                self._reset()
+                self._buffer = [event]
+                return False
+
+            self._apply(event)
+            return True
+
+    def _apply(self, event):
+        for p, q in event.get("b", []):
+            self.bids.set(to_ticks(p), float(q))
+        for p, q in event.get("a", []):
+            self.asks.set(to_ticks(p), float(q))
+        self.last_update_id = event["u"]
+
+    def top(self, n: int):
+        """Immutable copy of the best n levels: ((bids...), (asks...)) of (price, qty)."""
+        with self._lock:
+            return self.bids.top(n), self.asks.top(n)
+
+    def depth(self):
+        with self._lock:
+            return len(self.bids), len(self.asks)
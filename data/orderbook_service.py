@@ -1,13 +1,122 @@
-from data.socket_client import BinanceOrderBookSocket
+import threading
+
+from data.local_orderbook import LocalOrderBook
+from data.rest_client import rest_client
+from data.stream_manager import StreamManager
+from queues.market_bus import market_bus
+
+DEPTH_PATH = "/api/v3/depth"
 
 
 class OrderBookService:
-    def __init__(self, symbols):
-        self.symbols = symbols
-        self.sockets = []
-
-    def start(self):
-        for s in self.symbols:
-            sock = BinanceOrderBookSocket(s, levels=10, interval_ms=100)
-            sock.start()
-            self.sockets.append(sock)
+    """Keeps a full-depth LocalOrderBook per symbol that is on screen.
+
+    acquire()/release() are reference-counted through a StreamManager on one
+    shared connection; a book is dropped once its depth stream is actually
+    unsubscribed (after the grace period). Publishes ("book", SYMBOL) with an
+    immutable (bids, asks) copy of the best `top_levels` levels as payload, so
+    subscribers never read the book while the socket thread updates it.
+    """
+
+    def __init__(self, snapshot_limit=5000, grace_s=15.0, top_levels=20):
+        self.snapshot_limit = snapshot_limit
+        self.top_levels = top_levels
+
+        self.books = {}
+        self._syncing = set()
+        self._lock = threading.Lock()
+
+        self.streams = StreamManager(
+            {"depth@100ms": self._on_diff},
+            grace_s=grace_s,
+            on_unsubscribed=self._on_stream_closed,
+        )
+
+    def _stream(self, symbol):
+        return f"{symbol.lower()}@depth@100ms"
+
+    def acquire(self, symbol):
+        symbol = symbol.upper()
+        with self._lock:
+            book = self.books.get(symbol)
+            created = book is None
+            if created:
+                book = LocalOrderBook(symbol)
+                self.books[symbol] = book
+
+        self.streams.acquire(self._stream(symbol))
+        if created:
+            self._request_snapshot(symbol)
+        return book
+
+    def release(self, symbol):
+        self.streams.release(self._stream(symbol.upper()))
+
+    def sweep(self):
+        return self.streams.sweep()
+
+    def _on_stream_closed(self, stream):
+        symbol = stream.partition("@")[0].upper()
+        with self._lock:
+            self.books.pop(symbol, None)
+
+    def book(self, symbol):
+        return self.books.get(symbol.upper())
+
+    def stop(self):
+        self.streams.stop()
+        with self._lock:
+            self.books.clear()
+
+    def _on_diff(self, symbol_lc, data):
+        symbol = symbol_lc.upper()
+        book = self.books.get(symbol)
+        if book is None:
+            return
+
+        if not book.apply_diff(data):
+            self._request_snapshot(symbol)
+            return
+
+        if book.synced:
+            self._publish(symbol, book)
+
+    def _publish(self, symbol, book):
+        # nobody on screen for this symbol: skip building the copy
+        if market_bus.has_subscribers("book", symbol):
+            market_bus.publish("book", symbol, book.top(self.top_levels))
+
+    def _request_snapshot(self, symbol):
+        with self._lock:
+            if symbol in self._syncing:
+                return
+            self._syncing.add(symbol)
+
+        rest_client.call(self._sync, symbol)
+
+    def _sync(self, symbol):
+        try:
+            book = self.books.get(symbol)
+            if book is None:
+                return
+
+            snapshot = rest_client.get_json(
+                DEPTH_PATH,
+                params={"symbol": symbol, "limit": self.snapshot_limit},
+                timeout=5.0,
+            )
+
+            if book.load_snapshot(snapshot):
+                self._publish(symbol, book)
+                return
+        except Exception as e:
+            print("OB snapshot error:", symbol, e)
+        finally:
+            with self._lock:
+                self._syncing.discard(symbol)
+
+        # snapshot was stale or failed: try again
+        if symbol in self.books:
+            t = threading.Timer(1.0, self._request_snapshot, args=(symbol,))
+            t.daemon = True
+            t.start()
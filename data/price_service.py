@@ -1,17 +1,58 @@
-from data.socket_client import BinancePriceSocket
+from data.socket_client import BinanceCombinedSocket, handle_trade, shard_streams
 
 
 class PriceService:
-    def __init__(self, symbols):
+    """Trade streams for the watchlist.
+
+    engine="threads": one BinanceCombinedSocket (own thread) per shard.
+    engine="asyncio": every shard on one AsyncIngestEngine event loop.
+    engine="process": a child process ingests and decodes; poll() reads its
+    shared-memory ring on the Tk thread.
+    """
+
+    def __init__(self, symbols, engine: str = "threads", handlers=None):
         self.symbols = symbols
+        self.engine = engine
+        self.handlers = handlers or {"trade": handle_trade}
         self.sockets = []
 
     def start(self):
-        for s in self.symbols:
-            sock = BinancePriceSocket(s)
+        # one combined-stream connection per shard instead of one per symbol
+        streams = [f"{s.lower()}@trade" for s in self.symbols]
+        handlers = self.handlers
+
+        if self.engine == "process":
+            from data.shm_ingest import ShmIngestProcess
+
+            proc = ShmIngestProcess(self.symbols)
+            proc.start()
+            self.sockets.append(proc)
+            return
+
+        if self.engine == "asyncio":
+            from data.async_ingest import AsyncIngestEngine
+
+            ingest = AsyncIngestEngine(handlers)
+            ingest.start(streams)
+            self.sockets.append(ingest)
+            return
+
+        for chunk in shard_streams(streams):
+            sock = BinanceCombinedSocket(chunk, handlers=handlers)
             sock.start()
             self.sockets.append(sock)
 
+    def poll(self):
+        """Pull records from an out-of-process engine; no-op for the others."""
+        n = 0
+        for s in self.sockets:
+            if hasattr(s, "poll"):
+                n += s.poll()
+        return n
+
+    def health(self):
+        return [s.health() for s in self.sockets]
+
     def stop(self):
         for s in self.sockets:
             if hasattr(s, "stop"):
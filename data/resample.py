@@ -0,0 +1,46 @@
+import numpy as np
+
+from data.kline_builder import interval_to_ms
+from data.kline_cache import COL, COLUMNS, empty_klines
+
+BASE_INTERVAL = "1m"
+
+_SUM_COLUMNS = ("volume", "quote_volume", "taker_buy_quote")
+
+
+def base_bars_for(interval: str, n: int) -> int:
+    """How many base (1m) bars cover n bars of `interval`."""
+    return n * (interval_to_ms(interval) // interval_to_ms(BASE_INTERVAL))
+
+
+def resample_klines(k, interval: str):
+    """Aggregate base klines (len(COLUMNS), n) into `interval` bars.
+
+    Bars are bucketed on open_time (UTC-aligned like Binance) and reduced
+    with ufunc.reduceat, so the whole series is a handful of vectorized
+    passes. A leading bucket that the base series only partly covers is
+    dropped; the trailing one is kept as the live, partial bar.
+    """
+    if interval == BASE_INTERVAL:
+        return np.array(k)
+    if not k.shape[1]:
+        return empty_klines()
+
+    ms = interval_to_ms(interval)
+    t = k[COL["open_time"]].astype(np.int64)
+    bucket = t - t % ms
+
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    if t[0] != bucket[0] and len(starts) > 1:
+        starts = starts[1:]
+    ends = np.r_[starts[1:], len(t)] - 1
+
+    out = np.empty((len(COLUMNS), len(starts)), dtype=np.float64)
+    out[COL["open_time"]] = bucket[starts]
+    out[COL["open"]] = k[COL["open"], starts]
+    out[COL["close"]] = k[COL["close"], ends]
+    out[COL["high"]] = np.maximum.reduceat(k[COL["high"], starts[0]:], starts - starts[0])
+    out[COL["low"]] = np.minimum.reduceat(k[COL["low"], starts[0]:], starts - starts[0])
+    for name in _SUM_COLUMNS:
+        out[COL[name]] = np.add.reduceat(k[COL[name], starts[0]:], starts - starts[0])
+    return out
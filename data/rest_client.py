@@ -0,0 +1,82 @@
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from data.endpoints import endpoints
+
+
+class RestClient:
+    """Shared keep-alive session plus a worker pool for REST calls.
+
+    call() runs a function on a worker; its on_done/on_error callbacks are
+    queued and only run when the Tk main thread calls run_callbacks().
+    Without a base_url, requests go to endpoints.rest.
+    """
+
+    def __init__(self, base_url: str = None, workers: int = 4, pool_size: int = 8):
+        self.base_url = base_url.rstrip("/") if base_url else None
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._workers = workers
+        self._executor = None
+        self._lock = threading.Lock()
+        self._done = deque()
+
+    def url(self, path: str) -> str:
+        if path.startswith("http://") or path.startswith("https://"):
+            return path
+        return (self.base_url or endpoints.rest) + path
+
+    def get_json(self, path: str, params=None, timeout: float = 2.0):
+        r = self.session.get(self.url(path), params=params, timeout=timeout)
+        r.raise_for_status()
+        return r.json()
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._workers, thread_name_prefix="rest"
+                )
+            return self._executor
+
+    def call(self, fn, *args, on_done=None, on_error=None, **kwargs):
+        future = self._pool().submit(fn, *args, **kwargs)
+        if on_done is not None or on_error is not None:
+            future.add_done_callback(lambda f: self._done.append((f, on_done, on_error)))
+        return future
+
+    def run_callbacks(self):
+        n = 0
+        while self._done:
+            future, on_done, on_error = self._done.popleft()
+            try:
+                exc = future.exception()
+                if exc is None:
+                    if on_done is not None:
+                        on_done(future.result())
+                elif on_error is not None:
+                    on_error(exc)
+            except Exception as e:
+                print("REST callback error:", e)
+            n += 1
+        return n
+
+    def close(self):
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._done.clear()
+        self.session.close()
+
+
+rest_client = RestClient()
@@ -1,9 +1,17 @@
 import json
 from pathlib import Path
 
+from data.endpoints import REST_BASE_URL, STREAM_BASE_URL
+
 DEFAULTS = {
     "watchlist": ["BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT", "XRPUSDT"],
-    "panels": {"stats": True, "orderbook": True, "volume": True},
+    "panels": {"stats": True, "orderbook": True, "volume": True, "trades": True},
+    "ingest": "threads",  # or "asyncio" / "process"
+    "endpoints": {"rest": REST_BASE_URL, "stream": STREAM_BASE_URL},
+    "record": "",         # traffic log to append to, e.g. "logs/session.log.gz"
+    "replay": "",         # traffic log to run on instead of live trade streams
+    "replay_speed": 1.0,  # N times recorded speed; null = as fast as possible
+    "startup_report": False,  # print startup / page build timings
 }
 
 class SettingsStore:
@@ -24,6 +32,10 @@ class SettingsStore:
         # normalize
         self.data.setdefault("watchlist", DEFAULTS["watchlist"][:])
         self.data.setdefault("panels", dict(DEFAULTS["panels"]))
+        self.data.setdefault("ingest", DEFAULTS["ingest"])
+        self.data.setdefault("endpoints", dict(DEFAULTS["endpoints"]))
+        for key in ("record", "replay", "replay_speed", "startup_report"):
+            self.data.setdefault(key, DEFAULTS[key])
         return self.data
 
     def save(self):
@@ -0,0 +1,266 @@
+import multiprocessing as mp
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from data.data_store import market_data
+from data.endpoints import endpoints
+from data.taker_volume import taker_volume
+from queues.market_bus import market_bus
+
+# record kinds
+TRADE = 1
+GAP = 2  # ts = gap start ms, price = gap end ms
+
+RECORD_DTYPE = np.dtype([
+    ("kind", np.uint8),
+    ("side", np.int8),
+    ("sym", np.uint16),
+    ("ts", np.int64),
+    ("price", np.float64),
+    ("qty", np.float64),
+])
+
+# header slots (int64)
+H_WRITE_SEQ = 0   # total records ever written, bumped after the record is in place
+H_CAPACITY = 1
+H_HEARTBEAT = 2   # writer wall clock, ms
+HEADER_BYTES = 64
+
+
+class ShmTradeRing:
+    """Fixed-width trade records in a shared-memory ring.
+
+    One writer (the ingest process) fills slot seq % capacity and then bumps
+    the write sequence; readers compare it with their own read sequence, copy
+    the new records out and then check the writer has not lapped them while
+    copying.
+    """
+
+    def __init__(self, buf, capacity: int):
+        self.capacity = capacity
+        self.header = np.ndarray((HEADER_BYTES // 8,), dtype=np.int64, buffer=buf)
+        self.records = np.ndarray((capacity,), dtype=RECORD_DTYPE, buffer=buf, offset=HEADER_BYTES)
+
+    @staticmethod
+    def nbytes(capacity: int) -> int:
+        return HEADER_BYTES + capacity * RECORD_DTYPE.itemsize
+
+    @property
+    def write_seq(self) -> int:
+        return int(self.header[H_WRITE_SEQ])
+
+    def write(self, kind, sym, ts, price, qty, side):
+        seq = int(self.header[H_WRITE_SEQ])
+        self.records[seq % self.capacity] = (kind, side, sym, ts, price, qty)
+        self.header[H_WRITE_SEQ] = seq + 1
+
+    def read_since(self, seq: int):
+        """(records, next_seq, dropped): a copy of the intact records in [seq, write_seq).
+
+        The writer never waits for readers, so a reader close to a full lap
+        behind can have slots overwritten under it. After copying, write_seq
+        is read again: while the writer is at `w`, slot w % capacity may be
+        mid-write, so only records after w - capacity are kept and the rest
+        count as dropped.
+        """
+        end = self.write_seq
+        dropped = 0
+        if end - seq > self.capacity:
+            dropped = end - self.capacity - seq
+            seq = end - self.capacity
+        if seq >= end:
+            return self.records[:0].copy(), end, dropped
+
+        i, j = seq % self.capacity, end % self.capacity
+        if i < j:
+            out = self.records[i:j].copy()
+        else:
+            out = np.concatenate([self.records[i:], self.records[:j]])
+
+        first_safe = self.write_seq - self.capacity + 1
+        if first_safe > seq:
+            lost = min(first_safe - seq, len(out))
+            out = out[lost:]
+            dropped += lost
+        return out, end, dropped
+
+
+class _RingWriter:
+    def __init__(self, ring, symbols):
+        self.ring = ring
+        self.ids = {s.upper(): i for i, s in enumerate(symbols)}
+        self._lock = threading.Lock()
+
+    def on_trade(self, symbol_lc, data):
+        sid = self.ids.get(symbol_lc.upper())
+        price = data.get("p")
+        if sid is None or not price:
+            return
+        ts = int(data.get("T") or data.get("E") or 0)
+        side = -1 if data.get("m") else 1
+        with self._lock:
+            self.ring.write(TRADE, sid, ts, float(price), float(data.get("q") or 0.0), side)
+
+    def on_gap(self, sym, gap):
+        sid = self.ids.get(sym)
+        if sid is None:
+            return
+        with self._lock:
+            self.ring.write(GAP, sid, gap[0], float(gap[1]), 0.0, 0)
+
+
+def _attach(name):
+    # the parent created the segment and unlinks it in stop(): attach without
+    # registering it, or the resource tracker reports it as leaked at exit
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)   # Python 3.13+
+    except TypeError:
+        pass
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def _ingest_main(shm_name, capacity, symbols, engine, stop_event, urls):
+    from data.price_service import PriceService
+
+    # spawned: the child re-imports everything and starts from the defaults
+    endpoints.configure(**urls)
+
+    shm = _attach(shm_name)
+    ring = ShmTradeRing(shm.buf, capacity)
+    if int(ring.header[H_CAPACITY]) != capacity:
+        print("Shm ingest: ring capacity mismatch:", int(ring.header[H_CAPACITY]), "!=", capacity)
+        del ring
+        shm.close()
+        return
+    writer = _RingWriter(ring, symbols)
+
+    if engine == "asyncio":
+        try:
+            import websockets  # noqa: F401
+        except ImportError:
+            engine = "threads"
+
+    # sockets in this process publish gaps on this process's bus
+    market_bus.subscribe("trade_gap", callback=writer.on_gap)
+    service = PriceService(symbols, engine=engine, handlers={"trade": writer.on_trade})
+    service.start()
+
+    try:
+        while not stop_event.wait(0.1):
+            market_bus.dispatch()
+            ring.header[H_HEARTBEAT] = int(time.time() * 1000)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.stop()
+        del service, writer, ring
+        shm.close()
+
+
+class ShmIngestProcess:
+    """Trade ingestion in a child process, read back through a ShmTradeRing.
+
+    The child owns the sockets and decoding; poll() on the Tk thread copies
+    the new records out of shared memory in one slice, appends them to the
+    market_data trade rings in bulk and publishes "price" (last per symbol),
+    "trade" (only for symbols someone listens to) and "trade_gap" on market_bus.
+    """
+
+    def __init__(self, symbols, capacity: int = 1 << 16, engine: str = "asyncio"):
+        self.symbols = [s.upper() for s in symbols]
+        self.capacity = capacity
+        self.engine = engine
+
+        self.read_seq = 0
+        self.dropped = 0
+        self._shm = None
+        self._ring = None
+        self._proc = None
+        self._stop = None
+
+    def start(self):
+        if self._proc is not None:
+            return
+        self._shm = shared_memory.SharedMemory(create=True, size=ShmTradeRing.nbytes(self.capacity))
+        self._ring = ShmTradeRing(self._shm.buf, self.capacity)
+        self._ring.header[:] = 0
+        self._ring.header[H_CAPACITY] = self.capacity
+
+        # spawn, not fork: a forked child would inherit the Tk process's threads
+        # and its market_bus subscriptions, and dispatch() them itself
+        ctx = mp.get_context("spawn")
+        self._stop = ctx.Event()
+        self._proc = ctx.Process(
+            target=_ingest_main,
+            args=(self._shm.name, self.capacity, self.symbols, self.engine, self._stop, endpoints.as_dict()),
+            daemon=True,
+            name="shm-ingest",
+        )
+        self._proc.start()
+
+    def poll(self):
+        ring = self._ring
+        if ring is None:
+            return 0
+        recs, self.read_seq, dropped = ring.read_since(self.read_seq)
+        self.dropped += dropped
+        if len(recs):
+            self._deliver(recs)
+        return len(recs)
+
+    def _deliver(self, recs):
+        kinds = recs["kind"]
+        is_trade = kinds == TRADE
+        trades = recs if is_trade.all() else recs[is_trade]
+
+        if len(trades):
+            sids = trades["sym"]
+            single = bool((sids == sids[0]).all())
+            for sid in np.unique(sids):
+                sym = self.symbols[int(sid)]
+                rows = trades if single else trades[sids == sid]
+                market_data.record_trades(sym, rows["ts"], rows["price"], rows["qty"], rows["side"])
+                taker_volume.add_many(sym, rows["ts"], rows["price"] * rows["qty"], rows["side"])
+                market_bus.publish("price", sym, float(rows["price"][-1]))
+                if market_bus.has_subscribers("trade", sym):
+                    for ts, price, qty, side in zip(rows["ts"].tolist(), rows["price"].tolist(),
+                                                    rows["qty"].tolist(), rows["side"].tolist()):
+                        market_bus.publish("trade", sym, (ts, price, qty, side))
+
+        for rec in recs[kinds == GAP]:
+            market_bus.publish("trade_gap", self.symbols[int(rec["sym"])], (int(rec["ts"]), int(rec["price"])))
+
+    def health(self):
+        ring = self._ring
+        return {
+            "alive": bool(self._proc and self._proc.is_alive()),
+            "written": ring.write_seq if ring is not None else 0,
+            "read": self.read_seq,
+            "dropped": self.dropped,
+            "heartbeat_ms": int(ring.header[H_HEARTBEAT]) if ring is not None else 0,
+        }
+
+    def stop(self):
+        if self._proc is not None:
+            self._stop.set()
+            self._proc.join(timeout=2.0)
+            if self._proc.is_alive():
+                self._proc.terminate()
+            self._proc = None
+
+        if self._shm is not None:
+            self._ring = None
+            try:
+                self._shm.close()
+                self._shm.unlink()
+            except Exception:
+                pass
+            self._shm = None
@@ -1,17 +1,145 @@
 import json
+import random
 import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+
 import websocket
 
-from queues.price_queue import price_queue
-from queues.orderbook_queue import orderbook_queue
+from data.data_store import market_data
+from data.endpoints import endpoints
+from data.taker_volume import taker_volume
+from data.traffic_log import traffic_recorder
+from queues.market_bus import market_bus
+
+# Binance: max 1024 streams per connection
+MAX_STREAMS_PER_CONNECTION = 1024
+
+# connection states
+IDLE = "idle"
+CONNECTING = "connecting"
+CONNECTED = "connected"
+BACKOFF = "backoff"
+STOPPED = "stopped"
+
+
+def shard_streams(streams, limit=MAX_STREAMS_PER_CONNECTION):
+    streams = list(streams)
+    return [streams[i:i + limit] for i in range(0, len(streams), limit)]
+
+
+def gap_topics(streams):
+    """Sorted (topic, SYMBOL) pairs a gap on these streams is published under.
+
+    A trade stream gap lost trades ("trade_gap"); a depth stream gap only lost
+    book diffs ("depth_gap"), which the order book resyncs from on its own.
+    """
+    topics = set()
+    for stream in streams:
+        symbol_lc, _, event = stream.partition("@")
+        if event == "trade":
+            topics.add(("trade_gap", symbol_lc.upper()))
+        elif event.startswith("depth"):
+            topics.add(("depth_gap", symbol_lc.upper()))
+    return sorted(topics)
+
+
+def route_frame(handlers, payload):
+    """Dispatch one decoded combined-stream frame {"stream": ..., "data": ...}."""
+    stream = payload.get("stream")
+    data = payload.get("data")
+    if not stream or data is None:
+        # SUBSCRIBE / UNSUBSCRIBE replies
+        return False
+
+    symbol_lc, _, event = stream.partition("@")
+    handler = handlers.get(event)
+    if handler is None:
+        return False
+    handler(symbol_lc, data)
+    return True
+
+
+def handle_trade(symbol_lc, data):
+    sym = data.get("s")
+    price = data.get("p")
+    if sym and price:
+        price = float(price)
+        ts = int(data.get("T") or data.get("E") or 0)
+        qty = float(data.get("q") or 0.0)
+        buyer_is_maker = bool(data.get("m"))
+
+        market_data.record_trade(sym, ts, price, qty, buyer_is_maker)
+        taker_volume.add(sym, ts, price * qty, -1 if buyer_is_maker else 1)
+        market_bus.publish("price", sym, price)
+        market_bus.publish("trade", sym, (ts, price, qty, -1 if buyer_is_maker else 1))
+
+
+class ReconnectPolicy:
+    """Exponential backoff with jitter: delay(n) is in [d/2, d], d = min(cap, base * factor**n).
+
+    A connection that stayed up for `stable_s` resets the attempt counter.
+    """
+
+    def __init__(self, base_s=0.5, cap_s=30.0, factor=2.0, stable_s=10.0):
+        self.base_s = base_s
+        self.cap_s = cap_s
+        self.factor = factor
+        self.stable_s = stable_s
+
+    def delay(self, attempt):
+        d = min(self.cap_s, self.base_s * (self.factor ** attempt))
+        return d / 2 + random.uniform(0, d / 2)
+
 
+class ReconnectingSocket(ABC):
+    """Thread + run_forever loop shared by the stream clients.
 
-class BinancePriceSocket:
-    def __init__(self, symbol: str):
-        self.symbol = symbol.lower()
+    Tracks a small state machine (idle -> connecting -> connected -> backoff
+    -> connecting ... -> stopped), sleeps with jittered backoff between
+    attempts, and records data gaps: the time between the last frame before
+    a drop and the first frame after reconnecting. Each gap is kept in
+    `gaps` and published with (from_ms, to_ms) as ("trade_gap", SYMBOL) or
+    ("depth_gap", SYMBOL), per stream kind, so candle and volume aggregates
+    only repair holes where trades were actually lost.
+    """
+
+    name = "WS"
+
+    def __init__(self, policy=None):
+        self.policy = policy or ReconnectPolicy()
+        self.state = IDLE
+        self.reconnects = 0
+        self.last_error = None
+        self.connected_at = None
+        self.last_message_at = None
+        self.gaps = deque(maxlen=100)
+
+        self._gap_from = None
         self._ws = None
         self._thread = None
         self._stop = threading.Event()
+        self._wake = threading.Event()
+
+    @abstractmethod
+    def _url(self):
+        """Stream URL to (re)connect to."""
+
+    @abstractmethod
+    def _on_message(self, ws, msg):
+        """Decode one raw frame and hand it to the handlers."""
+
+    # optional hooks
+    def _gap_topics(self):
+        return []
+
+    def _on_open(self, ws):
+        pass
+
+    def _channel(self):
+        # stream name for the traffic log; "" when frames carry their own ("stream", "data")
+        return ""
 
     def start(self):
         if self._thread and self._thread.is_alive():
@@ -22,125 +150,185 @@ class BinancePriceSocket:
 
     def stop(self):
         self._stop.set()
+        self._wake.set()
+        self.state = STOPPED
         try:
             if self._ws is not None:
                 self._ws.close()
         except Exception:
             pass
 
+    def health(self):
+        now = time.time()
+        return {
+            "state": self.state,
+            "connected_for_s": (now - self.connected_at) if self.state == CONNECTED and self.connected_at else 0.0,
+            "last_message_age_s": (now - self.last_message_at) if self.last_message_at else None,
+            "reconnects": self.reconnects,
+            "gaps": len(self.gaps),
+            "last_error": self.last_error,
+        }
+
     def _run(self):
-        url = f"wss://stream.binance.com:9443/ws/{self.symbol}@trade"
-
-        ws = websocket.WebSocketApp(
-            url,
-            on_open=self._on_open,
-            on_message=self._on_message,
-            on_error=self._on_error,
-            on_close=self._on_close,
-        )
-        self._ws = ws
-
-        # loop แบบสั้น ๆ เพื่อให้ stop ได้
+        attempt = 0
         while not self._stop.is_set():
+            url = self._url()
+            if url is None:
+                # nothing to stream yet
+                self.state = IDLE
+                self._wake.wait()
+                self._wake.clear()
+                continue
+
+            self.state = CONNECTING
+            self.connected_at = None
+            ws = websocket.WebSocketApp(
+                url,
+                on_open=self._handle_open,
+                on_message=self._handle_message,
+                on_error=self._handle_error,
+                on_close=self._handle_close,
+            )
+            self._ws = ws
+
             try:
                 ws.run_forever(ping_interval=20, ping_timeout=10)
-            except Exception:
-                pass
-            if not self._stop.is_set():
-                # ถ้าหลุดเอง ให้ต่อใหม่
-                continue
-            break
+            except Exception as e:
+                self.last_error = repr(e)
 
-    def _on_open(self, ws):
-        # print("WS open:", self.symbol)
-        pass
+            self._mark_disconnected()
+            if self._stop.is_set():
+                break
 
-    def _on_error(self, ws, err):
-        if not self._stop.is_set():
-            print("WS error:", self.symbol, err)
+            if self.connected_at and time.time() - self.connected_at >= self.policy.stable_s:
+                attempt = 0
 
-    def _on_close(self, ws, code, msg):
-        # print("WS close:", self.symbol, code, msg)
-        pass
+            self.state = BACKOFF
+            self._stop.wait(self.policy.delay(attempt))
+            attempt += 1
+            self.reconnects += 1
 
-    def _on_message(self, ws, msg):
+        self.state = STOPPED
+
+    def _mark_disconnected(self):
+        if self._gap_from is None and self.last_message_at is not None:
+            self._gap_from = self.last_message_at
+
+    def _handle_open(self, ws):
+        self.state = CONNECTED
+        self.connected_at = time.time()
+        self._on_open(ws)
+
+    def _handle_message(self, ws, msg):
         if self._stop.is_set():
             return
 
-        data = json.loads(msg)
-        sym = data.get("s")
-        price = data.get("p")
-        if sym and price:
-            price_queue.put((sym, float(price)))
+        now = time.time()
+        if self._gap_from is not None:
+            gap = (int(self._gap_from * 1000), int(now * 1000))
+            self._gap_from = None
+            self.gaps.append(gap)
+            for topic, sym in self._gap_topics():
+                market_bus.publish(topic, sym, gap)
+        self.last_message_at = now
 
+        traffic_recorder.record_ws(self._channel(), msg)
+        self._on_message(ws, msg)
 
-class BinanceOrderBookSocket:
-    def __init__(self, symbol: str, levels: int = 10, interval_ms: int = 100):
-        self.symbol_lc = symbol.lower()
-        self.symbol_uc = symbol.upper()
-        self.levels = levels
-        self.interval_ms = interval_ms
+    def _handle_error(self, ws, err):
+        self.last_error = repr(err)
+        if not self._stop.is_set():
+            print(f"{self.name} error:", self._describe(), err)
 
-        self._ws = None
-        self._thread = None
-        self._stop = threading.Event()
+    def _handle_close(self, ws, code, msg):
+        if self.state == CONNECTED:
+            self.state = BACKOFF
+        self._mark_disconnected()
 
-    def start(self):
-        if self._thread and self._thread.is_alive():
-            return
-        self._stop.clear()
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+    def _describe(self):
+        return ""
 
-    def stop(self):
-        self._stop.set()
+
+class BinanceCombinedSocket(ReconnectingSocket):
+    """One connection to /stream?streams=a/b/c, frames routed by the `stream` field.
+
+    handlers maps the event part of a stream name ("trade", "depth10@100ms", ...)
+    to a callable(symbol_lc, data). subscribe()/unsubscribe() change the stream
+    set live with SUBSCRIBE/UNSUBSCRIBE messages; reconnects use the current set.
+    """
+
+    def __init__(self, streams, handlers, policy=None):
+        super().__init__(policy)
+        self.streams = list(streams)
+        self.handlers = dict(handlers)
+
+        self._lock = threading.Lock()
+        self._connected = False
+        self._url_streams = []
+        self._req_id = 0
+
+    def subscribe(self, streams):
+        with self._lock:
+            new = [s for s in streams if s not in self.streams]
+            self.streams.extend(new)
+            live = self._connected
+        if new and live:
+            self._send("SUBSCRIBE", new)
+        self._wake.set()
+
+    def unsubscribe(self, streams):
+        with self._lock:
+            gone = [s for s in streams if s in self.streams]
+            for s in gone:
+                self.streams.remove(s)
+            live = self._connected
+        if gone and live:
+            self._send("UNSUBSCRIBE", gone)
+
+    def _send(self, method, params):
+        with self._lock:
+            self._req_id += 1
+            req_id = self._req_id
         try:
-            if self._ws is not None:
-                self._ws.close()
-        except Exception:
-            pass
+            self._ws.send(json.dumps({"method": method, "params": params, "id": req_id}))
+        except Exception as e:
+            print("WS send error:", method, e)
 
-    def _run(self):
-        url = f"wss://stream.binance.com:9443/ws/{self.symbol_lc}@depth{self.levels}@{self.interval_ms}ms"
+    def _url(self):
+        with self._lock:
+            streams = list(self.streams)
+            self._url_streams = streams
+        if not streams:
+            return None
+        return f"{endpoints.stream}/stream?streams=" + "/".join(streams)
 
-        ws = websocket.WebSocketApp(
-            url,
-            on_open=self._on_open,
-            on_message=self._on_message,
-            on_error=self._on_error,
-            on_close=self._on_close,
-        )
-        self._ws = ws
+    def _gap_topics(self):
+        with self._lock:
+            return gap_topics(self.streams)
 
-        while not self._stop.is_set():
-            try:
-                ws.run_forever(ping_interval=20, ping_timeout=10)
-            except Exception:
-                pass
-            if not self._stop.is_set():
-                continue
-            break
+    def _describe(self):
+        return f"{len(self.streams)} streams"
 
     def _on_open(self, ws):
-        # print("OB open:", self.symbol_lc)
-        pass
+        # streams may have changed while connecting: reconcile with the URL set
+        with self._lock:
+            add = [s for s in self.streams if s not in self._url_streams]
+            remove = [s for s in self._url_streams if s not in self.streams]
+            self._connected = True
+        if add:
+            self._send("SUBSCRIBE", add)
+        if remove:
+            self._send("UNSUBSCRIBE", remove)
 
-    def _on_error(self, ws, err):
-        if not self._stop.is_set():
-            print("OB error:", self.symbol_lc, err)
+    def _handle_close(self, ws, code, msg):
+        with self._lock:
+            self._connected = False
+        super()._handle_close(ws, code, msg)
 
-    def _on_close(self, ws, code, msg):
-        # print("OB close:", self.symbol_lc, code, msg)
-        pass
+    def _mark_disconnected(self):
+        with self._lock:
+            self._connected = False
+        super()._mark_disconnected()
 
     def _on_message(self, ws, msg):
-        if self._stop.is_set():
-            return
-
-        data = json.loads(msg)
-        bids = data.get("b") or data.get("bids") or []
-        asks = data.get("a") or data.get("asks") or []
-        sym = data.get("s") or self.symbol_uc
-
-        if bids or asks:
-            orderbook_queue.put((sym, bids, asks))
+        route_frame(self.handlers, json.loads(msg))
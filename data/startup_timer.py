@@ -0,0 +1,45 @@
+import time
+from contextlib import contextmanager
+
+_T0 = time.perf_counter()
+
+
+class StartupTimer:
+    """Wall-clock marks from the first import of this module to first paint.
+
+    mark(label) records the time since the previous mark; timed(label) wraps
+    work that happens later (lazy pages) so it shows up in the same report.
+    """
+
+    def __init__(self, t0=None):
+        self.t0 = _T0 if t0 is None else t0
+        self.marks = []   # (label, duration_s, at_s)
+        self._last = self.t0
+
+    def mark(self, label):
+        now = time.perf_counter()
+        self.marks.append((label, now - self._last, now - self.t0))
+        self._last = now
+
+    @contextmanager
+    def timed(self, label):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            self.marks.append((label, now - start, now - self.t0))
+            self._last = now
+
+    def elapsed(self):
+        return time.perf_counter() - self.t0
+
+    def report(self, title="Startup"):
+        width = max((len(m[0]) for m in self.marks), default=0)
+        lines = [f"{title}: {self.elapsed() * 1000:.0f} ms"]
+        for label, dt, at in self.marks:
+            lines.append(f"  {label:<{width}}  {dt * 1000:8.1f} ms   (at {at * 1000:.0f} ms)")
+        return "\n".join(lines)
+
+
+startup_timer = StartupTimer()
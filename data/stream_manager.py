@@ -0,0 +1,74 @@
+import threading
+import time
+
+from data.socket_client import BinanceCombinedSocket
+
+
+class StreamManager:
+    """Reference-counted streams over one shared combined connection.
+
+    acquire() subscribes on the first reference; release() of the last one
+    only schedules an UNSUBSCRIBE after `grace_s`, so flipping back and forth
+    between pages does not churn subscriptions. sweep() applies due releases.
+    """
+
+    def __init__(self, handlers, grace_s: float = 15.0, on_unsubscribed=None):
+        self.grace_s = grace_s
+        self.on_unsubscribed = on_unsubscribed
+        self.socket = BinanceCombinedSocket([], handlers)
+
+        self._refs = {}
+        self._release_at = {}
+        self._lock = threading.Lock()
+        self._started = False
+
+    def acquire(self, stream):
+        with self._lock:
+            self._refs[stream] = self._refs.get(stream, 0) + 1
+            pending = self._release_at.pop(stream, None)
+            fresh = self._refs[stream] == 1 and pending is None
+
+        if fresh:
+            self.socket.subscribe([stream])
+            if not self._started:
+                self._started = True
+                self.socket.start()
+        return fresh
+
+    def release(self, stream):
+        with self._lock:
+            if stream not in self._refs:
+                # no matching acquire (or already released): nothing to unsubscribe
+                return
+            n = self._refs[stream] - 1
+            if n > 0:
+                self._refs[stream] = n
+                return
+            self._refs.pop(stream, None)
+            self._release_at[stream] = time.monotonic() + self.grace_s
+
+    def is_active(self, stream):
+        with self._lock:
+            return stream in self._refs or stream in self._release_at
+
+    def sweep(self):
+        now = time.monotonic()
+        with self._lock:
+            due = [s for s, t in self._release_at.items() if t <= now]
+            for s in due:
+                del self._release_at[s]
+        if not due:
+            return []
+
+        # one UNSUBSCRIBE for the whole batch
+        self.socket.unsubscribe(due)
+        if self.on_unsubscribed is not None:
+            for s in due:
+                self.on_unsubscribed(s)
+        return due
+
+    def stop(self):
+        self.socket.stop()
+        with self._lock:
+            self._refs.clear()
+            self._release_at.clear()
@@ -0,0 +1,217 @@
+import threading
+
+from data.kline_cache import COL
+from data.kline_client import fetch_kline_arrays
+from data.rest_client import rest_client
+from data.traffic_log import replay_clock
+
+KLINE_MS = 60_000
+
+# (name, span_ms, bucket_ms): a window's edge is exact to one bucket
+WINDOWS = (
+    ("1m", 60_000, 1_000),
+    ("5m", 300_000, 5_000),
+    ("1h", 3_600_000, KLINE_MS),
+    ("24h", 86_400_000, KLINE_MS),
+)
+
+
+class _BucketWindow:
+    """Sliding sum of taker buy / sell quote volume over fixed time buckets.
+
+    Buckets live in a ring indexed by absolute bucket number; moving the head
+    forward clears the buckets that fall out and subtracts them from the
+    running totals, so add() and totals() are O(1) amortized.
+    """
+
+    def __init__(self, span_ms: int, bucket_ms: int):
+        self.bucket_ms = bucket_ms
+        self.n = span_ms // bucket_ms
+        self.buy = [0.0] * self.n
+        self.sell = [0.0] * self.n
+        self.buy_total = 0.0
+        self.sell_total = 0.0
+        self.head = None      # absolute number of the newest bucket
+        self._advanced = 0
+
+    def advance(self, b: int):
+        if self.head is None:
+            self.head = b
+            return
+        steps = b - self.head
+        if steps <= 0:
+            return
+
+        if steps >= self.n:
+            self.buy = [0.0] * self.n
+            self.sell = [0.0] * self.n
+            self.buy_total = self.sell_total = 0.0
+        else:
+            for j in range(self.head + 1, b + 1):
+                s = j % self.n
+                self.buy_total -= self.buy[s]
+                self.sell_total -= self.sell[s]
+                self.buy[s] = self.sell[s] = 0.0
+
+            # re-sum once per full turn so float drift cannot build up
+            self._advanced += steps
+            if self._advanced >= self.n:
+                self._advanced = 0
+                self.buy_total = sum(self.buy)
+                self.sell_total = sum(self.sell)
+        self.head = b
+
+    def _slot(self, ts: int):
+        b = ts // self.bucket_ms
+        self.advance(b)
+        if b <= self.head - self.n:
+            return None   # older than the window
+        return b % self.n
+
+    def add(self, ts: int, buy: float, sell: float):
+        s = self._slot(ts)
+        if s is None:
+            return
+        self.buy[s] += buy
+        self.sell[s] += sell
+        self.buy_total += buy
+        self.sell_total += sell
+
+    def set(self, ts: int, buy: float, sell: float):
+        s = self._slot(ts)
+        if s is None:
+            return
+        self.buy_total += buy - self.buy[s]
+        self.sell_total += sell - self.sell[s]
+        self.buy[s] = buy
+        self.sell[s] = sell
+
+    def totals(self, now_ms: int):
+        self.advance(now_ms // self.bucket_ms)
+        return max(self.buy_total, 0.0), max(self.sell_total, 0.0)
+
+
+class TakerVolume:
+    """Rolling taker buy / sell quote volume of one symbol over WINDOWS."""
+
+    def __init__(self):
+        self.windows = {name: _BucketWindow(span, bucket) for name, span, bucket in WINDOWS}
+        self.first_live_ms = None   # first trade seen on the stream
+        self.fine_seeded_ms = 0     # sub-minute windows hold kline bars before this
+        self.seeded = False
+
+    def add(self, ts: int, quote: float, side: int):
+        if self.first_live_ms is None:
+            self.first_live_ms = ts
+        buy = quote if side > 0 else 0.0
+        sell = quote - buy
+        for w in self.windows.values():
+            w.add(ts, buy, sell)
+
+    def seed(self, k, now_ms: int):
+        """Fill the windows from 1m klines (taker_buy_quote / quote_volume).
+
+        Closed bars replace whole-minute buckets, which makes reseeding after
+        a stream gap exact for 1h / 24h. Windows with finer buckets only take
+        bars that ended before the first live trade, so nothing is counted
+        twice.
+        """
+        t = k[COL["open_time"]]
+        closed = t + KLINE_MS <= now_ms
+        live_from = self.first_live_ms if self.first_live_ms is not None else now_ms
+
+        opens = t[closed].astype("int64").tolist()
+        buys = k[COL["taker_buy_quote"], closed].tolist()
+        quotes = k[COL["quote_volume"], closed].tolist()
+
+        fine_until = self.fine_seeded_ms
+        for open_ms, buy, quote in zip(opens, buys, quotes):
+            sell = max(quote - buy, 0.0)
+            for w in self.windows.values():
+                if w.bucket_ms == KLINE_MS:
+                    w.set(open_ms, buy, sell)
+                elif open_ms >= self.fine_seeded_ms and open_ms + KLINE_MS <= live_from:
+                    w.add(open_ms, buy, sell)
+                    fine_until = max(fine_until, open_ms + KLINE_MS)
+
+        self.fine_seeded_ms = fine_until
+        self.seeded = True
+
+    def totals(self, now_ms: int):
+        return {name: w.totals(now_ms) for name, w in self.windows.items()}
+
+
+class TakerVolumeBook:
+    """TakerVolume per symbol, fed from the trade stream (buyer-is-maker flag).
+
+    Trades arrive on socket threads (or in bulk from the shared-memory ring);
+    ensure_seeded() loads 24h of 1m klines once per symbol off the Tk thread,
+    and on_gap() reseeds a symbol whose stream dropped trades.
+    """
+
+    def __init__(self):
+        self.symbols = {}
+        self._lock = threading.Lock()
+        self._seeding = set()
+
+    def _get(self, symbol):
+        tv = self.symbols.get(symbol)
+        if tv is None:
+            tv = self.symbols[symbol] = TakerVolume()
+        return tv
+
+    def add(self, symbol: str, ts: int, quote: float, side: int):
+        with self._lock:
+            self._get(symbol.upper()).add(ts, quote, side)
+
+    def add_many(self, symbol: str, ts, quote, side):
+        with self._lock:
+            tv = self._get(symbol.upper())
+            for t, q, s in zip(ts.tolist(), quote.tolist(), side.tolist()):
+                tv.add(t, q, s)
+
+    def totals(self, symbol: str, now_ms=None):
+        """{window: (buy_quote, sell_quote)}; None until the symbol has any data."""
+        if now_ms is None:
+            now_ms = replay_clock.now_ms()
+        with self._lock:
+            tv = self.symbols.get(symbol.upper())
+            return tv.totals(now_ms) if tv is not None else None
+
+    def is_seeded(self, symbol: str) -> bool:
+        tv = self.symbols.get(symbol.upper())
+        return tv is not None and tv.seeded
+
+    def ensure_seeded(self, symbol: str):
+        symbol = symbol.upper()
+        if not self.is_seeded(symbol):
+            self._request_seed(symbol)
+
+    def on_gap(self, symbol, gap):
+        if self.is_seeded(symbol):
+            self._request_seed(symbol.upper())
+
+    def _request_seed(self, symbol):
+        if symbol in self._seeding:
+            return
+        self._seeding.add(symbol)
+        rest_client.call(
+            fetch_kline_arrays,
+            symbol,
+            interval="1m",
+            limit=1440,
+            on_done=lambda k: self._on_klines(symbol, k),
+            on_error=lambda e: self._on_seed_error(symbol, e),
+        )
+
+    def _on_klines(self, symbol, k):
+        self._seeding.discard(symbol)
+        with self._lock:
+            self._get(symbol).seed(k, replay_clock.now_ms())
+
+    def _on_seed_error(self, symbol, e):
+        self._seeding.discard(symbol)
+        print("Taker volume seed error:", symbol, e)
+
+
+taker_volume = TakerVolumeBook()
@@ -0,0 +1,80 @@
+import json
+import threading
+import time
+
+from data.rest_client import rest_client
+from queues.market_bus import market_bus
+
+TICKER_PATH = "/api/v3/ticker/24hr"
+
+
+class TickerService:
+    """24h ticker stats for the whole watchlist with one request per refresh.
+
+    Uses /api/v3/ticker/24hr?symbols=[...]; the latest snapshot is cached and
+    each symbol is published as ("ticker", SYMBOL) with the raw ticker dict.
+    """
+
+    def __init__(self, symbols, refresh_s: float = 5.0, ttl_s: float = 15.0):
+        self.symbols = [s.upper() for s in symbols]
+        self.refresh_s = refresh_s
+        self.ttl_s = ttl_s
+
+        self.snapshot = {}
+        self.fetched_at = 0.0
+
+        self._thread = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def add_symbol(self, symbol):
+        symbol = symbol.upper()
+        if symbol not in self.symbols:
+            self.symbols.append(symbol)
+            self._wake.set()
+
+    def get(self, symbol):
+        # None when missing or older than the TTL
+        if time.time() - self.fetched_at > self.ttl_s:
+            return None
+        return self.snapshot.get(symbol.upper())
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                if not self._stop.is_set():
+                    print("Ticker error:", e)
+
+            self._wake.wait(self.refresh_s)
+            self._wake.clear()
+
+    def refresh(self):
+        symbols = list(self.symbols)
+        if not symbols:
+            return
+
+        rows = rest_client.get_json(
+            TICKER_PATH,
+            params={"symbols": json.dumps(symbols, separators=(",", ":"))},
+            timeout=3.0,
+        )
+
+        snapshot = {row["symbol"]: row for row in rows if "symbol" in row}
+        self.snapshot = snapshot
+        self.fetched_at = time.time()
+
+        for sym, row in snapshot.items():
+            market_bus.publish("ticker", sym, row)
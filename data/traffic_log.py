@@ -0,0 +1,269 @@
+import gzip
+import json
+import threading
+import time
+from pathlib import Path
+
+# one record per line: "<receive time s>\t<kind>\t<channel>\t<raw payload>\n"
+#   kind "ws":   channel is "" for combined-stream frames ({"stream", "data"}),
+#                or the stream name for single-stream sockets
+#   kind "rest": channel is the request path, payload {"params": ..., "body": ...}
+WS = "ws"
+REST = "rest"
+
+
+class TrafficRecorder:
+    """Append-only, gzip-compressed log of raw WebSocket frames and REST replies.
+
+    Socket threads call record_ws() with the frame exactly as received; lines
+    are buffered and written in chunks, each start() appends a new gzip member
+    so one file can hold several sessions. Off (and free) until start().
+    """
+
+    def __init__(self, flush_lines: int = 512, flush_s: float = 1.0):
+        self.flush_lines = flush_lines
+        self.flush_s = flush_s
+        self.path = None
+        self.records = 0
+
+        self._file = None
+        self._buf = []
+        self._last_flush = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def active(self):
+        return self._file is not None
+
+    def start(self, path):
+        with self._lock:
+            if self._file is not None:
+                return
+            self.path = Path(path)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = gzip.open(self.path, "ab")
+            self._last_flush = time.time()
+
+    def stop(self):
+        with self._lock:
+            if self._file is None:
+                return
+            self._flush_locked()
+            self._file.close()
+            self._file = None
+
+    def record_ws(self, channel, raw):
+        if self._file is not None:
+            if isinstance(raw, bytes):
+                raw = raw.decode("utf-8")
+            self._append(WS, channel or "", raw)
+
+    def record_rest(self, path, params, body):
+        if self._file is not None:
+            self._append(REST, path, json.dumps({"params": params, "body": body}, separators=(",", ":")))
+
+    def _append(self, kind, channel, payload):
+        now = time.time()
+        line = f"{now:.6f}\t{kind}\t{channel}\t{payload}\n"
+        with self._lock:
+            if self._file is None:
+                return
+            self._buf.append(line)
+            self.records += 1
+            if len(self._buf) >= self.flush_lines or now - self._last_flush >= self.flush_s:
+                self._flush_locked()
+
+    def _flush_locked(self):
+        if self._buf:
+            self._file.write("".join(self._buf).encode("utf-8"))
+            self._buf = []
+        self._file.flush()
+        self._last_flush = time.time()
+
+
+def read_log(path):
+    """Yield (t, kind, channel, payload) from a traffic log.
+
+    A log cut off by a crash ends in an incomplete gzip member; everything up
+    to the last complete line is still returned.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        while True:
+            try:
+                line = f.readline()
+            except (EOFError, OSError):
+                return
+            if not line:
+                return
+            if not line.endswith("\n"):
+                return
+            t, kind, channel, payload = line.rstrip("\n").split("\t", 3)
+            yield float(t), kind, channel, payload
+
+
+class ReplayClock:
+    """Market time in ms: the wall clock, or the recorded time during a replay.
+
+    ReplayDriver moves it to each frame's receive time, so windows that age
+    out by "now" (taker volume, the newest kline served) follow the log
+    instead of dropping every replayed trade as stale.
+    """
+
+    def __init__(self):
+        self._offset_ms = None
+
+    @property
+    def active(self):
+        return self._offset_ms is not None
+
+    def now_ms(self) -> int:
+        now = time.time() * 1000
+        if self._offset_ms is None:
+            return int(now)
+        return int(now + self._offset_ms)
+
+    def follow(self, recorded_s: float):
+        self._offset_ms = (recorded_s - time.time()) * 1000
+
+    def reset(self):
+        self._offset_ms = None
+
+
+class KlineReplay:
+    """Serves recorded /klines replies while a replay is loaded.
+
+    Requests are matched on (symbol, interval); startTime / endTime / limit
+    are applied to the union of the recorded rows, and a request without
+    endTime ends at the replay clock. kline_client skips the disk cache while
+    a replay is loaded, so the chart only ever sees recorded bars.
+    """
+
+    def __init__(self):
+        self.rows = None   # (SYMBOL, interval) -> {open_time: row}
+
+    @property
+    def active(self):
+        return self.rows is not None
+
+    def load(self, records):
+        rows = {}
+        for _, kind, channel, payload in records:
+            if kind != REST or not channel.endswith("/klines"):
+                continue
+            rec = json.loads(payload)
+            params = rec.get("params") or {}
+            key = (str(params.get("symbol", "")).upper(), params.get("interval"))
+            bucket = rows.setdefault(key, {})
+            for row in rec.get("body") or []:
+                bucket[int(row[0])] = row
+        self.rows = rows
+
+    def unload(self):
+        self.rows = None
+
+    def klines(self, params):
+        bucket = self.rows.get((str(params.get("symbol", "")).upper(), params.get("interval")), {})
+        start = params.get("startTime")
+        end = params.get("endTime")
+        if end is None:
+            end = replay_clock.now_ms()
+        limit = int(params.get("limit") or 500)
+
+        out = [bucket[t] for t in sorted(bucket)
+               if (start is None or t >= start) and (end is None or t <= end)]
+        return out[:limit] if start is not None else out[-limit:]
+
+
+class ReplayDriver:
+    """Feeds a traffic log back through the live handlers.
+
+    speed=1.0 keeps the recorded timing, N plays N times faster, None plays
+    as fast as the handlers take it. WebSocket frames go through route_frame()
+    with the given handlers (default: handle_trade), recorded kline replies
+    are served to kline_client through kline_replay and replay_clock keeps
+    the recorded time. Same start / poll / health / stop interface as
+    PriceService, so App can run on a log.
+    """
+
+    def __init__(self, path, handlers=None, speed=1.0):
+        from data.socket_client import handle_trade
+
+        self.path = Path(path)
+        self.handlers = handlers or {"trade": handle_trade}
+        self.speed = speed
+
+        self.frames = 0
+        self.skipped = 0
+        self.elapsed_s = 0.0
+        self.done = threading.Event()
+
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        kline_replay.load(read_log(self.path))
+        for t, _, _, _ in read_log(self.path):
+            replay_clock.follow(t)
+            break
+        self._stop.clear()
+        self.done.clear()
+        self._thread = threading.Thread(target=self.run, daemon=True, name="replay")
+        self._thread.start()
+
+    def run(self):
+        """Replay the whole log on the calling thread; returns frames delivered."""
+        from data.socket_client import route_frame
+
+        handlers = self.handlers
+        speed = self.speed
+        wall0 = time.perf_counter()
+        t0 = None
+        try:
+            for t, kind, channel, payload in read_log(self.path):
+                if self._stop.is_set():
+                    break
+                if kind != WS:
+                    continue
+
+                if speed:
+                    if t0 is None:
+                        t0 = t
+                    delay = (t - t0) / speed - (time.perf_counter() - wall0)
+                    if delay > 0 and self._stop.wait(delay):
+                        break
+
+                replay_clock.follow(t)
+                data = json.loads(payload)
+                if channel:
+                    data = {"stream": channel, "data": data}
+                if route_frame(handlers, data):
+                    self.frames += 1
+                else:
+                    self.skipped += 1
+        finally:
+            self.elapsed_s = time.perf_counter() - wall0
+            self.done.set()
+        return self.frames
+
+    def poll(self):
+        return 0
+
+    def health(self):
+        return {
+            "state": "done" if self.done.is_set() else "replaying",
+            "frames": self.frames,
+            "skipped": self.skipped,
+            "speed": self.speed,
+        }
+
+    def stop(self):
+        self._stop.set()
+        kline_replay.unload()
+        replay_clock.reset()
+
+
+traffic_recorder = TrafficRecorder()
+replay_clock = ReplayClock()
+kline_replay = KlineReplay()
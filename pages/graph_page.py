@@ -1,16 +1,15 @@
 import tkinter as tk
-import queue
-import requests
 
 from data.data_store import market_data
-from queues.orderbook_queue import orderbook_queue
-from data.socket_client import BinanceOrderBookSocket
+from data.taker_volume import taker_volume
+from queues.market_bus import market_bus, LATEST
 
 from ui.header_panel import HeaderPanel
 from ui.candlestick_chart import CandlestickChart
 from ui.stats_panel import StatsPanel
 from ui.volume_panel import VolumePanel
 from ui.orderbook_panel import OrderBookPanel
+from ui.trades_panel import RecentTradesPanel
 
 
 class GraphPage(tk.Frame):
@@ -22,7 +21,14 @@ class GraphPage(tk.Frame):
         self.base, self.quote = self._split_symbol(self.symbol)
 
         self._last_price = None
-        self._ob_sockets = {}
+        self._ticker = None
+        self.orderbook_service = self.controller.orderbook_service
+        self._book_sub = None
+        self._book_symbol = None    # symbol whose depth stream we hold
+        self._book_top = None       # last (bids, asks) published for it
+        self._visible = False
+        self._trades_seen = -1      # TickRing.count at the last trades render
+        self.scheduler = self.controller.scheduler
 
         self.header = HeaderPanel(self, on_back=lambda: self.controller.show_page("MainPage"))
         self.header.pack(fill="x", padx=24, pady=(16, 8))
@@ -33,8 +39,9 @@ class GraphPage(tk.Frame):
         self._btn_stats = tk.Button(self.toggle_bar, text="Stats", command=lambda: self._toggle_panel("stats"))
         self._btn_ob = tk.Button(self.toggle_bar, text="Order Book", command=lambda: self._toggle_panel("orderbook"))
         self._btn_vol = tk.Button(self.toggle_bar, text="Volume", command=lambda: self._toggle_panel("volume"))
+        self._btn_trades = tk.Button(self.toggle_bar, text="Trades", command=lambda: self._toggle_panel("trades"))
 
-        for b in (self._btn_stats, self._btn_ob, self._btn_vol):
+        for b in (self._btn_stats, self._btn_ob, self._btn_vol, self._btn_trades):
             b.configure(
                 bg="#151823",
                 fg="white",
@@ -56,25 +63,36 @@ class GraphPage(tk.Frame):
         body.rowconfigure(0, weight=4, minsize=360)
         body.rowconfigure(1, weight=2)
 
-        self.chart_panel = CandlestickChart(body, on_hover=self._on_chart_hover)
+        self.chart_panel = CandlestickChart(
+            body, on_hover=self._on_chart_hover, scheduler=self.scheduler, page="GraphPage"
+        )
         self.chart_panel.grid(row=0, column=0, sticky="nsew", padx=(0, 12), pady=(0, 12))
 
         self.stats_panel = StatsPanel(body)
         self.stats_panel.grid(row=0, column=1, sticky="nsew", pady=(0, 12))
 
-        self.orderbook_panel = OrderBookPanel(body, rows=10)
-        self.orderbook_panel.grid(row=1, column=0, sticky="nsew", padx=(0, 12))
+        lower = tk.Frame(body, bg="#0f111a")
+        lower.grid(row=1, column=0, sticky="nsew", padx=(0, 12))
+        lower.columnconfigure(0, weight=1)
+        lower.columnconfigure(1, weight=1)
+        lower.rowconfigure(0, weight=1)
 
-        self.volume_panel = VolumePanel(body)
+        self.orderbook_panel = OrderBookPanel(lower, rows=10)
+        self.orderbook_panel.grid(row=0, column=0, sticky="nsew", padx=(0, 12))
+
+        self.trades_panel = RecentTradesPanel(lower, rows=12)
+        self.trades_panel.grid(row=0, column=1, sticky="nsew")
+
+        self.volume_panel = VolumePanel(body, on_window=lambda w: self._refresh_volume())
         self.volume_panel.grid(row=1, column=1, sticky="nsew")
 
         self._apply_panel_visibility_from_settings()
 
         self.set_symbol(self.symbol)
 
-        self.after(200, self._refresh_header_price)
-        self.after(100, self._poll_orderbook)
-        self.after(2000, self._refresh_ticker_stats)
+        self.scheduler.every(500, self._refresh_header_price, page="GraphPage")
+        self.scheduler.every(1000, self._refresh_volume, page="GraphPage")
+        self.scheduler.every(0, self._poll_trades, page="GraphPage")
 
     def _split_symbol(self, symbol):
         s = symbol.upper()
@@ -84,10 +102,13 @@ class GraphPage(tk.Frame):
         return s, "USDT"
 
     def _get_panels_cfg(self):
-        cfg = self.controller.app_config.setdefault("panels", {"stats": True, "orderbook": True, "volume": True})
+        cfg = self.controller.app_config.setdefault(
+            "panels", {"stats": True, "orderbook": True, "volume": True, "trades": True}
+        )
         cfg.setdefault("stats", True)
         cfg.setdefault("orderbook", True)
         cfg.setdefault("volume", True)
+        cfg.setdefault("trades", True)
         return cfg
 
     def _apply_panel_visibility_from_settings(self):
@@ -95,6 +116,7 @@ class GraphPage(tk.Frame):
         self._set_panel_visible("stats", cfg.get("stats", True))
         self._set_panel_visible("orderbook", cfg.get("orderbook", True))
         self._set_panel_visible("volume", cfg.get("volume", True))
+        self._set_panel_visible("trades", cfg.get("trades", True))
         self._update_toggle_button_styles()
 
     def _set_panel_visible(self, name, visible: bool):
@@ -104,6 +126,8 @@ class GraphPage(tk.Frame):
             w = self.orderbook_panel
         elif name == "volume":
             w = self.volume_panel
+        elif name == "trades":
+            w = self.trades_panel
         else:
             return
 
@@ -133,6 +157,7 @@ class GraphPage(tk.Frame):
         style(self._btn_stats, cfg.get("stats", True))
         style(self._btn_ob, cfg.get("orderbook", True))
         style(self._btn_vol, cfg.get("volume", True))
+        style(self._btn_trades, cfg.get("trades", True))
 
     def set_symbol(self, symbol):
         self.symbol = symbol.upper()
@@ -140,19 +165,60 @@ class GraphPage(tk.Frame):
 
         self.header.set_pair(self.base, self.quote)
         self.header.set_price("Loading...", color="white")
-        self.chart_panel.set_symbol(self.symbol, interval="1m")
+        self.chart_panel.set_symbol(self.symbol)
 
         self._last_price = None
-        self._ensure_orderbook_stream()
+        self._ensure_on_screen()
+
+        taker_volume.ensure_seeded(self.symbol)
+        self._refresh_volume()
+
+        self._trades_seen = -1
+        self._poll_trades()
+
+        # fill stats from the shared snapshot; fresh values arrive via on_ticker
+        ticker_service = self.controller.ticker_service
+        ticker_service.add_symbol(self.symbol)
+        self._ticker = ticker_service.get(self.symbol)
+        self._apply_ticker_stats()
 
-    def _ensure_orderbook_stream(self):
-        stream_symbol = self.symbol.lower()
-        if stream_symbol in self._ob_sockets:
+    def on_show(self):
+        self._visible = True
+        self._ensure_on_screen()
+
+    def on_hide(self):
+        self._visible = False
+        self._ensure_on_screen()
+
+    def _ensure_on_screen(self):
+        # deep trade history and a depth stream only for the symbol on screen
+        want = self.symbol if self._visible else None
+        market_data.set_focus(want)
+        if want == self._book_symbol:
             return
 
-        sock = BinanceOrderBookSocket(stream_symbol, levels=10, interval_ms=100)
-        sock.start()
-        self._ob_sockets[stream_symbol] = sock
+        if self._book_symbol is not None:
+            self.orderbook_service.release(self._book_symbol)
+            self._book_symbol = None
+        if self._book_sub is not None:
+            self._book_sub.close()
+            self._book_sub = None
+        self._book_top = None
+
+        if want is None:
+            return
+
+        # books for symbols nobody subscribes to are dropped at publish time
+        self._book_sub = market_bus.subscribe(
+            "book", want, callback=self._on_book, policy=LATEST
+        )
+        book = self.orderbook_service.acquire(want)
+        self._book_symbol = want
+
+        if book.synced:
+            self._on_book(want, book.top(self.orderbook_service.top_levels))
+        else:
+            self.orderbook_panel.render([], [])
 
     def on_price(self, symbol, price):
         if symbol.upper() != self.symbol:
@@ -179,23 +245,25 @@ class GraphPage(tk.Frame):
             self._last_price = price
             self.header.set_price(f"{prefix}{self.quote} {price:,.2f}", color=color)
 
-        self.after(500, self._refresh_header_price)
-
-    def _poll_orderbook(self):
-        latest = None
-        try:
-            while True:
-                sym, bids, asks = orderbook_queue.get_nowait()
-                if sym == self.symbol:
-                    latest = (bids, asks)
-        except queue.Empty:
-            pass
+    def _poll_trades(self):
+        # once per frame: however many trades arrived, redraw the fixed row pool once
+        ring = market_data.trade_ring(self.symbol, create=True)
+        if ring.count == self._trades_seen or not self._get_panels_cfg().get("trades", True):
+            return
+        self._trades_seen = ring.count
+        self.trades_panel.render(ring.last(self.trades_panel.rows))
 
-        if latest is not None:
-            bids, asks = latest
-            self.orderbook_panel.render(bids, asks)
+    def _on_book(self, sym, top):
+        if sym != self.symbol:
+            return
+        self._book_top = top
+        self.scheduler.mark_dirty("book", self._render_book, page="GraphPage")
 
-        self.after(100, self._poll_orderbook)
+    def _render_book(self):
+        if self._book_top is None:
+            return
+        bids, asks = self._book_top
+        self.orderbook_panel.render(bids, asks)
 
     def _to_float(self, v, default=0.0):
         try:
@@ -220,53 +288,49 @@ class GraphPage(tk.Frame):
             return f"{x/1_000:.2f}K"
         return f"{x:,.2f}"
 
-    def _refresh_ticker_stats(self):
-        url = "https://api.binance.com/api/v3/ticker/24hr"
+    def on_ticker(self, symbol, ticker):
+        if symbol != self.symbol:
+            return
+        self._ticker = ticker
+        self.scheduler.mark_dirty("ticker", self._apply_ticker_stats, page="GraphPage")
 
-        try:
-            r = requests.get(url, params={"symbol": self.symbol}, timeout=1.5)
-            r.raise_for_status()
-            data = r.json()
+    def _apply_ticker_stats(self):
+        data = self._ticker
+        if data is None:
+            self.stats_panel.set_ticker("-", "-", "-", "-")
+            return
 
+        try:
             change_pct = self._to_float(data.get("priceChangePercent"), 0.0)
             high = data.get("highPrice")
             low = data.get("lowPrice")
 
             quote_vol = self._to_float(data.get("quoteVolume"), 0.0)
 
-            buy_quote_direct = self._to_float(data.get("takerBuyQuoteVolume"), 0.0)
-            buy_base = self._to_float(data.get("takerBuyBaseVolume"), 0.0)
-            wavg = self._to_float(data.get("weightedAvgPrice"), 0.0)
-
-            buy_quote = buy_quote_direct
-            if buy_quote <= 0 and buy_base > 0 and wavg > 0:
-                buy_quote = buy_base * wavg
-
-            if buy_quote < 0:
-                buy_quote = 0.0
-
-            sell_quote = quote_vol - buy_quote
-            if sell_quote < 0:
-                sell_quote = 0.0
-
-            ratio = (buy_quote / sell_quote) if sell_quote > 0 else 0.0
-
             change_text = f"{change_pct:+.2f}%"
             high_text = f"{self.quote} {self._to_float(high, 0.0):,.2f}" if high is not None else "-"
             low_text = f"{self.quote} {self._to_float(low, 0.0):,.2f}" if low is not None else "-"
             vol_text = f"{self._fmt_compact(quote_vol)} {self.quote}"
             self.stats_panel.set_ticker(change_text, high_text, low_text, vol_text)
 
-            buy_text = f"{self._fmt_compact(buy_quote)} {self.quote}"
-            sell_text = f"{self._fmt_compact(sell_quote)} {self.quote}"
-            ratio_text = "-" if (buy_quote == 0 and sell_quote == 0) else f"{ratio:.2f}"
-            self.volume_panel.set_values(buy_text, sell_text, ratio_text)
-
         except Exception:
             self.stats_panel.set_ticker("-", "-", "-", "-")
+
+    def _refresh_volume(self):
+        # rolling taker buy / sell from the trade stream (seeded from 1m klines)
+        totals = taker_volume.totals(self.symbol)
+        window = self.volume_panel.window
+        if not totals or window not in totals:
             self.volume_panel.set_values("-", "-", "-")
+            return
 
-        self.after(2000, self._refresh_ticker_stats)
+        buy_quote, sell_quote = totals[window]
+        ratio = (buy_quote / sell_quote) if sell_quote > 0 else 0.0
+
+        buy_text = f"{self._fmt_compact(buy_quote)} {self.quote}"
+        sell_text = f"{self._fmt_compact(sell_quote)} {self.quote}"
+        ratio_text = "-" if (buy_quote == 0 and sell_quote == 0) else f"{ratio:.2f}"
+        self.volume_panel.set_values(buy_text, sell_text, ratio_text)
 
     def _on_chart_hover(self, close_price: float, pct: float):
         if close_price is None:
@@ -277,10 +341,7 @@ class GraphPage(tk.Frame):
         self.header.set_price(f"{self.quote} {close_price:,.2f}  ({sign_pct})", color=color)
 
     def on_close(self):
-        for s in list(self._ob_sockets.values()):
-            if hasattr(s, "stop"):
-                try:
-                    s.stop()
-                except Exception:
-                    pass
-        self._ob_sockets.clear()
+        self._visible = False
+        self._ensure_on_screen()
+
+        self.chart_panel.on_close()
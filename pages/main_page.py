@@ -4,6 +4,7 @@ from PIL import Image, ImageTk
 from datetime import datetime
 
 from data.data_store import market_data
+from ui.watchlist_table import WatchlistTable
 
 
 CRYPTO_ICON_FILES = {
@@ -26,6 +27,8 @@ class MainPage(tk.Frame):
 
         self._last_price = {}
         self._last_update = {}
+        self._last_ticker = {}
+        self.scheduler = self.controller.scheduler
 
         self._build_ui()
 
@@ -34,11 +37,15 @@ class MainPage(tk.Frame):
             ["BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT", "XRPUSDT"],
         )
 
-        self.rows = {}
-        for sym in watchlist[:5]:
-            self._add_row(sym.upper())
+        self.table.set_symbols(watchlist)
 
-        self.after(500, self._refresh_updated_texts)
+        # the page may be built after the first ticker refresh went out
+        for sym in self.table.symbols:
+            ticker = self.controller.ticker_service.get(sym)
+            if ticker:
+                self.on_ticker(sym, ticker)
+
+        self.scheduler.every(500, self._refresh_updated_texts, page="MainPage")
         self.refresh_prices()
 
     def _build_ui(self):
@@ -56,39 +63,15 @@ class MainPage(tk.Frame):
         self.card = tk.Frame(self, bg="#151823")
         self.card.pack(fill="both", expand=True, padx=28, pady=(0, 18))
 
-        self.table = tk.Frame(self.card, bg="#151823")
-        self.table.pack(fill="both", expand=True, padx=18, pady=16)
-
-        self.table.grid_columnconfigure(0, weight=4, minsize=360)
-        self.table.grid_columnconfigure(1, weight=2, minsize=160)
-        self.table.grid_columnconfigure(2, weight=2, minsize=160)
-        self.table.grid_columnconfigure(3, weight=2, minsize=200)
-        self.table.grid_columnconfigure(4, weight=1, minsize=120)
-
-        headers = [
-            ("Cryptocurrency", 0, "w"),
-            ("Updated", 1, "w"),
-            ("Change", 2, "w"),
-            ("Price", 3, "e"),
-            ("", 4, "e"),
-        ]
-        for text, c, stick in headers:
-            tk.Label(
-                self.table,
-                text=text,
-                bg="#151823",
-                fg="#9aa4c7",
-                font=("Segoe UI", 10, "bold"),
-            ).grid(row=0, column=c, sticky=stick, padx=10, pady=(0, 12))
-
-        tk.Frame(self.table, bg="#252a3d", height=1).grid(
-            row=1, column=0, columnspan=5, sticky="ew", padx=6, pady=(0, 10)
+        # one canvas + recycled row pool, so the watchlist can hold hundreds of symbols
+        self.table = WatchlistTable(
+            self.card,
+            self.scheduler,
+            page="MainPage",
+            on_select=self._open_graph,
+            icons=self._icons,
         )
-
-        self._next_row = 2
-
-        self.table.grid_rowconfigure(999, weight=1)
-        tk.Frame(self.table, bg="#151823").grid(row=999, column=0, columnspan=5, sticky="nsew")
+        self.table.pack(fill="both", expand=True, padx=18, pady=16)
 
     def _load_icons(self):
         for sym, rel in CRYPTO_ICON_FILES.items():
@@ -99,132 +82,57 @@ class MainPage(tk.Frame):
             else:
                 self._icons[sym] = None
 
-    def _cell(self, row, col, sticky="ew"):
-        cell = tk.Frame(self.table, bg="#1b1f2e")
-        cell.grid(row=row, column=col, sticky=sticky, padx=0, pady=10)
-        return cell
-
-    def _add_row(self, symbol):
-        r = self._next_row
-        self._next_row += 1
-
-        c0 = self._cell(r, 0, sticky="ew")
-        c0_in = tk.Frame(c0, bg="#1b1f2e")
-        c0_in.pack(fill="x", expand=True, padx=16, pady=18)
-
-        icon_box = tk.Frame(c0_in, bg="#1b1f2e", width=44, height=28)
-        icon_box.pack(side="left")
-        icon_box.pack_propagate(False)
-
-        icon = self._icons.get(symbol)
-        if icon:
-            lbl_icon = tk.Label(icon_box, image=icon, bg="#1b1f2e")
-            lbl_icon.image = icon
-            lbl_icon.place(relx=0.0, rely=0.5, anchor="w")
-
-        tk.Label(
-            c0_in,
-            text=symbol,
-            bg="#1b1f2e",
-            fg="white",
-            font=("Segoe UI", 12, "bold"),
-        ).pack(side="left", padx=(10, 0))
-
-        c1 = self._cell(r, 1, sticky="ew")
-        updated_lbl = tk.Label(
-            c1,
-            text="—",
-            bg="#1b1f2e",
-            fg="#9aa4c7",
-            font=("Segoe UI", 11),
-        )
-        updated_lbl.pack(anchor="w", padx=16, pady=18)
-
-        c2 = self._cell(r, 2, sticky="ew")
-        change_lbl = tk.Label(
-            c2,
-            text="—",
-            bg="#1b1f2e",
-            fg="#9aa4c7",
-            font=("Segoe UI", 11, "bold"),
-        )
-        change_lbl.pack(anchor="w", padx=16, pady=18)
-
-        c3 = self._cell(r, 3, sticky="ew")
-        price_lbl = tk.Label(
-            c3,
-            text="Loading...",
-            bg="#1b1f2e",
-            fg="white",
-            font=("Segoe UI", 12, "bold"),
-        )
-        price_lbl.pack(anchor="e", padx=16, pady=18)
-
-        c4 = self._cell(r, 4, sticky="ew")
-        btn = tk.Button(
-            c4,
-            text="View",
-            command=lambda s=symbol: self._open_graph(s),
-            bg="#0f111a",
-            fg="white",
-            activebackground="#0f111a",
-            activeforeground="white",
-            bd=0,
-            padx=16,
-            pady=8,
-            font=("Segoe UI", 10, "bold"),
-        )
-        btn.pack(anchor="e", padx=16, pady=16)
-
-        self.rows[symbol] = {
-            "price": price_lbl,
-            "updated": updated_lbl,
-            "change": change_lbl,
-        }
-
     def _open_graph(self, symbol):
         page = self.controller.pages.get("GraphPage")
-        if page and hasattr(page, "set_symbol"):
+        if page is None:
+            # first visit: the constructor loads the symbol
+            self.controller.get_page("GraphPage", symbol=symbol)
+        elif hasattr(page, "set_symbol"):
             page.set_symbol(symbol)
         self.controller.show_page("GraphPage")
 
     def refresh_prices(self):
-        for sym, widgets in self.rows.items():
+        for sym in self.table.symbols:
             price = market_data.prices.get(sym)
             if price is not None:
-                widgets["price"].config(text=f"{price:,.2f}")
+                self.table.set_price(sym, f"{price:,.2f}")
                 self._last_update[sym] = datetime.now()
 
     def update_price(self, symbol, price):
         symbol = symbol.upper()
-        market_data.prices[symbol] = price
-
-        widgets = self.rows.get(symbol)
-        if not widgets:
+        if symbol not in self.table.values:
             return
 
-        prev = self._last_price.get(symbol)
         self._last_price[symbol] = price
         self._last_update[symbol] = datetime.now()
+        # the table coalesces all row changes into one repaint per frame
+        self.table.set_price(symbol, f"{price:,.2f}")
+        self.table.set_updated(symbol, "just now")
 
-        widgets["price"].config(text=f"{price:,.2f}")
+    def on_ticker(self, symbol, ticker):
+        symbol = symbol.upper()
+        if symbol not in self.table.values:
+            return
+        self._last_ticker[symbol] = ticker
 
-        if prev is None or prev == 0:
-            widgets["change"].config(text="—", fg="#9aa4c7")
-        else:
-            pct = ((price - prev) / prev) * 100.0
-            if pct > 0:
-                widgets["change"].config(text=f"+{pct:.2f}%", fg="#3ddc97")
-            elif pct < 0:
-                widgets["change"].config(text=f"{pct:.2f}%", fg="#ff5c5c")
-            else:
-                widgets["change"].config(text="0.00%", fg="white")
+        # "Change" column = 24h change from the shared ticker snapshot
+        try:
+            pct = float(ticker.get("priceChangePercent"))
+        except (TypeError, ValueError):
+            self.table.set_change(symbol, "—", "#9aa4c7")
+            return
 
-        widgets["updated"].config(text="just now", fg="#9aa4c7")
+        if pct > 0:
+            self.table.set_change(symbol, f"+{pct:.2f}%", "#3ddc97")
+        elif pct < 0:
+            self.table.set_change(symbol, f"{pct:.2f}%", "#ff5c5c")
+        else:
+            self.table.set_change(symbol, "0.00%", "white")
 
     def _refresh_updated_texts(self):
+        # only rows on screen exist, so only they need the relative time
         now = datetime.now()
-        for sym, widgets in self.rows.items():
+        for sym in self.table.visible_symbols():
             t = self._last_update.get(sym)
             if not t:
                 continue
@@ -235,6 +143,4 @@ class MainPage(tk.Frame):
                 text = f"{sec}s ago"
             else:
                 text = f"{sec // 60}m ago"
-            widgets["updated"].config(text=text)
-
-        self.after(500, self._refresh_updated_texts)
+            self.table.set_updated(sym, text)
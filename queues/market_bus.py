@@ -0,0 +1,128 @@
+import threading
+from collections import deque
+
+# delivery policies
+EVERY = "every"      # every message, oldest dropped once maxlen is reached
+LATEST = "latest"    # only the newest payload per topic (conflated)
+BATCH = "batch"      # all pending messages delivered as one list
+
+
+class Subscription:
+    def __init__(self, bus, kind, symbol, callback, policy=EVERY, maxlen=1000):
+        if policy not in (EVERY, LATEST, BATCH):
+            raise ValueError(f"unknown policy: {policy}")
+
+        self.bus = bus
+        self.kind = kind
+        self.symbol = symbol          # None = every symbol of this kind
+        self.callback = callback
+        self.policy = policy
+        self.maxlen = maxlen
+        self.dropped = 0
+
+        self._lock = threading.Lock()
+        if policy == LATEST:
+            self._pending = {}
+        else:
+            self._pending = deque(maxlen=maxlen)
+
+    def _push(self, symbol, payload):
+        with self._lock:
+            if self.policy == LATEST:
+                if symbol in self._pending:
+                    self.dropped += 1
+                self._pending[symbol] = payload
+            else:
+                if len(self._pending) == self.maxlen:
+                    self.dropped += 1
+                self._pending.append((symbol, payload))
+
+    def drain(self):
+        with self._lock:
+            if self.policy == LATEST:
+                items = list(self._pending.items())
+                self._pending.clear()
+            else:
+                items = list(self._pending)
+                self._pending.clear()
+        return items
+
+    def deliver(self):
+        items = self.drain()
+        if not items or self.callback is None:
+            return 0
+
+        if self.policy == BATCH:
+            self.callback(items)
+        else:
+            for symbol, payload in items:
+                self.callback(symbol, payload)
+        return len(items)
+
+    def close(self):
+        self.bus.unsubscribe(self)
+
+
+class MarketBus:
+    """In-process pub/sub keyed by (kind, symbol).
+
+    publish() is safe to call from socket threads; dispatch() runs the
+    callbacks and must be called from the Tk main thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subs = {}       # (kind, symbol) -> [Subscription]
+        self._ready = set()
+
+    def subscribe(self, kind, symbol=None, callback=None, policy=EVERY, maxlen=1000):
+        if symbol is not None:
+            symbol = symbol.upper()
+        sub = Subscription(self, kind, symbol, callback, policy=policy, maxlen=maxlen)
+        with self._lock:
+            self._subs.setdefault((kind, symbol), []).append(sub)
+        return sub
+
+    def unsubscribe(self, sub):
+        with self._lock:
+            subs = self._subs.get((sub.kind, sub.symbol))
+            if subs and sub in subs:
+                subs.remove(sub)
+                if not subs:
+                    del self._subs[(sub.kind, sub.symbol)]
+            self._ready.discard(sub)
+
+    def has_subscribers(self, kind, symbol):
+        key = (kind, symbol.upper())
+        with self._lock:
+            return bool(self._subs.get(key) or self._subs.get((kind, None)))
+
+    def publish(self, kind, symbol, payload):
+        symbol = symbol.upper()
+        with self._lock:
+            subs = self._subs.get((kind, symbol), []) + self._subs.get((kind, None), [])
+        if not subs:
+            return
+
+        # push before marking ready so dispatch() never misses a payload
+        for sub in subs:
+            sub._push(symbol, payload)
+
+        with self._lock:
+            self._ready.update(subs)
+
+    def dispatch(self):
+        with self._lock:
+            ready = self._ready
+            self._ready = set()
+
+        delivered = 0
+        for sub in ready:
+            try:
+                delivered += sub.deliver()
+            except Exception as e:
+                print("Bus callback error:", sub.kind, sub.symbol, e)
+        return delivered
+
+
+market_bus = MarketBus()
@@ -1,2 +0,0 @@
-import queue
-orderbook_queue = queue.Queue()
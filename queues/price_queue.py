@@ -1,2 +0,0 @@
-import queue
-price_queue = queue.Queue()
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from data.indicators import SMA, EMA, Bollinger, VWAP, RSI, MACD, IndicatorSet, ema_filter
+from data.kline_cache import COL, COLUMNS
+
+INDICATORS = [
+    lambda: SMA(20),
+    lambda: EMA(50),
+    lambda: Bollinger(20, 2.0),
+    VWAP,
+    lambda: RSI(14),
+    MACD,
+]
+
+
+def klines_1m(n, t_end_ms=1_700_000_000_000, price=65_000.0, seed=1):
+    rng = np.random.default_rng(seed)
+    t = t_end_ms - t_end_ms % 60_000 - np.arange(n)[::-1] * 60_000
+    c = price * np.exp(np.cumsum(rng.normal(0, 5e-4, n)))
+    o = np.r_[c[0], c[:-1]]
+    spread = np.abs(rng.normal(0, 3e-4, n)) * c
+
+    k = np.zeros((len(COLUMNS), n))
+    k[COL["open_time"]] = t
+    k[COL["open"]] = o
+    k[COL["high"]] = np.maximum(o, c) + spread
+    k[COL["low"]] = np.minimum(o, c) - spread
+    k[COL["close"]] = c
+    k[COL["volume"]] = rng.gamma(2.0, 5.0, n)
+    k[COL["quote_volume"]] = k[COL["volume"]] * c
+    return k
+
+
+def _close(a, b):
+    return np.allclose(a, b, rtol=1e-9, atol=1e-9, equal_nan=True)
+
+
+def test_ema_filter_matches_loop():
+    x = np.random.default_rng(0).normal(100, 5, 300)
+    alpha = 2.0 / 51
+    y = np.empty_like(x)
+    prev = x[0]
+    for i, v in enumerate(x):
+        prev = alpha * v + (1 - alpha) * prev
+        y[i] = prev
+    assert _close(ema_filter(x, alpha), y)
+
+
+@pytest.mark.parametrize("make", INDICATORS)
+def test_streaming_matches_batch(make):
+    # 3000 1m bars cross two UTC midnights, so VWAP resets on the way
+    k = klines_1m(3000)
+    batch = make().init(k)
+
+    m = 60
+    ind = make()
+    head = ind.init(k[:, :m])
+    for line, values in head.items():
+        assert _close(values, batch[line][:m])
+
+    for i in range(m, k.shape[1]):
+        # bar i opens: bar i-1 is final
+        ind.commit(k[:, i - 1])
+        for line, v in ind.peek(k[:, i]).items():
+            assert _close(v, batch[line][i]), (line, i)
+
+
+@pytest.mark.parametrize("make", INDICATORS)
+def test_peek_does_not_commit(make):
+    k = klines_1m(200)
+    ind = make()
+    ind.init(k)
+    first = ind.peek(k[:, -1])
+    bumped = k[:, -1].copy()
+    bumped[4] *= 1.01
+    ind.peek(bumped)
+    assert all(_close(v, ind.peek(k[:, -1])[line]) for line, v in first.items())
+
+
+
+def test_indicator_set_pads_short_history():
+    k = klines_1m(500)
+    inds = IndicatorSet()
+    inds.add(SMA(20))
+    inds.add(EMA(50))
+    inds.reset(k[:, 200:], 500)
+    for vals in inds.values.values():
+        for a in vals.values():
+            assert len(a) == 500
+            assert np.isnan(a[:200]).all()
+
+    # re-initialising one indicator leaves the others alone
+    before = inds.values["SMA 20"]["sma"]
+    inds.reset(k, 500, items=[inds.items[1]])
+    assert inds.values["SMA 20"]["sma"] is before
+    assert not np.isnan(inds.values["EMA 50"]["ema"][100:]).any()
@@ -0,0 +1,96 @@
+import random
+
+from data.local_orderbook import Ladder, LocalOrderBook, to_ticks, from_ticks
+
+
+def _diff(first, last, bids=(), asks=()):
+    return {"U": first, "u": last, "b": [list(x) for x in bids], "a": [list(x) for x in asks]}
+
+
+def _snapshot(last_id):
+    return {
+        "lastUpdateId": last_id,
+        "bids": [["100.00", "1"], ["99.50", "2"]],
+        "asks": [["100.50", "1"], ["101.00", "3"]],
+    }
+
+
+def test_ticks_are_exact():
+    assert to_ticks("0.00000001") == 1
+    assert to_ticks("65000.12") == 6_500_012_000_000
+    assert from_ticks(to_ticks("123.45")) == 123.45
+
+
+def test_ladder_orders_best_first_and_removes_levels():
+    bids = Ladder(descending=True)
+    asks = Ladder(descending=False)
+    for p in ("100", "102", "101"):
+        bids.set(to_ticks(p), 1.0)
+        asks.set(to_ticks(p), 1.0)
+
+    assert [p for p, _ in bids.top(3)] == [102.0, 101.0, 100.0]
+    assert [p for p, _ in asks.top(3)] == [100.0, 101.0, 102.0]
+
+    bids.set(to_ticks("102"), 0.0)
+    bids.set(to_ticks("101"), 5.0)
+    assert bids.top(2) == ((101.0, 5.0), (100.0, 1.0))
+    assert bids.best() == to_ticks("101")
+    assert len(bids) == 2
+
+
+def test_ladder_matches_sorted_reference():
+    rng = random.Random(7)
+    ladder = Ladder(descending=True)
+    ref = {}
+    for i in range(20_000):
+        t = rng.randint(0, 500) + i // 100
+        q = 0.0 if rng.random() < 0.45 else rng.random()
+        ladder.set(t, q)
+        if q:
+            ref[t] = q
+        else:
+            ref.pop(t, None)
+        if i % 500 == 0:
+            expect = sorted(ref.items(), reverse=True)[:10]
+            assert [(round(p * 1e8), q) for p, q in ladder.top(10)] == expect
+    assert len(ladder) == len(ref)
+
+
+def test_snapshot_applies_buffered_diffs_after_last_update_id():
+    book = LocalOrderBook("btcusdt")
+    assert book.apply_diff(_diff(95, 100, bids=[("100.00", "9")]))       # older than snapshot: dropped
+    assert book.apply_diff(_diff(101, 103, asks=[("100.50", "0")]))      # straddles lastUpdateId
+    assert book.apply_diff(_diff(104, 104, bids=[("100.25", "4")]))
+    assert not book.synced
+
+    assert book.load_snapshot(_snapshot(102))
+    assert book.synced and book.last_update_id == 104
+
+    bids, asks = book.top(5)
+    assert bids == ((100.25, 4.0), (100.0, 1.0), (99.5, 2.0))
+    assert asks == ((101.0, 3.0),)
+
+
+def test_snapshot_older_than_buffer_needs_resync():
+    book = LocalOrderBook("btcusdt")
+    book.apply_diff(_diff(110, 112))
+    assert not book.load_snapshot(_snapshot(100))
+    assert not book.synced
+    assert book.depth() == (0, 0)
+
+
+def test_sequence_gap_resets_and_resyncs():
+    book = LocalOrderBook("btcusdt")
+    book.load_snapshot(_snapshot(100))
+    assert book.apply_diff(_diff(101, 101, bids=[("100.00", "2")]))
+    assert book.apply_diff(_diff(90, 101))                               # stale: ignored
+    assert book.top(1)[0] == ((100.0, 2.0),)
+
+    # 102..104 missing
+    assert not book.apply_diff(_diff(105, 106, bids=[("98.00", "1")]))
+    assert not book.synced and book.depth() == (0, 0)
+
+    # the gap event is kept, so a fresh snapshot picks up from it
+    assert book.load_snapshot(_snapshot(105))
+    assert book.last_update_id == 106
+    assert (98.0, 1.0) in book.top(5)[0]
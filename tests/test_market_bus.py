@@ -0,0 +1,80 @@
+from queues.market_bus import MarketBus, EVERY, LATEST, BATCH
+
+
+def test_every_delivers_all_in_order_and_drops_oldest():
+    bus = MarketBus()
+    got = []
+    sub = bus.subscribe("price", callback=lambda s, p: got.append((s, p)), policy=EVERY, maxlen=3)
+    for i in range(5):
+        bus.publish("price", "btcusdt", i)
+
+    assert bus.dispatch() == 3
+    assert got == [("BTCUSDT", 2), ("BTCUSDT", 3), ("BTCUSDT", 4)]
+    assert sub.dropped == 2
+
+
+def test_latest_conflates_per_symbol():
+    bus = MarketBus()
+    got = {}
+    sub = bus.subscribe("price", callback=lambda s, p: got.__setitem__(s, p), policy=LATEST)
+    for i in range(4):
+        bus.publish("price", "BTCUSDT", i)
+        bus.publish("price", "ETHUSDT", 10 + i)
+
+    assert bus.dispatch() == 2
+    assert got == {"BTCUSDT": 3, "ETHUSDT": 13}
+    assert sub.dropped == 6
+
+
+def test_batch_delivers_one_list():
+    bus = MarketBus()
+    calls = []
+    bus.subscribe("trade", "BTCUSDT", callback=calls.append, policy=BATCH)
+    for i in range(3):
+        bus.publish("trade", "BTCUSDT", i)
+
+    bus.dispatch()
+    assert calls == [[("BTCUSDT", 0), ("BTCUSDT", 1), ("BTCUSDT", 2)]]
+
+
+def test_symbol_filter_and_wildcard():
+    bus = MarketBus()
+    eth, everything = [], []
+    bus.subscribe("book", "ETHUSDT", callback=lambda s, p: eth.append(p))
+    bus.subscribe("book", callback=lambda s, p: everything.append(s))
+    bus.publish("book", "BTCUSDT", 1)
+    bus.publish("book", "ETHUSDT", 2)
+    bus.dispatch()
+
+    assert eth == [2]
+    assert everything == ["BTCUSDT", "ETHUSDT"]
+    assert bus.has_subscribers("book", "solusdt")
+
+
+def test_nothing_pending_after_dispatch_or_unsubscribe():
+    bus = MarketBus()
+    got = []
+    sub = bus.subscribe("price", callback=lambda s, p: got.append(p))
+    bus.publish("price", "BTCUSDT", 1)
+    bus.dispatch()
+    assert bus.dispatch() == 0
+
+    sub.close()
+    bus.publish("price", "BTCUSDT", 2)
+    assert bus.dispatch() == 0
+    assert got == [1]
+    assert not bus.has_subscribers("price", "BTCUSDT")
+
+
+def test_callback_error_does_not_block_other_subscribers():
+    bus = MarketBus()
+    got = []
+
+    def boom(s, p):
+        raise RuntimeError("boom")
+
+    bus.subscribe("price", callback=boom)
+    bus.subscribe("price", callback=lambda s, p: got.append(p))
+    bus.publish("price", "BTCUSDT", 1)
+    bus.dispatch()
+    assert got == [1]
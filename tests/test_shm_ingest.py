@@ -0,0 +1,46 @@
+import numpy as np
+
+from data.shm_ingest import TRADE, ShmTradeRing
+
+
+def _ring(capacity):
+    return ShmTradeRing(bytearray(ShmTradeRing.nbytes(capacity)), capacity)
+
+
+def _write(ring, n, start=0):
+    for i in range(start, start + n):
+        ring.write(TRADE, 0, 1000 + i, 100.0 + i, 1.0, 1)
+
+
+def test_read_since_across_wrap_is_an_ordered_copy():
+    ring = _ring(8)
+    _write(ring, 6)
+    recs, seq, dropped = ring.read_since(0)
+    assert (seq, dropped) == (6, 0)
+
+    _write(ring, 5, start=6)
+    recs, seq, dropped = ring.read_since(seq)
+    assert (seq, dropped) == (11, 0)
+    assert recs["ts"].tolist() == [1006, 1007, 1008, 1009, 1010]
+    assert not np.shares_memory(recs, ring.records)
+
+
+def test_reader_a_lap_behind_counts_the_overwritten_records():
+    ring = _ring(8)
+    _write(ring, 20)
+    recs, seq, dropped = ring.read_since(0)
+    # 12 overwritten before the read; the oldest kept slot is the one the writer fills next
+    assert (seq, dropped) == (20, 13)
+    assert recs["ts"].tolist() == list(range(1013, 1020))
+
+
+def test_records_lapped_while_copying_are_dropped(monkeypatch):
+    ring = _ring(8)
+    _write(ring, 4)
+
+    # the writer gets 6 records further between the first and second look at write_seq
+    reads = iter([4, 10])
+    monkeypatch.setattr(ShmTradeRing, "write_seq", property(lambda self: next(reads)))
+    recs, seq, dropped = ring.read_since(0)
+    assert (seq, dropped) == (4, 3)
+    assert recs["ts"].tolist() == [1003]
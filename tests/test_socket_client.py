@@ -0,0 +1,36 @@
+import json
+
+from data.socket_client import BinanceCombinedSocket, gap_topics
+from queues.market_bus import market_bus
+
+
+def test_gap_topics_follow_the_stream_kind():
+    streams = ["btcusdt@trade", "btcusdt@depth@100ms", "ethusdt@depth10@100ms", "ethusdt@trade", "solusdt@kline_1m"]
+    assert gap_topics(streams) == [
+        ("depth_gap", "BTCUSDT"),
+        ("depth_gap", "ETHUSDT"),
+        ("trade_gap", "BTCUSDT"),
+        ("trade_gap", "ETHUSDT"),
+    ]
+
+
+def test_depth_socket_gap_is_not_a_trade_gap():
+    got = []
+    subs = [
+        market_bus.subscribe("trade_gap", callback=lambda s, g: got.append(("trade_gap", s, g))),
+        market_bus.subscribe("depth_gap", callback=lambda s, g: got.append(("depth_gap", s, g))),
+    ]
+    try:
+        sock = BinanceCombinedSocket(["btcusdt@depth@100ms"], handlers={})
+        sock.last_message_at = 100.0
+        sock._mark_disconnected()
+        sock._handle_message(None, json.dumps({"result": None, "id": 1}))
+        market_bus.dispatch()
+    finally:
+        for sub in subs:
+            sub.close()
+
+    assert len(got) == 1
+    topic, sym, (from_ms, to_ms) = got[0]
+    assert (topic, sym, from_ms) == ("depth_gap", "BTCUSDT", 100_000)
+    assert to_ms > from_ms
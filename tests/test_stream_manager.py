@@ -0,0 +1,36 @@
+from data.stream_manager import StreamManager
+
+
+def _manager():
+    m = StreamManager({}, grace_s=0.0)
+    m._started = True      # keep the socket thread (and the network) out of it
+    return m
+
+
+def test_last_release_unsubscribes_after_grace():
+    m = _manager()
+    assert m.acquire("btcusdt@depth@100ms")
+    assert not m.acquire("btcusdt@depth@100ms")
+    m.release("btcusdt@depth@100ms")
+    assert m.sweep() == []
+    m.release("btcusdt@depth@100ms")
+    assert m.sweep() == ["btcusdt@depth@100ms"]
+    assert not m.is_active("btcusdt@depth@100ms")
+
+
+def test_release_without_acquire_is_ignored():
+    closed = []
+    m = _manager()
+    m.on_unsubscribed = closed.append
+    m.release("ethusdt@depth@100ms")
+    assert m.sweep() == [] and closed == []
+
+    m.acquire("ethusdt@depth@100ms")
+    m.release("ethusdt@depth@100ms")
+    m.release("ethusdt@depth@100ms")      # one too many
+    assert m.sweep() == ["ethusdt@depth@100ms"]
+    assert closed == ["ethusdt@depth@100ms"]
+
+    # the count never went negative: one acquire holds the stream again
+    assert m.acquire("ethusdt@depth@100ms")
+    assert m.is_active("ethusdt@depth@100ms")
@@ -0,0 +1,95 @@
+import numpy as np
+
+from data.kline_cache import COL, COLUMNS
+from data.taker_volume import KLINE_MS, TakerVolume, _BucketWindow
+
+T0 = 1_700_000_000_000 - 1_700_000_000_000 % 3_600_000
+
+
+def _klines(opens, buy, quote):
+    k = np.zeros((len(COLUMNS), len(opens)))
+    k[COL["open_time"]] = opens
+    k[COL["taker_buy_quote"]] = buy
+    k[COL["quote_volume"]] = quote
+    return k
+
+
+def test_bucket_window_sums_and_expires():
+    w = _BucketWindow(span_ms=10_000, bucket_ms=1_000)
+    for s in range(10):
+        w.add(T0 + s * 1_000, 1.0, 2.0)
+    assert w.totals(T0 + 9_000) == (10.0, 20.0)
+
+    # three buckets slide out
+    assert w.totals(T0 + 12_000) == (7.0, 14.0)
+    # a trade older than the window is ignored
+    w.add(T0, 100.0, 100.0)
+    assert w.totals(T0 + 12_000) == (7.0, 14.0)
+    # after a full span everything is gone
+    assert w.totals(T0 + 30_000) == (0.0, 0.0)
+
+
+def test_bucket_window_late_trade_inside_window():
+    w = _BucketWindow(span_ms=10_000, bucket_ms=1_000)
+    w.add(T0 + 5_000, 1.0, 0.0)
+    w.add(T0 + 2_000, 2.0, 0.0)
+    assert w.totals(T0 + 5_000) == (3.0, 0.0)
+    assert w.totals(T0 + 12_000) == (1.0, 0.0)
+
+
+def test_trades_feed_every_window():
+    tv = TakerVolume()
+    now = T0 + 10 * 60_000
+    tv.add(now - 30_000, 50.0, 1)      # buy, 30 s ago
+    tv.add(now - 4 * 60_000, 20.0, -1)  # sell, 4 min ago
+    t = tv.totals(now)
+    assert t["1m"] == (50.0, 0.0)
+    assert t["5m"] == (50.0, 20.0)
+    assert t["1h"] == (50.0, 20.0)
+    assert t["24h"] == (50.0, 20.0)
+
+
+def test_seed_fills_hour_windows_and_reseed_is_idempotent():
+    opens = T0 + np.arange(120) * KLINE_MS
+    now = int(opens[-1]) + 30_000          # last bar still open: not used
+    k = _klines(opens, buy=3.0, quote=5.0)
+
+    tv = TakerVolume()
+    tv.seed(k, now)
+    # the 1h window ends in the open bar: 59 closed minutes fit beside it
+    assert tv.totals(now)["1h"] == (3.0 * 59, 2.0 * 59)
+    assert tv.totals(now)["24h"] == (3.0 * 119, 2.0 * 119)
+
+    # a reseed after a gap replaces whole minutes instead of adding them again
+    tv.seed(k, now)
+    assert tv.totals(now)["24h"] == (3.0 * 119, 2.0 * 119)
+
+
+def test_reseed_repairs_minutes_lost_in_a_gap():
+    opens = T0 + np.arange(10) * KLINE_MS
+    now = int(opens[-1]) + 1_000
+    tv = TakerVolume()
+    tv.seed(_klines(opens, buy=1.0, quote=1.0), now)
+
+    # the stream missed part of minute 8; klines fetched afterwards have the full minute
+    full = _klines(opens, buy=1.0, quote=1.0)
+    full[COL["taker_buy_quote"], 8] = 4.0
+    full[COL["quote_volume"], 8] = 4.0
+    tv.seed(full, now)
+    assert tv.totals(now)["1h"] == (12.0, 0.0)
+
+
+def test_fine_windows_take_only_bars_before_the_first_live_trade():
+    opens = T0 + np.arange(10) * KLINE_MS
+    first_trade = int(opens[8]) + 10_000       # inside minute 8
+    now = first_trade + 60_000
+
+    tv = TakerVolume()
+    tv.add(first_trade, 7.0, 1)
+    tv.seed(_klines(opens, buy=1.0, quote=1.0), now)
+
+    # 5m ends at 9m10s: minutes 5..7 from klines (minute 8 overlaps live trades) + the live trade
+    assert tv.totals(now)["5m"] == (3.0 + 7.0, 0.0)
+    # seeding again must not add those minutes twice
+    tv.seed(_klines(opens, buy=1.0, quote=1.0), now)
+    assert tv.totals(now)["5m"] == (3.0 + 7.0, 0.0)
@@ -0,0 +1,91 @@
+import numpy as np
+
+from data.data_store import MarketData, TickRing
+
+
+def _fill(ring, n, start=0):
+    for i in range(start, start + n):
+        ring.append(1000 + i, 100.0 + i, 1.0, 1 if i % 2 else -1)
+
+
+def test_last_before_wrap():
+    ring = TickRing(capacity=8)
+    _fill(ring, 5)
+    assert len(ring) == 5
+    assert ring.last(3).ts.tolist() == [1002, 1003, 1004]
+    assert ring.last(100).ts.tolist() == [1000, 1001, 1002, 1003, 1004]
+
+
+def test_last_after_wrap_is_contiguous_and_ordered():
+    ring = TickRing(capacity=8)
+    _fill(ring, 21)
+    w = ring.last(8)
+    assert len(ring) == 8 and ring.count == 21
+    assert w.ts.tolist() == list(range(1013, 1021))
+    assert w.price.tolist() == [100.0 + i for i in range(13, 21)]
+    # a window is a view into the buffer, not a copy
+    assert np.shares_memory(w.ts, ring.ts)
+
+
+def test_extend_matches_append_across_wrap():
+    a = TickRing(capacity=8)
+    b = TickRing(capacity=8)
+    _fill(a, 5)
+    _fill(b, 5)
+
+    ts = np.arange(1005, 1016)
+    price = 100.0 + np.arange(5, 16)
+    side = np.where(np.arange(5, 16) % 2, 1, -1)
+    _fill(a, 11, start=5)
+    b.extend(ts, price, np.ones(11), side)
+
+    assert a.count == b.count == 16
+    for name in ("ts", "price", "qty", "side"):
+        assert getattr(a.last(8), name).tolist() == getattr(b.last(8), name).tolist()
+
+
+def test_extend_longer_than_capacity_keeps_newest():
+    ring = TickRing(capacity=4)
+    ring.extend(np.arange(10), np.arange(10.0), np.ones(10), np.ones(10, dtype=np.int8))
+    assert ring.count == 10
+    assert ring.last(4).ts.tolist() == [6, 7, 8, 9]
+
+
+def test_since_window():
+    ring = TickRing(capacity=8)
+    _fill(ring, 12)
+    assert ring.since(1009).ts.tolist() == [1009, 1010, 1011]
+    assert ring.since(0).ts.tolist() == list(range(1004, 1012))
+    assert len(ring.since(5000).ts) == 0
+
+
+def test_resized_keeps_newest_rows_and_count():
+    ring = TickRing(capacity=8)
+    _fill(ring, 13)
+    small = ring.resized(4)
+    assert small.count == 13
+    assert small.last(8).ts.tolist() == [1009, 1010, 1011, 1012]
+
+    big = small.resized(16)
+    _fill(big, 2, start=13)
+    assert big.last(16).ts.tolist() == [1009, 1010, 1011, 1012, 1013, 1014]
+
+
+def test_only_the_focused_symbol_gets_the_deep_ring():
+    md = MarketData(tick_capacity=4, focus_capacity=32)
+    for i in range(10):
+        md.record_trade("btcusdt", 1000 + i, 1.0, 1.0, False)
+        md.record_trade("ETHUSDT", 1000 + i, 1.0, 1.0, True)
+    assert md.trade_ring("BTCUSDT").capacity == 4
+
+    md.set_focus("btcusdt")
+    ring = md.trade_ring("BTCUSDT")
+    assert ring.capacity == 32 and ring.count == 10
+    assert ring.last(32).ts.tolist() == [1006, 1007, 1008, 1009]
+    assert md.trade_ring("SOLUSDT", create=True).capacity == 4
+
+    md.set_focus("ETHUSDT")
+    assert md.trade_ring("BTCUSDT").capacity == 4
+    assert md.trade_ring("ETHUSDT").capacity == 32
+    md.set_focus(None)
+    assert md.trade_ring("ETHUSDT").capacity == 4
@@ -0,0 +1,421 @@
+"""Local stand-in for the Binance endpoints the dashboard uses.
+
+    python tools/mock_binance.py --rate 20000
+
+then point the app at it, through "endpoints" in settings.json or:
+
+    BINANCE_REST_URL=http://127.0.0.1:8080 BINANCE_STREAM_URL=ws://127.0.0.1:9443 python app.py
+
+WebSocket: /ws/<stream> and /stream?streams=a/b/c (with SUBSCRIBE /
+UNSUBSCRIBE), streams <sym>@trade, <sym>@depth@100ms (diffs with update ids)
+and <sym>@depth<N>@100ms (partial book). REST: /api/v3/klines, /api/v3/depth
+and /api/v3/ticker/24hr. Prices follow one smooth synthetic path per symbol,
+so klines, trades and tickers agree with each other.
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import websockets
+
+BASE_PRICES = {
+    "BTCUSDT": 65_000.0,
+    "ETHUSDT": 3_200.0,
+    "SOLUSDT": 150.0,
+    "BNBUSDT": 580.0,
+    "XRPUSDT": 0.55,
+}
+
+INTERVAL_MS = {
+    "1m": 60_000, "3m": 180_000, "5m": 300_000, "15m": 900_000, "30m": 1_800_000,
+    "1h": 3_600_000, "2h": 7_200_000, "4h": 14_400_000, "6h": 21_600_000,
+    "8h": 28_800_000, "12h": 43_200_000, "1d": 86_400_000,
+}
+
+DEPTH_LEVELS = 50
+MAX_QUEUE = 200_000   # frames buffered per slow client before the oldest are dropped
+
+
+def now_ms():
+    return int(time.time() * 1000)
+
+
+class SyntheticMarket:
+    """One symbol: a deterministic price path, a trade generator and an order book."""
+
+    def __init__(self, symbol, base_price, seed=1):
+        self.symbol = symbol
+        self.base = base_price
+        self.rng = random.Random(f"{seed}:{symbol}")
+        self.phase = self.rng.random() * 6.28
+        self.decimals = 2 if base_price >= 100 else 4 if base_price >= 1 else 6
+
+        self.trade_id = 0
+        self.update_id = 1
+        self.bids = {}   # level -> qty, price = level * step
+        self.asks = {}
+        self.step = 10 ** -self.decimals * max(1, round(base_price * 1e-4 * 10 ** self.decimals))
+        self.lock = threading.Lock()
+
+    def fair(self, t_ms):
+        t = t_ms / 1000.0 + self.phase * 10_000
+        return self.base * (1 + 0.02 * math.sin(t / 10_800) + 0.006 * math.sin(t / 1_020 + 1) + 0.002 * math.sin(t / 97 + 2))
+
+    def fmt(self, price):
+        return f"{price:.{self.decimals}f}"
+
+    # ---- stream events ----
+
+    def trade(self, t_ms):
+        with self.lock:
+            self.trade_id += 1
+            price = self.fair(t_ms) + self.rng.gauss(0, 3) * self.step
+            qty = self.rng.expovariate(1.0) * 1000 / self.base
+            return {
+                "e": "trade", "E": t_ms, "s": self.symbol, "t": self.trade_id,
+                "p": self.fmt(price), "q": f"{qty:.6f}", "T": t_ms,
+                "m": self.rng.random() < 0.5, "M": True,
+            }
+
+    def _levels(self, t_ms):
+        mid = int(self.fair(t_ms) / self.step)
+        bids = range(mid - DEPTH_LEVELS + 1, mid + 1)
+        asks = range(mid + 1, mid + DEPTH_LEVELS + 1)
+        return bids, asks
+
+    def depth_update(self, t_ms):
+        """Move the book to the current mid; returns the diff event (Binance depthUpdate)."""
+        with self.lock:
+            bids, asks = self._levels(t_ms)
+            diff = {}
+            for book, levels, key in ((self.bids, bids, "b"), (self.asks, asks, "a")):
+                changes = []
+                keep = set(levels)
+                for level in [lv for lv in book if lv not in keep]:
+                    del book[level]
+                    changes.append([self.fmt(level * self.step), "0.00000000"])
+                for level in levels:
+                    if level not in book or self.rng.random() < 0.3:
+                        qty = self.rng.expovariate(1.0) * 5000 / self.base
+                        book[level] = qty
+                        changes.append([self.fmt(level * self.step), f"{qty:.8f}"])
+                diff[key] = changes
+
+            self.update_id += 1
+            return {
+                "e": "depthUpdate", "E": t_ms, "s": self.symbol,
+                "U": self.update_id, "u": self.update_id, "b": diff["b"], "a": diff["a"],
+            }
+
+    def book_top(self, limit):
+        with self.lock:
+            bids = sorted(self.bids.items(), reverse=True)[:limit]
+            asks = sorted(self.asks.items())[:limit]
+            return {
+                "lastUpdateId": self.update_id,
+                "bids": [[self.fmt(lv * self.step), f"{q:.8f}"] for lv, q in bids],
+                "asks": [[self.fmt(lv * self.step), f"{q:.8f}"] for lv, q in asks],
+            }
+
+    # ---- REST ----
+
+    def kline(self, open_ms, interval_ms):
+        close_ms = open_ms + interval_ms
+        o = self.fair(open_ms)
+        c = self.fair(close_ms)
+        m = self.fair(open_ms + interval_ms // 2)
+        h = max(o, c, m) * 1.0004
+        l = min(o, c, m) * 0.9996
+        n = open_ms // interval_ms
+        volume = (5 + (n * 7919) % 13) * interval_ms / 60_000 * 1000 / self.base
+        quote = volume * (o + c) / 2
+        buy = 0.5 + 0.1 * math.sin(n)
+        return [
+            open_ms, self.fmt(o), self.fmt(h), self.fmt(l), self.fmt(c), f"{volume:.6f}",
+            close_ms - 1, f"{quote:.6f}", int(volume * 10), f"{volume * buy:.6f}", f"{quote * buy:.6f}", "0",
+        ]
+
+    def klines(self, interval, limit=500, start_ms=None, end_ms=None):
+        ms = INTERVAL_MS[interval]
+        limit = max(1, min(int(limit), 1000))
+        last = now_ms() // ms * ms
+        if end_ms is not None:
+            last = min(last, int(end_ms) // ms * ms)
+
+        if start_ms is not None:
+            first = -(-int(start_ms) // ms) * ms
+            opens = range(first, min(last, first + (limit - 1) * ms) + 1, ms)
+        else:
+            opens = range(max(0, last - (limit - 1) * ms), last + 1, ms)
+        return [self.kline(t, ms) for t in opens]
+
+    def ticker(self):
+        t = now_ms()
+        day = 86_400_000
+        samples = [self.fair(t - day + i * 300_000) for i in range(289)]
+        first, last = samples[0], samples[-1]
+        volume = sum(float(k[5]) for k in self.klines("1h", 24))
+        quote = sum(float(k[7]) for k in self.klines("1h", 24))
+        return {
+            "symbol": self.symbol,
+            "priceChange": self.fmt(last - first),
+            "priceChangePercent": f"{(last - first) / first * 100:.3f}",
+            "weightedAvgPrice": self.fmt(quote / volume if volume else last),
+            "lastPrice": self.fmt(last),
+            "openPrice": self.fmt(first),
+            "highPrice": self.fmt(max(samples)),
+            "lowPrice": self.fmt(min(samples)),
+            "volume": f"{volume:.6f}",
+            "quoteVolume": f"{quote:.6f}",
+            "openTime": t - day,
+            "closeTime": t,
+            "count": self.trade_id,
+        }
+
+
+class _Client:
+    def __init__(self, ws, streams, combined):
+        self.ws = ws
+        self.streams = set(streams)
+        self.combined = combined
+        self.queue = deque()
+        self.wake = asyncio.Event()
+        self.sent = 0
+        self.dropped = 0
+
+    def push(self, stream, payload):
+        if stream not in self.streams:
+            return
+        if self.combined:
+            payload = f'{{"stream":"{stream}","data":{payload}}}'
+        if len(self.queue) >= MAX_QUEUE:
+            self.queue.popleft()
+            self.dropped += 1
+        self.queue.append(payload)
+        self.wake.set()
+
+
+class MockBinance:
+    """WebSocket streams on an asyncio loop, REST on a ThreadingHTTPServer.
+
+    rate is the total number of trade messages generated per second across
+    all symbols; depth events go out every depth_ms to subscribed clients.
+    """
+
+    def __init__(self, symbols, rate=1000.0, depth_ms=100, seed=1):
+        self.markets = {
+            s.upper(): SyntheticMarket(s.upper(), BASE_PRICES.get(s.upper(), 10.0 + random.Random(s).random() * 90), seed)
+            for s in symbols
+        }
+        self.rate = float(rate)
+        self.depth_ms = depth_ms
+        self.clients = set()
+
+        self.generated = 0
+        self.sent = 0
+        self.dropped_closed = 0   # drops of clients that have disconnected
+        self._last_report = (time.time(), 0, 0)
+
+    # ---- WebSocket ----
+
+    async def _handle(self, ws):
+        url = urlparse(ws.request.path)
+        if url.path.startswith("/ws/"):
+            client = _Client(ws, [url.path[len("/ws/"):]], combined=False)
+        elif url.path == "/stream":
+            streams = parse_qs(url.query).get("streams", [""])[0]
+            client = _Client(ws, [s for s in streams.split("/") if s], combined=True)
+        else:
+            await ws.close(1008, "unknown path")
+            return
+
+        self.clients.add(client)
+        writer = asyncio.ensure_future(self._writer(client))
+        try:
+            async for msg in ws:
+                try:
+                    req = json.loads(msg)
+                except ValueError:
+                    continue
+                method = req.get("method")
+                params = req.get("params") or []
+                if method == "SUBSCRIBE":
+                    client.streams.update(params)
+                elif method == "UNSUBSCRIBE":
+                    client.streams.difference_update(params)
+                elif method == "LIST_SUBSCRIPTIONS":
+                    await ws.send(json.dumps({"result": sorted(client.streams), "id": req.get("id")}))
+                    continue
+                await ws.send(json.dumps({"result": None, "id": req.get("id")}))
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            self.clients.discard(client)
+            self.dropped_closed += client.dropped
+            writer.cancel()
+
+    async def _writer(self, client):
+        try:
+            while True:
+                await client.wake.wait()
+                client.wake.clear()
+                while client.queue:
+                    await client.ws.send(client.queue.popleft())
+                    client.sent += 1
+                    self.sent += 1
+        except (websockets.ConnectionClosed, asyncio.CancelledError):
+            pass
+
+    def _publish(self, stream, event):
+        payload = None
+        for client in self.clients:
+            if stream in client.streams:
+                if payload is None:
+                    payload = json.dumps(event, separators=(",", ":"))
+                client.push(stream, payload)
+
+    async def _trades(self, tick_s=0.01):
+        symbols = list(self.markets)
+        due = 0.0
+        last = time.perf_counter()
+        i = 0
+        while True:
+            await asyncio.sleep(tick_s)
+            now = time.perf_counter()
+            due += (now - last) * self.rate
+            last = now
+
+            n = int(due)
+            due -= n
+            t = now_ms()
+            for _ in range(n):
+                sym = symbols[i % len(symbols)]
+                i += 1
+                self._publish(f"{sym.lower()}@trade", self.markets[sym].trade(t))
+            self.generated += n
+
+    async def _depth(self):
+        while True:
+            await asyncio.sleep(self.depth_ms / 1000.0)
+            t = now_ms()
+            for sym, market in self.markets.items():
+                lc = sym.lower()
+                wanted = set()
+                for client in self.clients:
+                    wanted.update(s for s in client.streams if s.startswith(lc + "@depth"))
+                if not wanted:
+                    continue
+
+                event = market.depth_update(t)
+                for stream in wanted:
+                    name = stream.split("@")[1]
+                    if name == "depth":
+                        self._publish(stream, event)
+                    else:
+                        levels = int(name[len("depth"):] or 20)
+                        self._publish(stream, market.book_top(levels))
+
+    async def _report(self, every_s=5.0):
+        while True:
+            await asyncio.sleep(every_s)
+            t0, gen0, sent0 = self._last_report
+            now = time.time()
+            sent = self.sent
+            dropped = self.dropped_closed + sum(c.dropped for c in self.clients)
+            dt = now - t0
+            print(
+                f"{len(self.clients)} clients | generated {(self.generated - gen0) / dt:,.0f} trades/s"
+                f" | sent {(sent - sent0) / dt:,.0f} msg/s | dropped {dropped:,}"
+            )
+            self._last_report = (now, self.generated, sent)
+
+    async def serve_ws(self, host, port):
+        async with websockets.serve(self._handle, host, port, max_size=None, compression=None):
+            await asyncio.gather(self._trades(), self._depth(), self._report())
+
+    # ---- REST ----
+
+    def rest_handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, fmt, *args):
+                pass
+
+            def _send(self, status, body):
+                data = json.dumps(body, separators=(",", ":")).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                q = {k: v[0] for k, v in parse_qs(url.query).items()}
+                try:
+                    status, body = mock.rest(url.path, q)
+                except Exception as e:
+                    status, body = 400, {"code": -1100, "msg": str(e)}
+                self._send(status, body)
+
+        return Handler
+
+    def _market(self, q):
+        market = self.markets.get(str(q.get("symbol", "")).upper())
+        if market is None:
+            raise ValueError("Invalid symbol.")
+        return market
+
+    def rest(self, path, q):
+        if path == "/api/v3/klines":
+            return 200, self._market(q).klines(
+                q.get("interval", "1m"), q.get("limit", 500), q.get("startTime"), q.get("endTime"),
+            )
+        if path == "/api/v3/depth":
+            return 200, self._market(q).book_top(min(int(q.get("limit", 100)), 5000))
+        if path == "/api/v3/ticker/24hr":
+            if "symbols" in q:
+                return 200, [self.markets[s].ticker() for s in json.loads(q["symbols"]) if s in self.markets]
+            if "symbol" in q:
+                return 200, self._market(q).ticker()
+            return 200, [m.ticker() for m in self.markets.values()]
+        return 404, {"code": -1, "msg": f"unknown endpoint {path}"}
+
+    def serve_rest(self, host, port):
+        server = ThreadingHTTPServer((host, port), self.rest_handler())
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True, name="mock-rest").start()
+        return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local mock of the Binance REST / WebSocket endpoints.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--ws-port", type=int, default=9443)
+    parser.add_argument("--http-port", type=int, default=8080)
+    parser.add_argument("--symbols", default=",".join(BASE_PRICES), help="comma-separated, e.g. BTCUSDT,ETHUSDT")
+    parser.add_argument("--rate", type=float, default=1000.0, help="trade messages per second, all symbols together")
+    parser.add_argument("--depth-ms", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    mock = MockBinance(args.symbols.split(","), rate=args.rate, depth_ms=args.depth_ms, seed=args.seed)
+    mock.serve_rest(args.host, args.http_port)
+    print(f"REST    http://{args.host}:{args.http_port}")
+    print(f"Streams ws://{args.host}:{args.ws_port}")
+    try:
+        asyncio.run(mock.serve_ws(args.host, args.ws_port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
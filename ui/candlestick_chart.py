@@ -1,185 +1,920 @@
+import time
 import tkinter as tk
-import mplfinance as mpf
-import matplotlib.dates as mdates
-import matplotlib.ticker as mticker
-from bisect import bisect_left
 
+import numpy as np
+import matplotlib.ticker as mticker
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
-from data.kline_client import fetch_klines
+from data.kline_client import backfill_kline_arrays, fetch_kline_arrays, load_cached_kline_arrays
+from data.kline_cache import COL, COLUMNS, merge_klines
+from data.rest_client import rest_client
+from data.kline_builder import KlineAggregator, BAR_OPENED, interval_to_ms
+from data.resample import BASE_INTERVAL, base_bars_for, resample_klines
+from data.indicators import SMA, EMA, Bollinger, VWAP, RSI, MACD, IndicatorSet
+from queues.market_bus import market_bus, BATCH, LATEST
+
+# style is built once; colors are reused as RGBA arrays
+UP_COLOR = "#3ddc97"
+DOWN_COLOR = "#ff5c5c"
+FIG_BG = "#151823"
+AX_BG = "#1b1f2e"
+GRID_COLOR = "#2a2f45"
+CANDLE_WIDTH = 0.7
+
+INTERVALS = ("1m", "5m", "15m", "1h", "4h", "1d")
+BASE_MAX_BARS = 200_000  # ~139 days of 1m bars kept for resampling and scrolling back
+PREFETCH_BARS = 20_160   # 14 days of 1m bars fetched in the background after first paint; older ones page in by backfill
+BACKFILL_BARS = 5_000    # older 1m history fetched per page while panning left
+MIN_VIEW_BARS = 20
+ZOOM_STEP = 1.25
+IND_WARMUP_BARS = 2_000  # indicators start this far before the viewport (a UTC day of 1m bars for VWAP)
+
+# overlays share the price axes; the others get their own sub-pane
+INDICATORS = {
+    "SMA 20": lambda: SMA(20),
+    "EMA 50": lambda: EMA(50),
+    "BB 20": lambda: Bollinger(20, 2.0),
+    "VWAP": VWAP,
+    "RSI 14": lambda: RSI(14),
+    "MACD": MACD,
+}
+LINE_COLORS = {
+    "sma": "#f59e0b",
+    "ema": "#60a5fa",
+    "mid": "#a78bfa",
+    "upper": "#a78bfa",
+    "lower": "#a78bfa",
+    "vwap": "#f472b6",
+    "rsi": "#facc15",
+    "macd": "#60a5fa",
+    "signal": "#f59e0b",
+    "hist": "#6b7280",
+}
+PANE_HEIGHT = 0.15
+
+_UP_RGBA = np.array(to_rgba(UP_COLOR))
+_DOWN_RGBA = np.array(to_rgba(DOWN_COLOR))
+
+
+def candle_geometry(o, h, l, c, x0=0, step=1):
+    """Body rectangles (n, 4, 2), wick segments (n, 2, 2) and RGBA colors (n, 4).
+
+    step > 1 draws each candle as a group of `step` bars (level of detail).
+    """
+    n = len(o)
+    x = x0 + np.arange(n, dtype=np.float64) * step + (step - 1) / 2
+    half = CANDLE_WIDTH * step / 2
+    lo = np.minimum(o, c)
+    hi = np.maximum(o, c)
+
+    bodies = np.empty((n, 4, 2))
+    bodies[:, 0, 0] = bodies[:, 1, 0] = x - half
+    bodies[:, 2, 0] = bodies[:, 3, 0] = x + half
+    bodies[:, 0, 1] = bodies[:, 3, 1] = lo
+    bodies[:, 1, 1] = bodies[:, 2, 1] = hi
+
+    wicks = np.empty((n, 2, 2))
+    wicks[:, 0, 0] = wicks[:, 1, 0] = x
+    wicks[:, 0, 1] = l
+    wicks[:, 1, 1] = h
+
+    colors = np.where((c >= o)[:, None], _UP_RGBA, _DOWN_RGBA)
+    return bodies, wicks, colors
 
 
 class CandlestickChart(tk.Frame):
-    def __init__(self, parent, on_hover=None):
-        super().__init__(parent, bg="#151823", padx=16, pady=16)
+    def __init__(self, parent, on_hover=None, scheduler=None, page=None):
+        super().__init__(parent, bg=FIG_BG, padx=16, pady=16)
+
+        top = tk.Frame(self, bg=FIG_BG)
+        top.pack(fill="x")
 
         tk.Label(
-            self,
+            top,
             text="Price Chart",
             fg="white",
-            bg="#151823",
+            bg=FIG_BG,
             font=("Segoe UI", 12, "bold"),
-        ).pack(anchor="w")
+        ).pack(side="left")
+
+        self._interval_btns = {}
+        for interval in reversed(INTERVALS):
+            btn = tk.Button(
+                top,
+                text=interval,
+                command=lambda iv=interval: self.set_interval(iv),
+                fg="white",
+                bd=0,
+                activebackground=AX_BG,
+                activeforeground="white",
+                padx=8,
+                pady=2,
+                font=("Segoe UI", 9, "bold"),
+                cursor="hand2",
+            )
+            btn.pack(side="right", padx=(4, 0))
+            self._interval_btns[interval] = btn
+
+        ind_bar = tk.Frame(self, bg=FIG_BG)
+        ind_bar.pack(fill="x", pady=(6, 0))
+
+        self._ind_btns = {}
+        for name in INDICATORS:
+            btn = tk.Button(
+                ind_bar,
+                text=name,
+                command=lambda n=name: self.toggle_indicator(n),
+                fg="white",
+                bd=0,
+                activebackground=AX_BG,
+                activeforeground="white",
+                padx=8,
+                pady=2,
+                font=("Segoe UI", 9),
+                cursor="hand2",
+            )
+            btn.pack(side="left", padx=(0, 4))
+            self._ind_btns[name] = btn
 
         self._symbol = "BTCUSDT"
         self._interval = "1m"
-        self._df = None
+        self._base = None       # 1m klines every interval is resampled from
+        self._k = None          # kline columns at the chart interval, shape (len(COLUMNS), n)
+        self._limit = 120       # bars on screen by default
+
+        # viewport: width in bars, anchored by the open time of its last bar (None = follow live)
+        self._view_bars = self._limit
+        self._view_end_ms = None
+        self._lod = 1           # bars per drawn candle
+        self._drawn_start = 0
+        self._ind_from = 0      # first bar the indicator values are computed from
+        self._drag = None
+        self._backfilling = False
+        self._history_done = False
+        self._prefetched = False   # deep 1m history requested for this symbol
+        self._hover_dirty = True
+
+        self._base_agg = None
+        self._agg = None
+
+        self._inds = IndicatorSet()
+        self._ind_artists = {}  # name -> {line: artist}
+        self._panes = {}        # name -> sub-pane axes
+        self._trade_sub = None
+        self._trades_dropped = 0    # _trade_sub.dropped already repaired
+        self._gap_sub = None
+
+        # optional FrameScheduler: live redraws are coalesced per frame and paused while hidden
+        self._scheduler = scheduler
+        self._page = page
+        self._pending_full = False
 
         self._on_hover = on_hover
-        self._x_vals = []
-        self._x_mode = "date"   # "date" or "index"
         self._last_i = None
+        self._closes = np.empty(0)
+        self._pcts = np.empty(0)
 
         self.fig = Figure(figsize=(8, 4), dpi=100)
         self.ax = self.fig.add_subplot(111)
-        self.fig.patch.set_facecolor("#151823")
-        self.ax.set_facecolor("#1b1f2e")
+        self.fig.patch.set_facecolor(FIG_BG)
+        self.ax.set_facecolor(AX_BG)
+        self.fig.subplots_adjust(left=0.06, right=0.985, top=0.96, bottom=0.20)
+
+        self.ax.grid(True, color=GRID_COLOR, linewidth=0.6)
+        self.ax.set_axisbelow(True)
+        for spine in self.ax.spines.values():
+            spine.set_color("white")
+        self.ax.tick_params(axis="x", colors="white", labelsize=9)
+        self.ax.tick_params(axis="y", colors="white", labelsize=9)
+        self.ax.yaxis.set_major_formatter(mticker.StrMethodFormatter("{x:,.2f}"))
+        self.ax.xaxis.set_major_locator(mticker.MaxNLocator(nbins=8, integer=True))
+        self.ax.xaxis.set_major_formatter(mticker.FuncFormatter(self._fmt_time))
+
+        # closed candles: built once per data load, vertices patched in place
+        self._bodies = PolyCollection([], linewidths=1.0)
+        self._wicks = LineCollection([], linewidths=1.0)
+        self.ax.add_collection(self._wicks)
+        self.ax.add_collection(self._bodies)
+
+        # live (last) candle: animated, redrawn by blitting only
+        self._live_body = PolyCollection([], linewidths=1.0, animated=True)
+        self._live_wick = LineCollection([], linewidths=1.0, animated=True)
+        self.ax.add_collection(self._live_wick)
+        self.ax.add_collection(self._live_body)
+        self._animated = [self._live_wick, self._live_body]
+
+        # crosshair + tooltip: animated too, so hovering never re-renders the figure
+        self._vline = self.ax.axvline(
+            0, color="#6b7280", linewidth=1, linestyle="--", alpha=0.5, animated=True
+        )
+        self._vline.set_visible(False)
+        self._tip = self.ax.text(
+            0.01, 0.98, "",
+            transform=self.ax.transAxes,
+            va="top", ha="left",
+            color="white", fontsize=9,
+            bbox={"facecolor": FIG_BG, "edgecolor": GRID_COLOR, "pad": 4},
+            animated=True,
+        )
+        self._tip.set_visible(False)
+        self._animated += [self._vline, self._tip]
+
+        self._bg = None
+        self._style_indicator_buttons()
 
         self.canvas = FigureCanvasTkAgg(self.fig, master=self)
         self.canvas.get_tk_widget().pack(fill="both", expand=True, pady=12)
 
-        self._vline = self.ax.axvline(0, color="#6b7280", linewidth=1, linestyle="--", alpha=0.5)
-        self._vline.set_visible(False)
-
+        self.canvas.mpl_connect("draw_event", self._on_draw_event)
         self.canvas.mpl_connect("motion_notify_event", self._on_move)
         self.canvas.mpl_connect("figure_leave_event", self._on_leave)
+        self.canvas.mpl_connect("scroll_event", self._on_scroll)
+        self.canvas.mpl_connect("button_press_event", self._on_press)
+        self.canvas.mpl_connect("button_release_event", self._on_release)
 
-    def set_symbol(self, symbol: str, interval: str = "1m"):
+    def set_symbol(self, symbol: str, interval: str = None):
         self._symbol = symbol.upper()
-        self._interval = interval
+        if interval is not None:
+            self._interval = interval
+        self._style_interval_buttons()
+
+        self._view_bars = self._limit
+        self._view_end_ms = None
+        self._history_done = False
+
+        if self._trade_sub is not None:
+            self._trade_sub.close()
+        self._trade_sub = market_bus.subscribe(
+            "trade", self._symbol, callback=self._on_trades, policy=BATCH, maxlen=5000
+        )
+        self._trades_dropped = 0
+
+        if self._gap_sub is not None:
+            self._gap_sub.close()
+        self._gap_sub = market_bus.subscribe(
+            "trade_gap", self._symbol, callback=self._on_gap, policy=LATEST
+        )
+
         self.refresh()
 
-    def refresh(self):
-        self._df = fetch_klines(self._symbol, interval=self._interval, limit=120)
-        self._draw()
+    def set_interval(self, interval: str):
+        """Switch timeframe by resampling the in-memory 1m series (no network).
 
-    def _draw(self):
-        if self._df is None or self._df.empty:
+        The deep 1m history is prefetched after the first paint of a symbol;
+        until it lands, a long timeframe shows the bars already in memory.
+        """
+        if interval == self._interval:
             return
+        self._interval = interval
+        self._style_interval_buttons()
+
+        if self._base is not None and self._base.shape[1]:
+            self._k = None
+            self._show_base()
+
+    def _style_interval_buttons(self):
+        for interval, btn in self._interval_btns.items():
+            btn.configure(bg=AX_BG if interval == self._interval else FIG_BG)
+
+    def toggle_indicator(self, name: str):
+        ind = None
+        if name in self._ind_artists:
+            self._inds.remove(name)
+            for artist in self._ind_artists.pop(name).values():
+                artist.remove()
+            pane = self._panes.pop(name, None)
+            if pane is not None:
+                pane.remove()
+        else:
+            ind = INDICATORS[name]()
+            self._inds.add(ind)
+            self._add_indicator_artists(ind)
+
+        self._style_indicator_buttons()
+        self._layout_axes()
+
+        if self._k is not None and self._k.shape[1]:
+            if ind is not None:
+                # only the new indicator is initialised, over the same range as the others
+                self._reset_indicators(self._k, [ind])
+            self._draw()
+        else:
+            self.canvas.draw_idle()
 
-        self._last_i = None
+    def _style_indicator_buttons(self):
+        for name, btn in self._ind_btns.items():
+            btn.configure(bg=AX_BG if name in self._ind_artists else FIG_BG)
 
-        self.ax.clear()
-        self.ax.set_facecolor("#1b1f2e")
+    def _add_indicator_artists(self, ind):
+        if ind.overlay:
+            ax = self.ax
+        else:
+            ax = self.fig.add_axes([0, 0, 1, 1], sharex=self.ax)
+            ax.set_facecolor(AX_BG)
+            ax.grid(True, color=GRID_COLOR, linewidth=0.6)
+            ax.set_axisbelow(True)
+            for spine in ax.spines.values():
+                spine.set_color("white")
+            ax.tick_params(axis="both", colors="white", labelsize=8)
+            ax.text(0.005, 0.95, ind.name, transform=ax.transAxes, va="top", ha="left", color="#9aa4c7", fontsize=8)
+            if isinstance(ind, RSI):
+                ax.set_ylim(0, 100)
+                ax.set_yticks([30, 70])
+                for level in (30, 70):
+                    ax.axhline(level, color=GRID_COLOR, linewidth=0.8, linestyle="--")
+            self._panes[ind.name] = ax
+
+        artists = {}
+        for line in ind.lines:
+            color = LINE_COLORS.get(line, "white")
+            if line == "hist":
+                artist = LineCollection([], linewidths=2.0, colors=color, animated=True)
+                ax.add_collection(artist)
+            else:
+                style = "--" if line in ("upper", "lower") else "-"
+                (artist,) = ax.plot([], [], color=color, linewidth=1.0, linestyle=style, animated=True)
+            artists[line] = artist
+        self._ind_artists[ind.name] = artists
+
+    def _layout_axes(self):
+        left, right, top = 0.06, 0.985, 0.96
+        panes = list(self._panes.values())
+        y = 0.12 if panes else 0.20
+        for ax in reversed(panes):
+            ax.set_position([left, y, right - left, PANE_HEIGHT])
+            y += PANE_HEIGHT + 0.03
+        self.ax.set_position([left, y, right - left, top - y])
+
+        # time labels only under the lowest axes
+        self.ax.tick_params(axis="x", labelbottom=not panes)
+        for i, ax in enumerate(panes):
+            ax.tick_params(axis="x", labelbottom=i == len(panes) - 1)
+
+    def _view_limit(self):
+        # 1m bars behind the default view at the current interval
+        return min(PREFETCH_BARS, base_bars_for(self._interval, self._limit))
 
-        mc = mpf.make_marketcolors(
-            up="#3ddc97",
-            down="#ff5c5c",
-            edge="inherit",
-            wick="inherit",
+    def refresh(self):
+        # the disk cache (up to BASE_MAX_BARS) and the delta are both read off the Tk thread
+        self._k = None
+        self._agg = None
+        self._base = None
+        self._base_agg = None
+        self._prefetched = False
+
+        symbol = self._symbol
+        rest_client.call(
+            load_cached_kline_arrays,
+            symbol,
+            interval=BASE_INTERVAL,
+            limit=BASE_MAX_BARS,
+            on_done=lambda k: self._on_cached(symbol, k),
+            on_error=lambda e: print("Kline cache error:", symbol, e),
         )
-        style = mpf.make_mpf_style(
-            base_mpf_style="nightclouds",
-            marketcolors=mc,
-            facecolor="#1b1f2e",
-            figcolor="#151823",
-            gridcolor="#2a2f45",
-            rc={
-                "axes.labelcolor": "white",
-                "xtick.color": "white",
-                "ytick.color": "white",
-                "axes.edgecolor": "white",
-            },
+        self._fetch()
+
+    def _on_cached(self, symbol, k):
+        if symbol != self._symbol or not k.shape[1]:
+            return
+        # bars a fetch or live trades already put in memory are newer: they win
+        self._base = k if self._base is None else merge_klines(k, self._base)[:, -BASE_MAX_BARS:]
+        self._seed_base_agg()
+        self._show_base()
+
+    def _on_gap(self, symbol, gap):
+        # trades were lost while the socket was down: refetch the affected bars
+        self._fetch()
+
+    def _fetch(self, limit=None):
+        symbol = self._symbol
+        rest_client.call(
+            fetch_kline_arrays,
+            symbol,
+            interval=BASE_INTERVAL,
+            limit=limit or self._view_limit(),
+            on_done=lambda k: self._on_klines(symbol, k),
+            on_error=lambda e: print("Kline fetch error:", symbol, e),
         )
 
-        mpf.plot(
-            self._df,
-            type="candle",
-            ax=self.ax,
-            style=style,
-            show_nontrading=False,
-            datetime_format="%H:%M",
-            xrotation=0,
-            update_width_config={
-                "candle_width": 0.7,
-                "candle_linewidth": 1.0,
-            },
+    def _on_klines(self, symbol, k):
+        if symbol != self._symbol or not k.shape[1]:
+            return
+
+        # keep older in-memory bars a shorter fetch did not cover
+        self._base = merge_klines(self._base, k)[:, -BASE_MAX_BARS:]
+        self._seed_base_agg()
+        self._show_base()
+
+        if not self._prefetched:
+            # the view is up: fetch enough 1m history in the background that
+            # every timeframe switch is a resample of what is in memory
+            self._prefetched = True
+            if self._base.shape[1] < PREFETCH_BARS:
+                self._fetch(PREFETCH_BARS)
+
+    def _maybe_backfill(self, start):
+        # page in older 1m history lazily once the view gets close to the oldest bar
+        base = self._base
+        if self._backfilling or self._history_done or base is None or not base.shape[1]:
+            return
+        if start > self._view_bars or base.shape[1] >= BASE_MAX_BARS:
+            return
+
+        self._backfilling = True
+        symbol = self._symbol
+        rest_client.call(
+            backfill_kline_arrays,
+            symbol,
+            BASE_INTERVAL,
+            int(base[COL["open_time"], 0]) - 1,
+            limit=BACKFILL_BARS,
+            on_done=lambda older: self._on_backfill(symbol, older),
+            on_error=lambda e: self._on_backfill_error(symbol, e),
         )
 
-        # format axes
-        self.ax.yaxis.set_major_formatter(mticker.StrMethodFormatter("{x:,.2f}"))
-        self.ax.xaxis.set_major_locator(mdates.AutoDateLocator(minticks=5, maxticks=9))
-        self.ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M"))
+    def _on_backfill(self, symbol, older):
+        self._backfilling = False
+        if symbol != self._symbol:
+            return
+        if not older.shape[1]:
+            self._history_done = True
+            return
+        # bars already in memory win; the view stays put since it is anchored by time
+        self._base = merge_klines(older, self._base)[:, -BASE_MAX_BARS:]
+        self._show_base()
+
+    def _on_backfill_error(self, symbol, e):
+        self._backfilling = False
+        print("Kline backfill error:", symbol, e)
+
+    def _seed_base_agg(self):
+        self._base_agg = KlineAggregator(BASE_INTERVAL)
+        base = self._base
+        if base is not None and base.shape[1]:
+            self._base_agg.seed(*(base[COL[name], -1] for name in ("open_time", "open", "high", "low", "close", "volume")))
+
+    def _show_base(self):
+        # the whole history is kept at the chart interval; only the viewport is drawn
+        k = resample_klines(self._base, self._interval)
+        self._reset_indicators(k)
+        self._set_klines(k)
+
+    def _reset_indicators(self, k, items=None):
+        # from a warm-up before the viewport on, not over the whole scroll-back history
+        if items is None:
+            v0, v1 = self._viewport(k)
+            self._ind_from = max(0, v0 - IND_WARMUP_BARS - (v1 - v0))
+        self._inds.reset(k[:, self._ind_from:], k.shape[1], items)
+
+    def _set_klines(self, k):
+        old = self._k
+        self._k = k
+
+        self._agg = KlineAggregator(self._interval)
+        if k.shape[1]:
+            t, o, h, l, c, v = (k[COL[name], -1] for name in ("open_time", "open", "high", "low", "close", "volume"))
+            self._agg.seed(t, o, h, l, c, v)
+
+        # same series as on screen (typical after a cache paint): patch changed bars only
+        t = COL["open_time"]
+        if (
+            old is not None
+            and self._lod == 1
+            and old.shape == k.shape
+            and k.shape[1] > 1
+            and old[t, 0] == k[t, 0]
+            and old[t, -1] == k[t, -1]
+        ):
+            changed = np.nonzero(np.any(old[:, :-1] != k[:, :-1], axis=0))[0]
+            self._closes = k[COL["close"]]
+            for i in changed:
+                self._patch_bar(int(i))
+                self._update_pct(int(i))
+            self._update_live(full=bool(len(changed)))
+            return
 
-        for spine in self.ax.spines.values():
-            spine.set_color("white")
-        self.ax.tick_params(axis="x", colors="white", labelsize=9)
-        self.ax.tick_params(axis="y", colors="white", labelsize=9)
+        self._draw()
 
-        self.fig.subplots_adjust(left=0.06, right=0.985, top=0.96, bottom=0.20)
+    # ---- rendering ----
+
+    def _ohlc(self, sl=slice(None)):
+        k = self._k
+        return k[COL["open"], sl], k[COL["high"], sl], k[COL["low"], sl], k[COL["close"], sl]
 
-        # detect x-axis mode used by mplfinance (some versions use index scale)
-        x0, x1 = self.ax.get_xlim()
-        if x1 < (len(self._df) * 5):
-            self._x_mode = "index"
-            self._x_vals = list(range(len(self._df)))
+    def _viewport(self, k=None):
+        """[v0, v1) bar indices on screen; v1 == n while following the live bar."""
+        k = self._k if k is None else k
+        n = k.shape[1]
+        width = max(1, min(self._view_bars, n))
+        if self._view_end_ms is None:
+            end = n
         else:
-            self._x_mode = "date"
-            self._x_vals = list(mdates.date2num(self._df.index.to_pydatetime()))
+            end = int(np.searchsorted(k[COL["open_time"]], self._view_end_ms, side="right"))
+            end = max(width, min(end, n))
+        return end - width, end
+
+    def _closed_geometry(self, v0, v1, step):
+        # closed candles in [v0, v1), `step` bars per drawn candle (min/max decimation)
+        if v1 <= v0:
+            return np.empty((0, 4, 2)), np.empty((0, 2, 2)), np.empty((0, 4))
+        o, h, l, c = self._ohlc(slice(v0, v1))
+        if step == 1:
+            return candle_geometry(o, h, l, c, x0=v0)
+        starts = np.arange(0, v1 - v0, step)
+        ends = np.minimum(starts + step, v1 - v0) - 1
+        return candle_geometry(
+            o[starts], np.maximum.reduceat(h, starts), np.minimum.reduceat(l, starts), c[ends],
+            x0=v0, step=step,
+        )
 
-        self._vline = self.ax.axvline(0, color="#6b7280", linewidth=1, linestyle="--", alpha=0.5)
-        self._vline.set_visible(False)
+    def _draw(self):
+        if self._k is None or not self._k.shape[1]:
+            return
+        if self._hover_dirty:
+            self._compute_hover_arrays()
+
+        self._last_i = None
+        n = self._k.shape[1]
+        v0, v1 = self._viewport()
+        if self._inds.items and self._ind_from and v0 < self._ind_from + IND_WARMUP_BARS:
+            # scrolled back past the warmed-up indicator range
+            self._reset_indicators(self._k)
+
+        # one drawn candle per ~2 px: cost follows the axes width, not the zoom level
+        closed_end = min(v1, n - 1)
+        px = max(self.ax.bbox.width / 2.0, 1.0)
+        self._lod = max(1, int(np.ceil((closed_end - v0) / px)))
+        self._drawn_start = v0
+
+        bodies, wicks, colors = self._closed_geometry(v0, closed_end, self._lod)
+        self._bodies.set_verts(bodies)
+        self._bodies.set_facecolor(colors)
+        self._bodies.set_edgecolor(colors)
+        self._wicks.set_segments(wicks)
+        self._wicks.set_color(colors)
+
+        self._set_live_geometry()
+
+        self.ax.set_xlim(v0 - 1, v1)
+        self._set_indicator_data()
+        self._autoscale_y()
+        self._autoscale_panes()
 
+        self._vline.set_visible(False)
+        self._tip.set_visible(False)
         self.canvas.draw_idle()
 
+    def _compute_hover_arrays(self):
+        closes = self._k[COL["close"]]
+        pcts = np.zeros_like(closes)
+        prev = closes[:-1]
+        np.divide(closes[1:] - prev, prev, out=pcts[1:], where=prev != 0)
+        self._closes = closes
+        self._pcts = pcts * 100.0
+        self._hover_dirty = False
+
+    def _update_pct(self, i):
+        # keep the precomputed change for bar i (and its follower) in sync after a patch
+        closes = self._closes
+        for j in (i, i + 1):
+            if 0 < j < len(closes):
+                prev = closes[j - 1]
+                self._pcts[j] = (closes[j] - prev) / prev * 100.0 if prev != 0 else 0.0
+
+    def _patch_bar(self, i):
+        # in-place vertex update for one closed candle on screen
+        paths = self._bodies.get_paths()
+        j = i - self._drawn_start
+        if self._lod != 1 or not 0 <= j < len(paths) or i >= self._k.shape[1] - 1:
+            return
+        bodies, wicks, colors = candle_geometry(*self._ohlc(slice(i, i + 1)), x0=i)
+
+        path = paths[j]
+        path.vertices[:4] = bodies[0]
+        path.vertices[4:] = bodies[0][0]
+        self._wicks.get_paths()[j].vertices[:] = wicks[0]
+
+        fc = self._bodies.get_facecolor()
+        if len(fc) == len(paths):
+            fc[j] = colors[0]
+            self._bodies.set_facecolor(fc)
+            self._bodies.set_edgecolor(fc)
+            self._wicks.set_color(fc)
+
+    def _set_live_geometry(self):
+        n = self._k.shape[1]
+        bodies, wicks, colors = candle_geometry(*self._ohlc(slice(n - 1, n)), x0=n - 1)
+        self._live_body.set_verts(bodies)
+        self._live_body.set_facecolor(colors)
+        self._live_body.set_edgecolor(colors)
+        self._live_wick.set_segments(wicks)
+        self._live_wick.set_color(colors)
+
+    def _set_indicator_data(self):
+        # viewport only; with a coarse level of detail lines keep each group's min and max
+        n = self._k.shape[1]
+        v0, v1 = self._viewport()
+        step = self._lod
+        x = np.arange(v0, v1, dtype=np.float64)
+        starts = np.arange(0, v1 - v0, step)
+        for name, artists in self._ind_artists.items():
+            vals = self._inds.values.get(name, {})
+            for line, artist in artists.items():
+                y = vals.get(line)
+                if y is None or len(y) != n:
+                    continue
+                y = y[v0:v1]
+                if line == "hist":
+                    xs, ys = x[starts], y[starts]
+                    seg = np.zeros((len(xs), 2, 2))
+                    seg[:, :, 0] = xs[:, None]
+                    seg[:, 1, 1] = np.nan_to_num(ys)
+                    artist.set_segments(seg)
+                elif step > 1 and len(y):
+                    lo = np.fmin.reduceat(y, starts)
+                    hi = np.fmax.reduceat(y, starts)
+                    xs = np.repeat(x[starts] + (step - 1) / 2, 2)
+                    artist.set_data(xs, np.column_stack([lo, hi]).ravel())
+                else:
+                    artist.set_data(x, y)
+
+    def _overlay_range(self, sl=slice(None)):
+        lo, hi = np.inf, -np.inf
+        for ind in self._inds.items:
+            if not ind.overlay:
+                continue
+            for y in self._inds.values.get(ind.name, {}).values():
+                y = y[sl]
+                if len(y) and not np.all(np.isnan(y)):
+                    lo = min(lo, float(np.nanmin(y)))
+                    hi = max(hi, float(np.nanmax(y)))
+        return lo, hi
+
+    def _scaled_panes(self):
+        # RSI keeps its fixed 0..100 range
+        return [(ind.name, self._panes[ind.name]) for ind in self._inds.items
+                if not ind.overlay and not isinstance(ind, RSI)]
+
+    def _autoscale_panes(self):
+        v0, v1 = self._viewport()
+        for name, ax in self._scaled_panes():
+            ys = [y[v0:v1] for y in self._inds.values.get(name, {}).values()]
+            ys = [y for y in ys if len(y) and not np.all(np.isnan(y))]
+            if not ys:
+                continue
+            lo = min(float(np.nanmin(y)) for y in ys)
+            hi = max(float(np.nanmax(y)) for y in ys)
+            pad = (hi - lo) * 0.1 or abs(hi) * 0.1 or 1.0
+            ax.set_ylim(lo - pad, hi + pad)
+
+    def _panes_overflow(self):
+        for name, ax in self._scaled_panes():
+            y0, y1 = ax.get_ylim()
+            for y in self._inds.values.get(name, {}).values():
+                if len(y) and not np.isnan(y[-1]) and not (y0 <= y[-1] <= y1):
+                    return True
+        return False
+
+    def _autoscale_y(self):
+        view = slice(*self._viewport())
+        _, h, l, _ = self._ohlc(view)
+        o_lo, o_hi = self._overlay_range(view)
+        lo = min(float(np.min(l)), o_lo)
+        hi = max(float(np.max(h)), o_hi)
+        pad = (hi - lo) * 0.05 or hi * 0.001 or 1.0
+        self.ax.set_ylim(lo - pad, hi + pad)
+
+    def _update_live(self, full=False):
+        self._set_live_geometry()
+        self._update_pct(len(self._closes) - 1)
+        if self._viewport()[1] < self._k.shape[1]:
+            # scrolled back in history: the live bar is off screen
+            if full:
+                self.canvas.draw_idle()
+            return
+        self._set_indicator_data()
+
+        _, h, l, _ = self._ohlc(slice(-1, None))
+        o_lo, o_hi = self._overlay_range(slice(-1, None))
+        y0, y1 = self.ax.get_ylim()
+        if full or max(h[0], o_hi) > y1 or min(l[0], o_lo) < y0 or self._panes_overflow():
+            self._autoscale_y()
+            self._autoscale_panes()
+            self.canvas.draw_idle()
+        else:
+            self._blit()
+
+    def _on_draw_event(self, event):
+        # whole figure, so sub-panes blit together with the price axes
+        self._bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for artists in self._ind_artists.values():
+            for artist in artists.values():
+                artist.axes.draw_artist(artist)
+        for artist in self._animated:
+            if artist.get_visible():
+                self.ax.draw_artist(artist)
+
+    def _blit(self):
+        if self._bg is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._bg)
+        self._draw_animated()
+        self.canvas.blit(self.fig.bbox)
+
+    def _fmt_time(self, x, pos=None):
+        if self._k is None:
+            return ""
+        i = int(round(x))
+        if i < 0 or i >= self._k.shape[1]:
+            return ""
+        ts = self._k[COL["open_time"], i] / 1000.0
+        fmt = "%m-%d" if interval_to_ms(self._interval) >= 86_400_000 else "%H:%M"
+        return time.strftime(fmt, time.gmtime(ts))
+
+    # ---- live updates ----
+
+    def _on_trades(self, items):
+        # batch of (symbol, (ts, price, qty, side)) since the last bus dispatch
+        if self._k is None or self._agg is None:
+            return
+
+        sub = self._trade_sub
+        if sub is not None and sub.dropped != self._trades_dropped:
+            # the queue overflowed during a stall: the oldest trades of this
+            # batch are gone, so the open bar's high / low / volume need klines
+            self._trades_dropped = sub.dropped
+            self._fetch()
+
+        changed = False
+        opened = False
+        for _, (ts, price, qty, _side) in items:
+            self._update_base(ts, price, qty)
+
+            result = self._agg.add_trade(ts, price, qty)
+            if result is None:
+                continue
+
+            if result == BAR_OPENED:
+                if self._k.shape[1]:
+                    # the previous bar is final now: fold it into the indicator state
+                    self._inds.commit(self._k[:, -1])
+                col = np.zeros((len(COLUMNS), 1))
+                self._k = np.concatenate([self._k, col], axis=1)[:, -BASE_MAX_BARS:]
+                self._inds.append(self._k.shape[1])
+                self._hover_dirty = True
+                opened = True
+
+            open_ms, o, h, l, c, v = self._agg.bar
+            k = self._k
+            k[COL["open_time"], -1] = open_ms
+            k[COL["open"], -1] = o
+            k[COL["high"], -1] = h
+            k[COL["low"], -1] = l
+            k[COL["close"], -1] = c
+            k[COL["volume"], -1] = v
+            changed = True
+
+        if changed:
+            # O(1) per indicator: only the open bar is re-evaluated
+            self._inds.update_last(self._k[:, -1])
+
+        if opened:
+            # the live candle just closed: rebuild the static collections once
+            self._request_render(full=True)
+        elif changed:
+            self._request_render(full=False)
+
+    def _update_base(self, ts, price, qty):
+        # the 1m series keeps following trades so a timeframe switch is current
+        result = self._base_agg.add_trade(ts, price, qty)
+        if result is None:
+            return
+        if result == BAR_OPENED:
+            col = np.zeros((len(COLUMNS), 1))
+            self._base = np.concatenate([self._base, col], axis=1)[:, -BASE_MAX_BARS:]
+
+        open_ms, o, h, l, c, v = self._base_agg.bar
+        base = self._base
+        base[COL["open_time"], -1] = open_ms
+        base[COL["open"], -1] = o
+        base[COL["high"], -1] = h
+        base[COL["low"], -1] = l
+        base[COL["close"], -1] = c
+        base[COL["volume"], -1] = v
+
+    def _request_render(self, full):
+        if self._scheduler is None:
+            if full:
+                self._draw()
+            else:
+                self._update_live()
+            return
+        self._pending_full = self._pending_full or full
+        self._scheduler.mark_dirty((id(self), "chart"), self._flush_render, page=self._page)
+
+    def _flush_render(self):
+        full = self._pending_full
+        self._pending_full = False
+        if self._k is None:
+            return
+        if full:
+            self._draw()
+        else:
+            self._update_live()
+
+    # ---- zoom / pan ----
+
+    def _set_viewport(self, start, width):
+        n = self._k.shape[1]
+        width = int(round(min(max(width, MIN_VIEW_BARS), n))) or 1
+        start = int(round(min(max(start, 0), n - width)))
+        end = start + width
+
+        self._view_bars = width
+        self._view_end_ms = None if end >= n else float(self._k[COL["open_time"], end - 1])
+        self._request_render(full=True)
+        self._maybe_backfill(start)
+
+    def _on_scroll(self, event):
+        # wheel zooms around the bar under the cursor
+        if self._k is None or event.inaxes is None or event.xdata is None:
+            return
+        v0, v1 = self._viewport()
+        width = v1 - v0
+        new_width = width / ZOOM_STEP if event.button == "up" else width * ZOOM_STEP
+        frac = (event.xdata - v0) / max(width, 1)
+        self._set_viewport(event.xdata - frac * new_width, new_width)
+
+    def _on_press(self, event):
+        if self._k is None or event.button != 1 or event.inaxes is None:
+            return
+        v0, v1 = self._viewport()
+        self._drag = (event.x, v0, v1 - v0)
+
+    def _on_release(self, event):
+        self._drag = None
+
+    def _pan_to(self, event):
+        x0, v0, width = self._drag
+        bars = (event.x - x0) / max(self.ax.bbox.width, 1.0) * width
+        self._set_viewport(v0 - bars, width)
+
+    # ---- hover ----
+
     def _nearest_index(self, xdata: float):
-        if self._df is None:
+        if self._k is None:
             return None
-        n = len(self._df)
+        n = self._k.shape[1]
         if n == 0:
             return None
 
-        if self._x_mode == "index":
-            i = int(round(xdata))
-            if i < 0:
-                i = 0
-            if i >= n:
-                i = n - 1
-            return i
-
-        xs = self._x_vals
-        if not xs:
-            return None
-        j = bisect_left(xs, xdata)
-        if j <= 0:
-            return 0
-        if j >= n:
-            return n - 1
-        left = xs[j - 1]
-        right = xs[j]
-        return j - 1 if abs(xdata - left) <= abs(xdata - right) else j
+        v0, v1 = self._viewport()
+        return min(max(int(round(xdata)), v0), v1 - 1)
 
     def _on_move(self, event):
-        if self._df is None or event.inaxes != self.ax or event.xdata is None:
+        if self._drag is not None:
+            self._pan_to(event)
+            return
+        if self._k is None or event.inaxes != self.ax or event.xdata is None:
             return
 
         i = self._nearest_index(event.xdata)
-        if i is None or i == self._last_i:
+        if i is None or i == self._last_i or i >= len(self._closes):
             return
 
         self._last_i = i
-        row = self._df.iloc[i]
-        close = float(row["close"])
-
-        if i > 0:
-            prev_close = float(self._df.iloc[i - 1]["close"])
-            pct = ((close - prev_close) / prev_close) * 100.0 if prev_close != 0 else 0.0
-        else:
-            pct = 0.0
+        close = float(self._closes[i])
+        pct = float(self._pcts[i])
 
-        # show crosshair without redrawing whole chart
-        xpos = self._x_vals[i] if self._x_vals else event.xdata
-        self._vline.set_xdata([xpos, xpos])
+        o, h, l, _ = self._ohlc(i)
+        self._vline.set_xdata([i, i])
         self._vline.set_visible(True)
-        self.canvas.draw_idle()
+        self._tip.set_text(
+            f"{self._fmt_time(i)}  O {o:,.2f}  H {h:,.2f}  L {l:,.2f}  C {close:,.2f}  ({pct:+.2f}%)"
+        )
+        self._tip.set_visible(True)
+        self._blit()
 
         # send to parent (GraphPage/Header)
         if callable(self._on_hover):
             self._on_hover(close, pct)
 
+    def on_close(self):
+        for sub in (self._trade_sub, self._gap_sub):
+            if sub is not None:
+                sub.close()
+        self._trade_sub = None
+        self._gap_sub = None
+
     def _on_leave(self, event):
-        if self._vline is not None:
-            self._vline.set_visible(False)
+        self._vline.set_visible(False)
+        self._tip.set_visible(False)
         self._last_i = None
-        self.canvas.draw_idle()
+        self._blit()
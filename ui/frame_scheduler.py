@@ -0,0 +1,118 @@
+import time
+
+
+def config_if_changed(widget, **opts):
+    """widget.config(**opts), skipped when the options are unchanged."""
+    last = getattr(widget, "_last_config", None)
+    if last is None:
+        last = {}
+        widget._last_config = last
+
+    changed = {k: v for k, v in opts.items() if last.get(k) != v}
+    if not changed:
+        return False
+    widget.config(**changed)
+    last.update(changed)
+    return True
+
+
+class _Task:
+    def __init__(self, interval_ms, fn, page):
+        self.interval_s = interval_ms / 1000.0
+        self.fn = fn
+        self.page = page
+        self.next_at = 0.0
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class FrameScheduler:
+    """One after() loop driving every periodic job and deferred redraw.
+
+    - every(ms, fn, page) runs fn at most every ms, only while `page` is shown
+    - mark_dirty(key, fn, page) coalesces redraws: fn runs once on the next
+      frame no matter how often the key was marked, and waits while `page`
+      is hidden
+    page=None means "always run".
+    """
+
+    def __init__(self, root, frame_ms: int = 50):
+        self.root = root
+        self.frame_ms = frame_ms
+        self.active_page = None
+
+        self._tasks = []
+        self._dirty = {}
+        self._after_id = None
+        self._running = False
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._after_id = self.root.after(self.frame_ms, self._tick)
+
+    def stop(self):
+        self._running = False
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def set_active_page(self, name):
+        self.active_page = name
+
+    def every(self, interval_ms, fn, page=None):
+        task = _Task(interval_ms, fn, page)
+        self._tasks.append(task)
+        return task
+
+    def mark_dirty(self, key, fn, page=None):
+        self._dirty[key] = (fn, page)
+
+    def run_dirty(self):
+        """Run the coalesced redraws of visible pages (once per frame)."""
+        if not self._dirty:
+            return
+        pending = self._dirty
+        self._dirty = {}
+        for key, (fn, page) in pending.items():
+            if not self._visible(page):
+                # keep it for when the page is shown again
+                self._dirty.setdefault(key, (fn, page))
+                continue
+            try:
+                fn()
+            except Exception as e:
+                print("Scheduler render error:", key, e)
+
+    def _visible(self, page):
+        return page is None or page == self.active_page
+
+    def _tick(self):
+        self._after_id = None
+        if not self._running:
+            return
+
+        now = time.monotonic()
+
+        for task in list(self._tasks):
+            if task.cancelled:
+                self._tasks.remove(task)
+                continue
+            if now < task.next_at or not self._visible(task.page):
+                continue
+            task.next_at = now + task.interval_s
+            try:
+                task.fn()
+            except Exception as e:
+                print("Scheduler task error:", e)
+
+        self.run_dirty()
+
+        if self._running:
+            self._after_id = self.root.after(self.frame_ms, self._tick)
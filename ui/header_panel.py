@@ -1,5 +1,7 @@
 import tkinter as tk
 
+from ui.frame_scheduler import config_if_changed
+
 
 class HeaderPanel(tk.Frame):
     def __init__(self, parent, on_back):
@@ -38,7 +40,7 @@ class HeaderPanel(tk.Frame):
         self.price_lbl.pack(side="right")
 
     def set_pair(self, base, quote):
-        self.title_lbl.config(text=f"{base} / {quote}")
+        config_if_changed(self.title_lbl, text=f"{base} / {quote}")
 
     def set_price(self, text, color="white"):
-        self.price_lbl.config(text=text, fg=color)
+        config_if_changed(self.price_lbl, text=text, fg=color)
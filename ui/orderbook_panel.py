@@ -1,5 +1,7 @@
 import tkinter as tk
 
+from ui.frame_scheduler import config_if_changed
+
 
 class OrderBookPanel(tk.Frame):
     def __init__(self, parent, rows=10):
@@ -38,6 +40,17 @@ class OrderBookPanel(tk.Frame):
             self.ask_labels.append(a)
             self.bid_labels.append(b)
 
+    def _fmt_level(self, p, q):
+        if isinstance(p, str):
+            return f"{p} | {q}"
+        if p >= 1000:
+            price = f"{p:,.2f}"
+        elif p >= 1:
+            price = f"{p:,.4f}"
+        else:
+            price = f"{p:.6f}"
+        return f"{price} | {q:.4f}"
+
     def render(self, bids, asks):
         asks_view = asks[: self.rows]
         bids_view = bids[: self.rows]
@@ -45,12 +58,12 @@ class OrderBookPanel(tk.Frame):
         for i in range(self.rows):
             if i < len(asks_view):
                 p, q = asks_view[i]
-                self.ask_labels[i].config(text=f"{p} | {q}")
+                config_if_changed(self.ask_labels[i], text=self._fmt_level(p, q))
             else:
-                self.ask_labels[i].config(text="")
+                config_if_changed(self.ask_labels[i], text="")
 
             if i < len(bids_view):
                 p, q = bids_view[i]
-                self.bid_labels[i].config(text=f"{p} | {q}")
+                config_if_changed(self.bid_labels[i], text=self._fmt_level(p, q))
             else:
-                self.bid_labels[i].config(text="")
+                config_if_changed(self.bid_labels[i], text="")
@@ -1,5 +1,7 @@
 import tkinter as tk
 
+from ui.frame_scheduler import config_if_changed
+
 
 class StatBox(tk.Frame):
     def __init__(self, parent, title, value="-"):
@@ -23,7 +25,7 @@ class StatBox(tk.Frame):
         self.value_lbl.pack(anchor="w")
 
     def set_value(self, value):
-        self.value_lbl.config(text=value)
+        config_if_changed(self.value_lbl, text=value)
 
 
 class StatsPanel(tk.Frame):
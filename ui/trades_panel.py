@@ -0,0 +1,81 @@
+import time
+
+import tkinter as tk
+
+from ui.frame_scheduler import config_if_changed
+
+BUY_FG = "#3ddc97"
+SELL_FG = "#ff5c5c"
+MUTED_FG = "#9aa4c7"
+
+
+class RecentTradesPanel(tk.Frame):
+    """Newest trades first, drawn into a fixed pool of label rows.
+
+    render() takes a TickWindow (the last `rows` trades of the symbol's
+    TickRing) and rewrites only the labels whose text or color changed, so a
+    burst of thousands of trades costs one pass over `rows` labels.
+    """
+
+    def __init__(self, parent, rows=12):
+        super().__init__(parent, bg="#151823", padx=16, pady=16)
+        self.rows = rows
+
+        tk.Label(
+            self,
+            text="Recent Trades",
+            fg="white",
+            bg="#151823",
+            font=("Segoe UI", 12, "bold"),
+        ).pack(anchor="w", pady=(0, 10))
+
+        table = tk.Frame(self, bg="#151823")
+        table.pack(fill="both", expand=True)
+        table.columnconfigure(1, weight=1)
+
+        for col, title in enumerate(("TIME", "PRICE", "QTY")):
+            tk.Label(
+                table, text=title, fg=MUTED_FG, bg="#151823",
+                font=("Segoe UI", 10, "bold"),
+            ).grid(row=0, column=col, sticky="e" if col else "w", padx=8, pady=(0, 6))
+
+        self.time_labels = []
+        self.price_labels = []
+        self.qty_labels = []
+
+        for i in range(self.rows):
+            t = tk.Label(table, text="", fg=MUTED_FG, bg="#151823", font=("Segoe UI", 10))
+            p = tk.Label(table, text="", fg="white", bg="#151823", font=("Segoe UI", 10))
+            q = tk.Label(table, text="", fg="white", bg="#151823", font=("Segoe UI", 10))
+            t.grid(row=i + 1, column=0, sticky="w", padx=8, pady=1)
+            p.grid(row=i + 1, column=1, sticky="e", padx=8, pady=1)
+            q.grid(row=i + 1, column=2, sticky="e", padx=8, pady=1)
+            self.time_labels.append(t)
+            self.price_labels.append(p)
+            self.qty_labels.append(q)
+
+    def _fmt_price(self, p):
+        if p >= 1000:
+            return f"{p:,.2f}"
+        if p >= 1:
+            return f"{p:,.4f}"
+        return f"{p:.6f}"
+
+    def render(self, window):
+        # window: TickWindow, oldest first
+        n = min(len(window.ts), self.rows)
+        ts = window.ts[-n:][::-1].tolist() if n else []
+        price = window.price[-n:][::-1].tolist() if n else []
+        qty = window.qty[-n:][::-1].tolist() if n else []
+        side = window.side[-n:][::-1].tolist() if n else []
+
+        for i in range(self.rows):
+            if i < n:
+                fg = BUY_FG if side[i] > 0 else SELL_FG
+                config_if_changed(self.time_labels[i], text=time.strftime("%H:%M:%S", time.localtime(ts[i] / 1000.0)))
+                config_if_changed(self.price_labels[i], text=self._fmt_price(price[i]), fg=fg)
+                config_if_changed(self.qty_labels[i], text=f"{qty[i]:.4f}")
+            else:
+                config_if_changed(self.time_labels[i], text="")
+                config_if_changed(self.price_labels[i], text="")
+                config_if_changed(self.qty_labels[i], text="")
@@ -1,21 +1,58 @@
 import tkinter as tk
 from ui.stats_panel import StatBox
 
+WINDOWS = ("1m", "5m", "1h", "24h")
+
 
 class VolumePanel(tk.Frame):
-    def __init__(self, parent):
+    def __init__(self, parent, window="24h", on_window=None):
         super().__init__(parent, bg="#151823", padx=16, pady=16)
+        self.window = window
+        self._on_window = on_window
+
+        bar = tk.Frame(self, bg="#151823")
+        bar.pack(fill="x", pady=(0, 4))
+        tk.Label(bar, text="Taker Volume", fg="#9aa4c7", bg="#151823", font=("Segoe UI", 9, "bold")).pack(side="left")
+
+        self._window_btns = {}
+        for name in reversed(WINDOWS):
+            btn = tk.Button(
+                bar,
+                text=name,
+                command=lambda w=name: self.set_window(w),
+                fg="white",
+                bd=0,
+                activebackground="#1b1f2e",
+                activeforeground="white",
+                padx=6,
+                pady=1,
+                font=("Segoe UI", 9, "bold"),
+                cursor="hand2",
+            )
+            btn.pack(side="right", padx=(4, 0))
+            self._window_btns[name] = btn
+        self._style_window_buttons()
 
-        self.buy_24h = StatBox(self, "Buy Volume (24H)", "-")
-        self.buy_24h.pack(fill="x", pady=6)
+        self.buy = StatBox(self, "Buy Volume", "-")
+        self.buy.pack(fill="x", pady=6)
 
-        self.sell_24h = StatBox(self, "Sell Volume (24H)", "-")
-        self.sell_24h.pack(fill="x", pady=6)
+        self.sell = StatBox(self, "Sell Volume", "-")
+        self.sell.pack(fill="x", pady=6)
 
-        self.ratio = StatBox(self, "Buy / Sell Ratio (24H)", "-")
+        self.ratio = StatBox(self, "Buy / Sell Ratio", "-")
         self.ratio.pack(fill="x", pady=6)
 
+    def set_window(self, window: str):
+        self.window = window
+        self._style_window_buttons()
+        if callable(self._on_window):
+            self._on_window(window)
+
+    def _style_window_buttons(self):
+        for name, btn in self._window_btns.items():
+            btn.configure(bg="#1b1f2e" if name == self.window else "#151823")
+
     def set_values(self, buy_text: str, sell_text: str, ratio_text: str):
-        self.buy_24h.set_value(buy_text)
-        self.sell_24h.set_value(sell_text)
+        self.buy.set_value(buy_text)
+        self.sell.set_value(sell_text)
         self.ratio.set_value(ratio_text)
@@ -0,0 +1,278 @@
+import tkinter as tk
+
+BG = "#151823"
+ROW_BG = "#1b1f2e"
+HEADER_FG = "#9aa4c7"
+MUTED_FG = "#9aa4c7"
+BTN_BG = "#0f111a"
+
+ROW_H = 76
+ROW_GAP = 10
+HEADER_H = 44
+
+# (title, weight, minsize, anchor)
+COLUMNS = (
+    ("Cryptocurrency", 4, 360, "w"),
+    ("Updated", 2, 160, "w"),
+    ("Change", 2, 160, "w"),
+    ("Price", 2, 200, "e"),
+    ("", 1, 120, "e"),
+)
+
+
+def column_spans(width):
+    """[(x0, x1)] per column: minsizes first, leftover split by weight (like grid)."""
+    extra = max(0, width - sum(c[2] for c in COLUMNS))
+    total_w = sum(c[1] for c in COLUMNS)
+    spans = []
+    x = 0.0
+    for _, weight, minsize, _ in COLUMNS:
+        w = minsize + extra * weight / total_w
+        spans.append((x, x + w))
+        x += w
+    return spans
+
+
+class _RowSlot:
+    def __init__(self, tag):
+        self.tag = tag
+        self.index = -1
+        self.symbol = None
+        self.y = 0
+        self.shown = False
+        self.items = {}
+        self.cache = {}
+
+
+class WatchlistTable(tk.Frame):
+    """Scrollable watchlist drawn on one Canvas with a recycled row pool.
+
+    Only enough row slots to fill the viewport exist; scrolling moves them
+    and re-binds them to other symbols. set_price / set_change / set_updated
+    only store the value; the visible rows are repainted once per frame
+    through the scheduler.
+    """
+
+    def __init__(self, parent, scheduler, page=None, on_select=None, icons=None):
+        super().__init__(parent, bg=BG)
+        self.scheduler = scheduler
+        self.page = page
+        self.on_select = on_select
+        self.icons = icons or {}
+
+        self.symbols = []
+        self.values = {}
+        self._dirty = set()
+        self._slots = []
+        self._offset = 0
+        self._width = 0
+        self._height = 0
+
+        self.header = tk.Canvas(self, bg=BG, height=HEADER_H, highlightthickness=0, bd=0)
+        self.header.pack(side="top", fill="x")
+
+        body = tk.Frame(self, bg=BG)
+        body.pack(side="top", fill="both", expand=True)
+
+        self.scrollbar = tk.Scrollbar(body, orient="vertical", command=self._yview)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.canvas = tk.Canvas(body, bg=BG, highlightthickness=0, bd=0)
+        self.canvas.pack(side="left", fill="both", expand=True)
+
+        self.canvas.bind("<Configure>", self._on_configure)
+        self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Button-4>", lambda e: self.scroll_by(-ROW_H))
+        self.canvas.bind("<Button-5>", lambda e: self.scroll_by(ROW_H))
+        self.canvas.tag_bind("btn", "<Button-1>", self._on_click)
+
+    # ---- model ----
+
+    def set_symbols(self, symbols):
+        self.symbols = [s.upper() for s in symbols]
+        for sym in self.symbols:
+            self.values.setdefault(sym, {
+                "price": ("Loading...", "white"),
+                "updated": ("—", MUTED_FG),
+                "change": ("—", MUTED_FG),
+            })
+        for slot in self._slots:
+            slot.index = -1
+        self._scroll_to(self._offset)
+
+    def set_price(self, symbol, text, fg="white"):
+        self._set(symbol, "price", text, fg)
+
+    def set_change(self, symbol, text, fg):
+        self._set(symbol, "change", text, fg)
+
+    def set_updated(self, symbol, text, fg=MUTED_FG):
+        self._set(symbol, "updated", text, fg)
+
+    def _set(self, symbol, field, text, fg):
+        vals = self.values.get(symbol)
+        if vals is None or vals[field] == (text, fg):
+            return
+        vals[field] = (text, fg)
+        self._dirty.add(symbol)
+        self.scheduler.mark_dirty(("watchlist", id(self)), self._flush, page=self.page)
+
+    def visible_symbols(self):
+        return [s.symbol for s in self._slots if s.symbol is not None]
+
+    # ---- rendering ----
+
+    def _flush(self):
+        dirty = self._dirty
+        self._dirty = set()
+        for slot in self._slots:
+            if slot.symbol in dirty:
+                self._paint(slot)
+
+    def _config_item(self, slot, name, **opts):
+        if slot.cache.get(name) == opts:
+            return
+        slot.cache[name] = opts
+        self.canvas.itemconfigure(slot.items[name], **opts)
+
+    def _paint(self, slot):
+        sym = slot.symbol
+        vals = self.values[sym]
+        self._config_item(slot, "symbol", text=sym)
+        self._config_item(slot, "icon", image=self.icons.get(sym) or "")
+        for field in ("updated", "change", "price"):
+            text, fg = vals[field]
+            self._config_item(slot, field, text=text, fill=fg)
+
+    def _new_slot(self):
+        c = self.canvas
+        slot = _RowSlot(f"slot{len(self._slots)}")
+        tags = (slot.tag,)
+        btn_tags = (slot.tag, "btn")
+        slot.items = {
+            "bg": c.create_rectangle(0, 0, 0, 0, fill=ROW_BG, outline="", tags=tags),
+            "icon": c.create_image(0, 0, anchor="w", tags=tags),
+            "symbol": c.create_text(0, 0, anchor="w", fill="white", font=("Segoe UI", 12, "bold"), tags=tags),
+            "updated": c.create_text(0, 0, anchor="w", fill=MUTED_FG, font=("Segoe UI", 11), tags=tags),
+            "change": c.create_text(0, 0, anchor="w", fill=MUTED_FG, font=("Segoe UI", 11, "bold"), tags=tags),
+            "price": c.create_text(0, 0, anchor="e", fill="white", font=("Segoe UI", 12, "bold"), tags=tags),
+            "btn": c.create_rectangle(0, 0, 0, 0, fill=BTN_BG, outline="", tags=btn_tags),
+            "btn_text": c.create_text(0, 0, text="View", fill="white", font=("Segoe UI", 10, "bold"), tags=btn_tags),
+        }
+        c.itemconfigure(slot.tag, state="hidden")
+        self._slots.append(slot)
+        self._place(slot)
+        return slot
+
+    def _place(self, slot):
+        """Absolute coordinates for a slot at slot.y (only needed on resize)."""
+        c = self.canvas
+        it = slot.items
+        spans = column_spans(self._width)
+        top = slot.y + ROW_GAP / 2
+        bottom = slot.y + ROW_H - ROW_GAP / 2
+        mid = slot.y + ROW_H / 2
+
+        c.coords(it["bg"], 6, top, max(6, self._width - 6), bottom)
+        c.coords(it["icon"], spans[0][0] + 16, mid)
+        c.coords(it["symbol"], spans[0][0] + 70, mid)
+        c.coords(it["updated"], spans[1][0] + 16, mid)
+        c.coords(it["change"], spans[2][0] + 16, mid)
+        c.coords(it["price"], spans[3][1] - 16, mid)
+
+        bx1 = spans[4][1] - 16
+        c.coords(it["btn"], bx1 - 70, mid - 16, bx1, mid + 16)
+        c.coords(it["btn_text"], bx1 - 35, mid)
+
+    def _draw_header(self):
+        h = self.header
+        h.delete("all")
+        spans = column_spans(self._width)
+        for (title, _, _, anchor), (x0, x1) in zip(COLUMNS, spans):
+            if not title:
+                continue
+            x = x0 + 16 if anchor == "w" else x1 - 16
+            h.create_text(x, HEADER_H / 2 - 4, text=title, anchor=anchor,
+                          fill=HEADER_FG, font=("Segoe UI", 10, "bold"))
+        h.create_line(6, HEADER_H - 2, max(6, self._width - 6), HEADER_H - 2, fill="#252a3d")
+
+    def _on_configure(self, event):
+        resized = event.width != self._width
+        self._width = event.width
+        self._height = event.height
+
+        needed = self._height // ROW_H + 2
+        while len(self._slots) < needed:
+            self._new_slot()
+
+        if resized:
+            self._draw_header()
+            for slot in self._slots:
+                self._place(slot)
+        self._scroll_to(self._offset)
+
+    # ---- scrolling ----
+
+    def _max_offset(self):
+        return max(0, len(self.symbols) * ROW_H - self._height)
+
+    def scroll_by(self, dy):
+        self._scroll_to(self._offset + dy)
+
+    def _scroll_to(self, offset):
+        self._offset = int(max(0, min(offset, self._max_offset())))
+        self._layout()
+
+        total = len(self.symbols) * ROW_H
+        if total <= 0:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self._offset / total, min(1.0, (self._offset + self._height) / total))
+
+    def _layout(self):
+        first, shift = divmod(self._offset, ROW_H)
+        n = len(self.symbols)
+
+        for k, slot in enumerate(self._slots):
+            i = first + k
+            y = k * ROW_H - shift
+            if y != slot.y:
+                self.canvas.move(slot.tag, 0, y - slot.y)
+                slot.y = y
+
+            if i >= n:
+                slot.index, slot.symbol = -1, None
+                if slot.shown:
+                    slot.shown = False
+                    self.canvas.itemconfigure(slot.tag, state="hidden")
+                continue
+
+            if not slot.shown:
+                slot.shown = True
+                self.canvas.itemconfigure(slot.tag, state="normal")
+            if slot.index != i:
+                slot.index, slot.symbol = i, self.symbols[i]
+                self._paint(slot)
+
+    def _yview(self, *args):
+        if not args:
+            return
+        if args[0] == "moveto":
+            self._scroll_to(float(args[1]) * len(self.symbols) * ROW_H)
+        elif args[0] == "scroll":
+            step = self._height if args[2] == "pages" else ROW_H
+            self.scroll_by(int(args[1]) * step)
+
+    def _on_wheel(self, event):
+        if event.delta:
+            self.scroll_by(ROW_H if event.delta < 0 else -ROW_H)
+
+    def _on_click(self, event):
+        current = self.canvas.find_withtag("current")
+        if not current or self.on_select is None:
+            return
+        for slot in self._slots:
+            if current[0] in (slot.items["btn"], slot.items["btn_text"]):
+                if slot.symbol is not None:
+                    self.on_select(slot.symbol)
+                return